@@ -1,6 +1,11 @@
 import streamlit as st
 import numpy as np
 import matplotlib.pyplot as plt
+from matplotlib.collections import EllipseCollection
+try:
+    import plotly.graph_objects as go # Opcional: visor 3D interactivo de la malla del diagrama
+except ImportError:
+    go = None
 import pandas as pd
 from datetime import datetime
 import os
@@ -18,6 +23,7 @@ try:
     from calculosh.diseno_escaleras import diseno_tramo_escalera_losa_inclinada
     from calculosh.reportes import generar_memoria_excel
     from calculosh.diseno_columna_cortante import diseno_columna_cortante_dmo
+    from calculosh.verificacion_columna import contornos_P
     from unidades import *# Importar utilidades de unidades si es necesario
 
     # Importar constantes si las tienes definidas separadamente
@@ -386,6 +392,8 @@ elif modulo == "Diseño de Vigas":
                 res_sf = diseno_viga_flexion_simple(b_cm_sf, h_cm_sf, rec_libre_cm_sf, diam_est_sf, diam_bar_sf, fc_vigas, fy_vigas_long, Mu_sf_kNm)
                 if res_sf['status'] != "Error":
                     st.success(f"As requerida: {res_sf['As_req_cm2']:.2f} cm² (ρ={res_sf['rho_calculado']:.4f})")
+                    if res_sf['phi_Mn_kNm'] is not None:
+                        st.info(f"Sección real con As requerida: φMn = {res_sf['phi_Mn_kNm']:.1f} kN·m (φ = {res_sf['phi']:.3f}, εt = {res_sf['epsilon_t']:.4f})")
                 else:
                     st.error(res_sf['mensaje'])
         
@@ -589,8 +597,9 @@ elif modulo == "Diseño de Columnas":
 
         st.markdown("---")
         st.markdown("##### Parámetros de Cálculo (Diagrama)")
-        n_c_steps = st.slider("Pasos eje neutro 'c'", 20, 60, 30, 5, key="nc_col_diag")
-        n_theta_steps = st.slider("Pasos ángulo 'θ'", 24, 72, 36, 6, key="nt_col_diag")
+        n_c_steps = st.slider("Pasos eje neutro 'c'", 20, 200, 30, 5, key="nc_col_diag")
+        n_theta_steps = st.slider("Pasos ángulo 'θ'", 24, 180, 36, 6, key="nt_col_diag")
+        muestreo_adaptativo_c = st.checkbox("Muestreo adaptativo de 'c' y 'θ'", value=False, key="adapt_col_diag", help="Refina la malla hasta una tolerancia de error (los pasos anteriores no se usan).")
 
     # Botón para generar diagrama
     if st.button("📊 Generar Diagrama de Interacción", key="btn_col_diag"):
@@ -607,11 +616,17 @@ elif modulo == "Diseño de Columnas":
                         diam_estribo_mm=diam_estribo_mm_c, diam_barra_long_mm=diam_barra_long_mm_c,
                         nx_barras=nx_barras_c, ny_barras=ny_barras_c,
                         fc_MPa=fc_col, fy_MPa=fy_col,
-                        num_puntos_c=n_c_steps, num_puntos_theta=n_theta_steps
+                        num_puntos_c=n_c_steps, num_puntos_theta=n_theta_steps,
+                        muestreo="adaptativo" if muestreo_adaptativo_c else "uniforme",
+                        incluir_malla=True
                     )
                 
                 st.session_state["resultados_columna_diag"] = resultados_diag # Guardar resultados completos
                 if resultados_diag.get("status") == "OK":
+                    # El CSV se arma una sola vez, no en cada rerun
+                    st.session_state["csv_diagrama_columna"] = pd.DataFrame({
+                        'phi*Pn (kN)': n_to_kn(resultados_diag["P_N"]), 'phi*Mnx (kNm)': nmm_to_knm(resultados_diag["Mx_Nmm"]),
+                        'phi*Mny (kNm)': nmm_to_knm(resultados_diag["My_Nmm"])}).to_csv(index=False, sep=";", decimal=",")
                     st.success(f"Diagrama para columna '{id_columna_reporte}' generado. {resultados_diag.get('mensaje', '')}")
                     # --- Guardar datos de flexo-compresión para el reporte ---
                     params_col_usados_diag = resultados_diag.get("params", {})
@@ -643,11 +658,13 @@ elif modulo == "Diseño de Columnas":
                     st.session_state.lista_columnas_flex_reporte.append(datos_col_flex_reporte)
                     st.info(f"Datos de flexo-compresión de columna '{id_columna_reporte}' añadidos al reporte.")
                 else:
+                    st.session_state.pop("csv_diagrama_columna", None) # No servir el CSV de la columna anterior
                     st.error(f"Error al generar diagrama para '{id_columna_reporte}': {resultados_diag.get('mensaje', 'Error desconocido')}")
 
             except Exception as e:
                 st.error(f"Error inesperado durante el cálculo: {e}")
                 if 'resultados_columna_diag' in st.session_state: del st.session_state['resultados_columna_diag']
+                st.session_state.pop("csv_diagrama_columna", None)
 
     # --- Mostrar Resultados y Gráficos si existen ---
     if st.session_state.get("resultados_columna_diag") and st.session_state["resultados_columna_diag"].get("status") == "OK":
@@ -677,11 +694,43 @@ elif modulo == "Diseño de Columnas":
                         Mx_kNm_diag = nmm_to_knm(resultados_diag["Mx_Nmm"])
                         My_kNm_diag = nmm_to_knm(resultados_diag["My_Nmm"])
                         
-                        vista_diag = st.radio("Tipo de Vista del Diagrama", ["3D", "2D (Mx-P, My-P)", "2D (Mx-My)"], horizontal=True, key="vista_diag_col_main")
+                        vista_diag = st.radio("Tipo de Vista del Diagrama", ["3D", "3D Malla (interactiva)", "2D (Mx-P, My-P)", "2D (Mx-My)"], horizontal=True, key="vista_diag_col_main")
 
                         fig_col_diag = plt.figure(figsize=(9, 7))
 
-                        if vista_diag == "3D":
+                        if vista_diag == "3D Malla (interactiva)" and "malla_niveles" in resultados_diag:
+                            niveles_malla = resultados_diag["malla_niveles"]
+                            nivel_lod = st.select_slider("Nivel de detalle", options=list(range(len(niveles_malla))), value=min(1, len(niveles_malla) - 1),
+                                                         format_func=lambda k: f"{k} ({len(niveles_malla[k]['triangulos'])} triángulos)", key="lod_col_diag")
+                            texto_demandas = st.text_area("Demandas a superponer (Pu kN, Mux kN·m, Muy kN·m por línea)", value="", key="demandas_malla_col")
+                            P_m, Mx_m, My_m = niveles_malla[nivel_lod]["puntos"].T
+                            triangulos_m = niveles_malla[nivel_lod]["triangulos"]
+                            demandas_malla = np.empty((0, 3))
+                            if texto_demandas.strip():
+                                try:
+                                    demandas_malla = np.array([[float(v) for v in linea.replace(";", ",").split(",")]
+                                                               for linea in texto_demandas.strip().splitlines() if linea.strip()]).reshape(-1, 3)
+                                except ValueError:
+                                    st.warning("Formato de demandas inválido. Use 'Pu, Mux, Muy' por línea.")
+                            if go is not None:
+                                fig_malla = go.Figure(go.Mesh3d(x=Mx_m, y=My_m, z=P_m, i=triangulos_m[:, 0], j=triangulos_m[:, 1], k=triangulos_m[:, 2],
+                                                                intensity=P_m, colorscale="Viridis", opacity=0.6, colorbar_title="φ·P (kN)"))
+                                if len(demandas_malla):
+                                    fig_malla.add_trace(go.Scatter3d(x=demandas_malla[:, 1], y=demandas_malla[:, 2], z=demandas_malla[:, 0], mode="markers",
+                                                                     marker=dict(size=4, color="red"), name="Demandas"))
+                                fig_malla.update_layout(scene=dict(xaxis_title="φ·Mx (kN·m)", yaxis_title="φ·My (kN·m)", zaxis_title="φ·P (kN)"),
+                                                        height=650, margin=dict(l=0, r=0, t=30, b=0))
+                                st.plotly_chart(fig_malla, use_container_width=True)
+                            else:
+                                st.info("Instale plotly para el visor interactivo; se muestra la malla con matplotlib.")
+                                ax_m = fig_col_diag.add_subplot(111, projection='3d')
+                                sc = ax_m.plot_trisurf(Mx_m, My_m, P_m, triangles=triangulos_m, cmap='viridis', linewidth=0.1, alpha=0.6)
+                                if len(demandas_malla):
+                                    ax_m.scatter(demandas_malla[:, 1], demandas_malla[:, 2], demandas_malla[:, 0], color='red', s=15)
+                                fig_col_diag.colorbar(sc, ax=ax_m, label='φ·P (kN)', shrink=0.6)
+                                ax_m.set_xlabel('φ·Mx (kN·m)'); ax_m.set_ylabel('φ·My (kN·m)'); ax_m.set_zlabel('φ·P (kN)')
+
+                        elif vista_diag == "3D" or vista_diag == "3D Malla (interactiva)":
                             ax_3d = fig_col_diag.add_subplot(111, projection='3d')
                             sc = ax_3d.scatter(Mx_kNm_diag, My_kNm_diag, P_kN_diag, s=5, c=P_kN_diag, cmap='viridis', alpha=0.7)
                             fig_col_diag.colorbar(sc, ax=ax_3d, label='φ·P (kN)', shrink=0.6)
@@ -708,14 +757,21 @@ elif modulo == "Diseño de Columnas":
                             ax_2d = fig_col_diag.add_subplot(111)
                             sc_2d = ax_2d.scatter(Mx_kNm_diag, My_kNm_diag, s=5, c=P_kN_diag, cmap='viridis', alpha=0.6)
                             fig_col_diag.colorbar(sc_2d, ax=ax_2d, label='φ·P (kN)')
+                            P_contorno_kN = st.number_input("Contorno en φ·Pn (kN)", min_value=0.0, value=0.0, step=50.0, key="P_contorno_col_diag")
+                            contorno = contornos_P(resultados_diag, [P_contorno_kN])
+                            if contorno.get("status") == "OK":
+                                ax_2d.plot(np.append(contorno["Mx_kNm"][0], contorno["Mx_kNm"][0, 0]), np.append(contorno["My_kNm"][0], contorno["My_kNm"][0, 0]),
+                                           color='red', lw=1.5, label=f"φ·Pn = {P_contorno_kN:.0f} kN")
+                                ax_2d.legend()
                             ax_2d.set_xlabel('φ·Mx (kN·m)'); ax_2d.set_ylabel('φ·My (kN·m)'); ax_2d.set_title('Vista Mx-My (Contorno)')
                             ax_2d.grid(True); ax_2d.axhline(0, color='grey', lw=0.5); ax_2d.axvline(0, color='grey', lw=0.5)
                             ax_2d.set_aspect('equal', adjustable='box')
                         
-                        st.pyplot(fig_col_diag)
+                        if fig_col_diag.axes: # El visor plotly no usa la figura de matplotlib
+                            st.pyplot(fig_col_diag)
+                        plt.close(fig_col_diag)
                         
-                        df_diag = pd.DataFrame({'phi*Pn (kN)': P_kN_diag, 'phi*Mnx (kNm)': Mx_kNm_diag, 'phi*Mny (kNm)': My_kNm_diag})
-                        csv_diag = df_diag.to_csv(index=False, sep=";", decimal=",")
+                        csv_diag = st.session_state.get("csv_diagrama_columna", "")
                         st.download_button(label="Descargar Datos del Diagrama (CSV)", data=csv_diag, file_name="diagrama_interaccion_columna.csv", mime="text/csv", key="download_diag_col")
 
                     with tab_cortante:
@@ -835,7 +891,7 @@ elif modulo == "Diseño de Columnas":
                                 params_col_usados['diam_estribo_mm'], params_col_usados['diam_barra_long_mm'], 
                                 params_col_usados['nx_barras'], params_col_usados['ny_barras']
                             )
-                            As_total_calc_mm2_secc = sum(b['area'] for b in barras_para_seccion)
+                            As_total_calc_mm2_secc = barras_para_seccion['area'].sum()
                             rho_g_secc = As_total_calc_mm2_secc / (cm_to_mm(params_col_usados['b_cm']) * cm_to_mm(params_col_usados['h_cm']))
 
                             param_df_data_col = {
@@ -868,10 +924,12 @@ elif modulo == "Diseño de Columnas":
                                                             h_plot_col - 2*rec_plot_col, 
                                                             fill=False, color='dimgray', linewidth=1.0, linestyle='-'))
 
-                            for barra in barras_para_seccion:
-                                x_plot_b = barra['x']/10.0 + b_plot_col/2.0
-                                y_plot_b = barra['y']/10.0 + h_plot_col/2.0
-                                ax_sec_col.add_patch(plt.Circle((x_plot_b, y_plot_b), radius=d_bar_plot_col/2.0, color='black'))
+                            # Círculos de diámetro real en una sola colección (sin un parche por barra)
+                            ax_sec_col.add_collection(EllipseCollection(
+                                d_bar_plot_col, d_bar_plot_col, 0.0, units='xy', color='black',
+                                offsets=np.column_stack([barras_para_seccion['x']/10.0 + b_plot_col/2.0,
+                                                         barras_para_seccion['y']/10.0 + h_plot_col/2.0]),
+                                offset_transform=ax_sec_col.transData))
 
                             ax_sec_col.set_xlim(-b_plot_col*0.1, b_plot_col*1.1) # Ajustar límites para mejor visualización
                             ax_sec_col.set_ylim(-h_plot_col*0.1, h_plot_col*1.1)
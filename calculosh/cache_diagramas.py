@@ -0,0 +1,94 @@
+# ==============================================================================
+# CACHÉ DE DIAGRAMAS DE INTERACCIÓN (MEMORIA LRU + DISCO .npz)
+# ==============================================================================
+import hashlib
+import json
+import os
+import tempfile
+from collections import OrderedDict
+
+import numpy as np
+
+# Cambiar VERSION_MOTOR cuando cambie el cálculo: invalida las entradas guardadas en disco
+VERSION_MOTOR = 3
+MAX_ENTRADAS_MEMORIA = 64
+DIRECTORIO_CACHE = os.environ.get(
+    "HORMIGON_CACHE_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "analisys_hormigon", "diagramas"))
+
+_memoria = OrderedDict()
+
+def firma_seccion(**parametros):
+    """
+    Firma (hash SHA-256) de los parámetros que definen un diagrama: geometría, refuerzo,
+    materiales y resolución. Los números se normalizan para que 40 y 40.0 den la misma firma.
+    """
+    normalizados = {k: (float(v) if isinstance(v, (int, float, np.number)) and not isinstance(v, bool) else v)
+                    for k, v in parametros.items()}
+    normalizados["_version"] = VERSION_MOTOR
+    texto = json.dumps(normalizados, sort_keys=True, default=str)
+    return hashlib.sha256(texto.encode("utf-8")).hexdigest()
+
+def _ruta_disco(firma):
+    return os.path.join(DIRECTORIO_CACHE, f"{firma}.npz")
+
+def _copia(resultado):
+    """Copia superficial: los arreglos se comparten en solo lectura, los diccionarios se copian."""
+    return {k: (dict(v) if isinstance(v, dict) else v) for k, v in resultado.items()}
+
+def _guardar_en_memoria(firma, resultado):
+    for v in resultado.values():
+        if isinstance(v, np.ndarray):
+            v.setflags(write=False)
+    _memoria[firma] = resultado
+    _memoria.move_to_end(firma)
+    while len(_memoria) > MAX_ENTRADAS_MEMORIA:
+        _memoria.popitem(last=False) # Descartar la entrada usada hace más tiempo
+
+def obtener_diagrama(firma):
+    """Busca el diagrama en memoria y luego en disco. Retorna None si no existe."""
+    if firma in _memoria:
+        _memoria.move_to_end(firma)
+        return _copia(_memoria[firma])
+
+    ruta = _ruta_disco(firma)
+    if not os.path.exists(ruta):
+        return None
+    try:
+        with np.load(ruta, allow_pickle=False) as datos:
+            resultado = json.loads(str(datos["_meta"]))
+            for clave in datos.files:
+                if clave != "_meta":
+                    resultado[clave] = datos[clave]
+    except (OSError, ValueError, KeyError):
+        return None # Archivo dañado o incompleto: se recalcula
+    _guardar_en_memoria(firma, resultado)
+    return _copia(resultado)
+
+def guardar_diagrama(firma, resultado):
+    """
+    Guarda el diagrama en memoria y en disco. Los errores de disco no interrumpen el cálculo.
+    Retorna una copia como la de obtener_diagrama: la entrada guardada no se expone a quien llama.
+    """
+    _guardar_en_memoria(firma, resultado)
+
+    arreglos = {k: v for k, v in resultado.items() if isinstance(v, np.ndarray)}
+    meta = {k: v for k, v in resultado.items() if not isinstance(v, np.ndarray)}
+    try:
+        os.makedirs(DIRECTORIO_CACHE, exist_ok=True)
+        # Escritura atómica: archivo temporal + reemplazo
+        fd, ruta_tmp = tempfile.mkstemp(dir=DIRECTORIO_CACHE, suffix=".npz")
+        with os.fdopen(fd, "wb") as f:
+            np.savez(f, _meta=np.array(json.dumps(meta, default=float)), **arreglos)
+        os.replace(ruta_tmp, _ruta_disco(firma))
+    except OSError as e:
+        print(f"Advertencia: no se pudo guardar el diagrama en la caché de disco ({e}).")
+    return _copia(resultado)
+
+def limpiar_cache(disco=False):
+    """Vacía la caché en memoria y, opcionalmente, los archivos .npz del disco."""
+    _memoria.clear()
+    if disco and os.path.isdir(DIRECTORIO_CACHE):
+        for nombre in os.listdir(DIRECTORIO_CACHE):
+            if nombre.endswith(".npz"):
+                os.remove(os.path.join(DIRECTORIO_CACHE, nombre))
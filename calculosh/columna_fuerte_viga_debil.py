@@ -0,0 +1,87 @@
+# ==============================================================================
+# COLUMNA FUERTE - VIGA DÉBIL EN TODOS LOS NUDOS (NSR-10 C.21.6.2.2)
+# ==============================================================================
+import numpy as np
+from unidades import *
+
+FACTOR_COLUMNA_FUERTE = 1.2 # ΣMnc >= 1.2·ΣMnb (NSR-10 C.21.6.2.2, Ec. C.21-1)
+
+def momento_nominal_columna(diagrama_uniaxial, Pu_kN):
+    """
+    Mn (kN·m, sin φ) de la columna para cada carga axial Pu_kN, interpolado sobre la curva
+    nominal de calcular_diagrama_uniaxial_columna (corte del diagrama en el eje de flexión).
+    Pu_kN puede ser un arreglo de cualquier forma; si es 2D (nudos x combinaciones) se usa
+    después el mínimo por fila, que es el que exige la norma (carga axial que da el menor Mn).
+    """
+    puntos = diagrama_uniaxial["puntos_clave"]
+    Pn_kN = n_to_kn(np.concatenate([[puntos["traccion_pura"]["Pn_N"]], diagrama_uniaxial["Pn_N"], [puntos["compresion_pura"]["Pn_N"]]]))
+    Mn_kNm = nmm_to_knm(np.concatenate([[0.0], diagrama_uniaxial["Mn_Nmm"], [0.0]]))
+    orden = np.argsort(Pn_kN, kind="stable")
+    Pu_kN = np.asarray(Pu_kN, dtype=float)
+    return np.interp(Pu_kN, Pn_kN[orden], Mn_kNm[orden], left=0.0, right=0.0)
+
+def _indices_nudos(ids_nudos, nudos_elemento):
+    """Posición de cada nudo de 'nudos_elemento' en 'ids_nudos' (búsqueda binaria sobre ids ordenados)."""
+    orden = np.argsort(ids_nudos, kind="stable")
+    ids_ordenados = ids_nudos[orden]
+    pos = np.searchsorted(ids_ordenados, nudos_elemento)
+    pos_valida = np.minimum(pos, len(ids_ordenados) - 1)
+    encontrado = ids_ordenados[pos_valida] == nudos_elemento
+    if not np.all(encontrado):
+        raise ValueError(f"Nudos no definidos en la tabla de nudos: {np.unique(np.asarray(nudos_elemento)[~encontrado]).tolist()}")
+    return orden[pos_valida]
+
+def verificar_columna_fuerte_viga_debil(
+    ids_nudos, nudo_vigas, Mnb_kNm, nudo_columnas, Mnc_kNm,
+    factor=FACTOR_COLUMNA_FUERTE, num_criticos=10):
+    """
+    Verifica ΣMnc >= factor·ΣMnb en todos los nudos de una dirección a la vez.
+    - ids_nudos: identificadores únicos de los nudos.
+    - nudo_vigas, Mnb_kNm: una fila por extremo de viga que llega a un nudo, con el Mn de esa
+      cara en el sentido que se suma (p. ej. Mn negativo de un lado y positivo del otro;
+      ver Mn_neg_ext_kNm, Mn_pos_kNm y Mn_neg_int_kNm de diseno_viga_dmo).
+    - nudo_columnas, Mnc_kNm: una fila por extremo de columna que llega a un nudo; Mnc_kNm
+      puede ser 2D (filas x combinaciones) y se toma el mínimo por fila (ver momento_nominal_columna).
+    Retorna relación ΣMnc/ΣMnb por nudo (inf si no llegan vigas), cumplimiento y los
+    nudos críticos ordenados de menor a mayor relación.
+    """
+    ids_nudos = np.asarray(ids_nudos)
+    if ids_nudos.ndim != 1 or len(np.unique(ids_nudos)) != len(ids_nudos):
+        return {"status": "Error", "mensaje": "ids_nudos debe ser un vector de identificadores únicos."}
+    Mnb_kNm = np.asarray(Mnb_kNm, dtype=float)
+    Mnc_kNm = np.asarray(Mnc_kNm, dtype=float)
+    if Mnc_kNm.ndim == 2:
+        Mnc_kNm = Mnc_kNm.min(axis=1)
+    if np.any(Mnb_kNm < 0) or np.any(Mnc_kNm < 0):
+        return {"status": "Error", "mensaje": "Los momentos nominales deben ser no negativos (magnitudes)."}
+
+    try:
+        idx_vigas = _indices_nudos(ids_nudos, np.asarray(nudo_vigas))
+        idx_columnas = _indices_nudos(ids_nudos, np.asarray(nudo_columnas))
+    except ValueError as e:
+        return {"status": "Error", "mensaje": str(e)}
+
+    suma_Mnb = np.bincount(idx_vigas, weights=Mnb_kNm, minlength=len(ids_nudos))
+    suma_Mnc = np.bincount(idx_columnas, weights=Mnc_kNm, minlength=len(ids_nudos))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        relacion = np.where(suma_Mnb > 0, suma_Mnc / suma_Mnb, np.inf)
+    cumple = relacion >= factor
+
+    orden = np.argsort(relacion, kind="stable")
+    criticos = [{"nudo": ids_nudos[i].item() if hasattr(ids_nudos[i], "item") else ids_nudos[i],
+                 "suma_Mnc_kNm": float(suma_Mnc[i]), "suma_Mnb_kNm": float(suma_Mnb[i]),
+                 "relacion": float(relacion[i]), "cumple": bool(cumple[i])}
+                for i in orden[:num_criticos]]
+    num_incumplen = int(np.count_nonzero(~cumple))
+    return {
+        "status": "OK",
+        "mensaje": f"Todos los nudos cumplen ΣMnc >= {factor}·ΣMnb." if num_incumplen == 0 else
+                   f"{num_incumplen} de {len(ids_nudos)} nudos no cumplen ΣMnc >= {factor}·ΣMnb.",
+        "suma_Mnb_kNm": suma_Mnb,
+        "suma_Mnc_kNm": suma_Mnc,
+        "relacion": relacion,
+        "cumple": cumple,
+        "num_incumplen": num_incumplen,
+        "orden_criticos": orden,
+        "criticos": criticos,
+    }
@@ -0,0 +1,29 @@
+# ==============================================================================
+# CONSTANTES Y FACTORES COMUNES DEL CONCRETO REFORZADO (NSR-10)
+# ==============================================================================
+import numpy as np
+from validate_positive import validate_positive
+
+ES_MPA = 200000.0 # Módulo de elasticidad del acero
+EPSILON_CU = 0.003 # Deformación unitaria máxima del concreto (NSR-10 C.10.2.3)
+
+def beta1(fc_MPa):
+    """Calcula beta1 según NSR-10 C.10.2.7.3"""
+    validate_positive(fc_MPa=fc_MPa)
+    if fc_MPa <= 28.0:
+        return 0.85
+    else:
+        beta = 0.85 - 0.05 * ((fc_MPa - 28.0) / 7.0)
+        return max(beta, 0.65)
+
+def calcular_phi(epsilon_t):
+    """Calcula phi según NSR-10 C.9.3.2 basado en deformación extrema de tracción εt.
+    Acepta un escalar o un arreglo de NumPy (se evalúa elemento a elemento)."""
+    # Límites de deformación para phi (NSR-10 Figura R.9.3.2)
+    epsilon_ty = 0.002  # Límite conservador (fy=420 MPa / Es)
+    epsilon_limit = 0.005 # Límite para phi=0.90
+
+    # Controlado por compresión (0.65) si εt <= εty, controlado por tracción (0.90) si εt >= 0.005
+    # y transición lineal entre (epsilon_ty, 0.65) y (epsilon_limit, 0.90)
+    phi = 0.65 + 0.25 * (np.asarray(epsilon_t, dtype=float) - epsilon_ty) / (epsilon_limit - epsilon_ty)
+    return np.clip(phi, 0.65, 0.90)
@@ -1,94 +1,375 @@
 # ==============================================================================
 # DISEÑO DE COLUMNA RECTANGULAR - FLEXOCOMPRESIÓN BIAXIAL
 # ==============================================================================
+from functools import partial
+
 import numpy as np
 import matplotlib.pyplot as plt
 from validate_positive import validate_positive
 from unidades import *
+from .constantes_concreto import ES_MPA, EPSILON_CU, beta1, calcular_phi
+from .seccion_fibras import seccion_fibras_rectangular, seccion_fibras_poligonal, planos_desde_eje_neutro, evaluar_planos_deformacion
+from .cache_diagramas import firma_seccion, obtener_diagrama, guardar_diagrama
+
+try:
+    from scipy.spatial import ConvexHull
+except ImportError: # scipy es opcional: solo se usa para la envolvente convexa
+    ConvexHull = None
 
 # --- Constantes ---
-ES_MPA = 200000.0
-EPSILON_CU = 0.003
+BARRA_DTYPE = np.dtype([('x', float), ('y', float), ('area', float)]) # Registro de cada barra (mm, mm²)
+FRANJAS_ENVOLVENTE = 64 # Franjas de P del índice de caras de la envolvente convexa
+# Muestreo adaptativo (ver _refinar_malla_adaptativa): meridianos iniciales (múltiplo de 4, para
+# incluir los ejes principales), 'c' por meridiano y niveles máximos de bisección en θ
+NUM_THETA_INICIAL_ADAPTATIVO = 16
+NUM_C_PILOTO_ADAPTATIVO = 14 # Más los 3 'c' clave de cada meridiano
+NUM_C_REPARTIDOS_ADAPTATIVO = 18
+# Con 0.02 el error máximo de DCR queda por debajo del de la malla uniforme 60 x 72 (4248
+# evaluaciones) con 35 'c' por meridiano y 64-80 meridianos en secciones rectangulares
+TOLERANCIA_ADAPTATIVA = 0.02
+NIVELES_ADAPTATIVO_THETA = 4
+MAX_PUNTOS_ADAPTATIVO_THETA = 360
+NIVELES_MALLA = 4 # Niveles de detalle de la malla triangulada (cada uno con la mitad de c y θ)
+MIN_THETA_MALLA = 8 # θ mínimos en el nivel más grueso
+MAX_TRIANGULOS_GRAFICO = 20000 # Límite de triángulos al graficar con matplotlib
+NUM_LADOS_CIRCULO = 48 # Lados del polígono equivalente de las secciones circulares
 
 # --- Funciones Auxiliares ---
-def _beta1(fc_MPa):
-    """Calcula beta1 según NSR-10 C.10.2.7.3"""
-    validate_positive(fc_MPa=fc_MPa)
-    if fc_MPa <= 28.0:
-        return 0.85
-    else:
-        beta = 0.85 - 0.05 * ((fc_MPa - 28.0) / 7.0)
-        return max(beta, 0.65)
-
-def _calcular_phi(epsilon_t):
-    """Calcula phi según NSR-10 C.9.3.2 basado en deformación extrema de tracción εt"""
-    # Límites de deformación para phi (NSR-10 Figura R.9.3.2)
-    epsilon_ty = 0.002  # Límite conservador (fy=420 MPa / Es)
-    epsilon_limit = 0.005 # Límite para phi=0.90
-
-    if epsilon_t <= epsilon_ty:
-        return 0.65  # Controlado por compresión
-    elif epsilon_t < epsilon_limit:
-        # Transición lineal entre (epsilon_ty, 0.65) y (epsilon_limit, 0.90)
-        return 0.65 + 0.25 * (epsilon_t - epsilon_ty) / (epsilon_limit - epsilon_ty)
-    else:
-        return 0.90  # Controlado por tracción
-
 def _generar_posicion_barras(b_mm, h_mm, rec_libre_mm, diam_estribo_mm, diam_barra_mm, nx_barras, ny_barras):
     """
-    Genera coordenadas (xi, yi) y área (Asi) de cada barra.
+    Genera coordenadas (xi, yi) y área (Asi) de cada barra como arreglo estructurado
+    (campos 'x', 'y', 'area', dtype BARRA_DTYPE).
     Asume distribución uniforme en caras.
     nx_barras: Número de barras en la cara paralela al eje Y (lado b).
     ny_barras: Número de barras en la cara paralela al eje X (lado h), *excluyendo esquinas*.
+    Las esquinas pertenecen solo a las caras superior e inferior, así que no hay duplicados.
     Origen: Centroide de la sección.
     """
     if nx_barras < 2 or ny_barras < 0:
         raise ValueError("nx_barras debe ser >= 2, ny_barras >= 0")
-    
-    num_barras_total = 2 * nx_barras + 2 * ny_barras
-    if num_barras_total < 4:
-         raise ValueError("Número total de barras debe ser al menos 4")
-
-    area_una_barra = np.pi * (diam_barra_mm / 2.0)**2
-    barras = []
-
-    # Coordenadas del centroide de las barras respecto al borde
-    centroide_barra_x = rec_libre_mm + diam_estribo_mm + diam_barra_mm / 2.0
-    centroide_barra_y = rec_libre_mm + diam_estribo_mm + diam_barra_mm / 2.0
-
-    # Coordenadas respecto al centroide de la sección
-    coord_x_ext = b_mm / 2.0 - centroide_barra_x
-    coord_y_ext = h_mm / 2.0 - centroide_barra_y
-
-    # Barras en caras superior e inferior (paralelas a eje X)
-    for i in range(nx_barras):
-        x = -coord_x_ext + i * (2 * coord_x_ext) / (nx_barras - 1) if nx_barras > 1 else 0
-        # Barra inferior
-        barras.append({'x': x, 'y': -coord_y_ext, 'area': area_una_barra})
-        # Barra superior
-        barras.append({'x': x, 'y': coord_y_ext, 'area': area_una_barra})
-
-    # Barras en caras laterales (intermedias, excluyendo esquinas ya contadas)
-    if ny_barras > 0:
-         for i in range(ny_barras):
-             # Espaciamiento uniforme entre las barras de esquina
-             y = -coord_y_ext + (i + 1) * (2 * coord_y_ext) / (ny_barras + 1)
-             # Barra izquierda
-             barras.append({'x': -coord_x_ext, 'y': y, 'area': area_una_barra})
-             # Barra derecha
-             barras.append({'x': coord_x_ext, 'y': y, 'area': area_una_barra})
-             
-    # Asegurar que el número total coincida (puede haber duplicados en esquinas si nx=2)
-    # Simplificación: eliminar duplicados basados en coordenadas cercanas
-    coords = np.array([[b['x'], b['y']] for b in barras])
-    _, unique_indices = np.unique(np.round(coords, 1), axis=0, return_index=True)
-    barras_final = [barras[i] for i in sorted(unique_indices)]
-
-    if len(barras_final) != num_barras_total:
-         print(f"Advertencia: Número de barras únicas ({len(barras_final)}) difiere del esperado ({num_barras_total}). Revisar nx/ny.")
-         # Podría ser necesario ajustar lógica si se quiere un número exacto fijo.
-
-    return barras_final
+
+    # Coordenadas del centroide de las barras de esquina respecto al centroide de la sección
+    centroide_barra = rec_libre_mm + diam_estribo_mm + diam_barra_mm / 2.0
+    coord_x_ext = b_mm / 2.0 - centroide_barra
+    coord_y_ext = h_mm / 2.0 - centroide_barra
+    if coord_x_ext <= 0 or coord_y_ext <= 0:
+        raise ValueError("La sección es muy pequeña para el recubrimiento, estribo y diámetro de barra dados.")
+
+    barras = np.empty(2 * nx_barras + 2 * ny_barras, dtype=BARRA_DTYPE)
+    barras['area'] = np.pi * (diam_barra_mm / 2.0)**2
+
+    # Barras en caras inferior y superior (paralelas a eje X), intercaladas: inferior, superior
+    num_caras_xy = 2 * nx_barras
+    barras['x'][:num_caras_xy] = np.repeat(np.linspace(-coord_x_ext, coord_x_ext, nx_barras), 2)
+    barras['y'][:num_caras_xy] = np.tile([-coord_y_ext, coord_y_ext], nx_barras)
+
+    # Barras en caras laterales (intermedias, entre las esquinas), intercaladas: izquierda, derecha
+    y_lateral = np.linspace(-coord_y_ext, coord_y_ext, ny_barras + 2)[1:-1]
+    barras['x'][num_caras_xy:] = np.tile([-coord_x_ext, coord_x_ext], ny_barras)
+    barras['y'][num_caras_xy:] = np.repeat(y_lateral, 2)
+    return barras
+
+def _integrar_segmentos(x1, y1, x2, y2):
+    """
+    Contribución de los segmentos dirigidos (x1, y1) -> (x2, y2) a las integrales de
+    contorno (Green) de un polígono: área, ∫x dA y ∫y dA.
+    """
+    cruz = x1 * y2 - x2 * y1
+    return cruz / 2.0, (x1 + x2) * cruz / 6.0, (y1 + y2) * cruz / 6.0
+
+def _integrar_bloque_compresion(vert_x, vert_y, ux, uy, s_corte):
+    """
+    Recorta el polígono (vértices en sentido antihorario, origen en el centroide) con el
+    semiplano x*ux + y*uy >= s_corte y retorna (área, ∫x dA, ∫y dA) de la parte recortada.
+    ux, uy y s_corte se difunden entre sí (p. ej. forma (c, θ)); los vértices van en el último eje.
+    No requiere polígono convexo: los tramos sobre la línea de corte se integran desde un punto
+    de referencia R sobre la línea, de modo que entradas y salidas no necesitan emparejarse.
+    """
+    ux = np.asarray(ux)[..., None]
+    uy = np.asarray(uy)[..., None]
+    s_corte = np.asarray(s_corte)[..., None]
+    xi, yi = vert_x, vert_y
+    xj, yj = np.roll(vert_x, -1), np.roll(vert_y, -1)
+
+    fi = xi * ux + yi * uy - s_corte
+    fj = xj * ux + yj * uy - s_corte
+    dentro_i = fi >= 0
+    dentro_j = fj >= 0
+    cruza = dentro_i != dentro_j
+
+    # Punto de corte de cada lado con la línea (solo válido donde el lado cruza)
+    t = np.where(cruza, fi / np.where(cruza, fi - fj, 1.0), 0.0)
+    xc = xi + t * (xj - xi)
+    yc = yi + t * (yj - yi)
+
+    # Tramo de cada lado que queda dentro del semiplano
+    x_ini = np.where(dentro_i, xi, xc)
+    y_ini = np.where(dentro_i, yi, yc)
+    x_fin = np.where(dentro_j, xj, xc)
+    y_fin = np.where(dentro_j, yj, yc)
+    tramo = dentro_i | dentro_j
+    A_l, Sx_l, Sy_l = _integrar_segmentos(x_ini, y_ini, x_fin, y_fin)
+
+    # Cierre sobre la línea de corte: de cada salida a la siguiente entrada (R -> entrada menos R -> salida)
+    signo = np.where(dentro_j & ~dentro_i, 1.0, np.where(dentro_i & ~dentro_j, -1.0, 0.0))
+    A_c, Sx_c, Sy_c = _integrar_segmentos(s_corte * ux, s_corte * uy, xc, yc)
+
+    area = np.sum(np.where(tramo, A_l, 0.0) + signo * A_c, axis=-1)
+    Sx = np.sum(np.where(tramo, Sx_l, 0.0) + signo * Sx_c, axis=-1)
+    Sy = np.sum(np.where(tramo, Sy_l, 0.0) + signo * Sy_c, axis=-1)
+    return area, Sx, Sy
+
+def _superficie_interaccion(vert_x, vert_y, x_b, y_b, area_b, fc_MPa, fy_MPa, c_values, theta_values):
+    """
+    Evalúa (Pn, Mnx, Mny, phi) sobre la malla (c, θ) para una sección poligonal con barras
+    en (x_b, y_b). Eje neutro rotado exacto: u = (sen θ, cos θ) apunta hacia la fibra más
+    comprimida, de modo que θ = 0 comprime arriba (flexión alrededor de X) y θ = π/2 comprime
+    el lado +x (flexión alrededor de Y).
+    c_values: vector común a todos los θ o matriz (c, θ) con los 'c' de cada meridiano.
+    Retorna arreglos de forma (c, θ).
+    """
+    beta_1 = beta1(fc_MPa)
+    ux = np.sin(theta_values)[None, :]
+    uy = np.cos(theta_values)[None, :]
+    c_2d = np.asarray(c_values, dtype=float)
+    if c_2d.ndim == 1: # Mismos 'c' en todos los meridianos
+        c_2d = c_2d[:, None]
+    a_mm = beta_1 * c_2d # Profundidad bloque compresión (perpendicular al eje neutro)
+
+    # Fibra más comprimida: máxima proyección de los vértices sobre u
+    s_max = np.max(vert_x[:, None] * ux + vert_y[:, None] * uy, axis=0, keepdims=True) # (1, θ)
+
+    # A) Contribución del Concreto: bloque de Whitney recortado del polígono
+    area_comp, Sx_comp, Sy_comp = _integrar_bloque_compresion(vert_x, vert_y, ux, uy, s_max - a_mm)
+    Cc_N = 0.85 * fc_MPa * area_comp
+    Mnx_Nmm = 0.85 * fc_MPa * Sy_comp # Momento respecto a eje X centroidal
+    Mny_Nmm = 0.85 * fc_MPa * Sx_comp # Momento respecto a eje Y centroidal
+
+    # B) Contribución del Acero: deformación con la distancia real de cada barra al eje neutro
+    c_3d = c_2d[..., None]
+    prof_barra = s_max[..., None] - (x_b * ux[..., None] + y_b * uy[..., None]) # (1, θ, barra)
+    epsilon_s = EPSILON_CU * (c_3d - prof_barra) / c_3d # (c, θ, barra)
+    fs_MPa = np.clip(ES_MPA * epsilon_s, -fy_MPa, fy_MPa) # Limitar tensión/compresión por fluencia
+    # Descontar el concreto desplazado por las barras que quedan dentro del bloque
+    fs_MPa = fs_MPa - np.where(prof_barra <= a_mm[..., None], 0.85 * fc_MPa, 0.0)
+    Fs_N = area_b * fs_MPa
+
+    Pn_N = Cc_N + Fs_N.sum(axis=-1)
+    Mnx_Nmm = Mnx_Nmm + Fs_N @ y_b
+    Mny_Nmm = Mny_Nmm + Fs_N @ x_b
+
+    # C) phi con la deformación de la barra más traccionada (0 si todo está en compresión)
+    epsilon_t = np.maximum(-np.min(epsilon_s, axis=-1), 0.0)
+    phi = calcular_phi(epsilon_t)
+    return Pn_N, Mnx_Nmm, Mny_Nmm, phi
+
+def _superficie_fibras(seccion, fc_MPa, fy_MPa, c_values, theta_values):
+    """Igual que _superficie_interaccion, pero con el núcleo de fibras de seccion_fibras."""
+    res = evaluar_planos_deformacion(seccion, planos_desde_eje_neutro(seccion, c_values, theta_values), fc_MPa, fy_MPa)
+    forma = (len(c_values), len(theta_values))
+    return (res["P_N"].reshape(forma), res["Mx_Nmm"].reshape(forma), res["My_Nmm"].reshape(forma),
+            calcular_phi(res["epsilon_t"].reshape(forma)))
+
+def _c_puntos_clave(vert_x, vert_y, x_b, y_b, fy_MPa, theta_values):
+    """
+    Profundidades 'c' donde la barra más traccionada alcanza εty = 0.002 (inicio de la
+    transición de phi), fy/Es (punto balanceado) y 0.005 (control por tracción), para cada θ.
+    Retorna una matriz (3, θ).
+    """
+    ux = np.sin(theta_values)[None, :]
+    uy = np.cos(theta_values)[None, :]
+    s_max = np.max(vert_x[:, None] * ux + vert_y[:, None] * uy, axis=0)
+    d_t = s_max - np.min(x_b[:, None] * ux + y_b[:, None] * uy, axis=0) # Fibra comprimida a barra más traccionada
+    epsilon_t = np.array([0.002, fy_MPa / ES_MPA, 0.005])
+    return (EPSILON_CU / (EPSILON_CU + epsilon_t))[:, None] * d_t[None, :]
+
+def _repartir_c(c_piloto, piloto, num_nuevos, limite_P):
+    """
+    Reparte num_nuevos profundidades 'c' en cada meridiano de la malla piloto (c, θ) ya
+    evaluada: cada tramo recibe puntos equiespaciados en proporción a
+    longitud + sqrt(longitud · giro) sobre la superficie normalizada (el error de la
+    interpolación lineal crece con el giro de la curva entre nodos). P se recorta en limite_P,
+    así los tramos sobre el tope casi no reciben puntos.
+    piloto: (P, Mx, My) normalizados, forma (3, c, θ).
+    Retorna la matriz (num_nuevos, θ) de 'c' nuevos.
+    """
+    puntos = np.concatenate([np.minimum(piloto[:1], limite_P), piloto[1:3]])
+    cuerda = np.diff(puntos, axis=1)
+    longitud = np.sqrt(np.sum(cuerda**2, axis=0)) # (tramos, θ)
+    tangente = cuerda / np.maximum(longitud, 1e-12)
+    giro = np.pad(np.sqrt(np.sum(np.diff(tangente, axis=1)**2, axis=0)), ((1, 1), (0, 0))) # En los nodos
+    peso = longitud + np.sqrt(longitud * 0.5 * (giro[:-1] + giro[1:])) + 1e-12
+
+    # Mayores restos: cada meridiano recibe exactamente num_nuevos puntos
+    cuota = peso / peso.sum(axis=0) * num_nuevos
+    por_tramo = np.floor(cuota).astype(int)
+    faltan = num_nuevos - por_tramo.sum(axis=0)
+    por_tramo += np.argsort(np.argsort(por_tramo - cuota, axis=0), axis=0) < faltan
+
+    nuevos = np.empty((num_nuevos, c_piloto.shape[1]))
+    for j, n in enumerate(por_tramo.T):
+        tramo = np.repeat(np.arange(len(n)), n)
+        k = np.arange(num_nuevos) + 1 - np.repeat(np.cumsum(n) - n, n) # Posición dentro del tramo (1..n)
+        nuevos[:, j] = c_piloto[tramo, j] + (c_piloto[tramo + 1, j] - c_piloto[tramo, j]) * k / (n[tramo] + 1)
+    return nuevos
+
+def _error_a_P_constante(medio, vecino_a, vecino_b, limite_P):
+    """
+    Error de momento del meridiano 'medio' frente al promedio de sus dos vecinos interpolados en
+    los mismos P (así interpola verificacion_columna entre meridianos). Entradas (P, Mx, My)
+    normalizadas de forma (3, c, k); solo cuentan los P del medio dentro del rango de ambos
+    vecinos y bajo limite_P. Retorna el error máximo de cada uno de los k meridianos.
+    """
+    def momentos_en_P(vecino):
+        orden = np.argsort(vecino[0], axis=0)
+        P = np.take_along_axis(vecino[0], orden, axis=0)
+        M = np.take_along_axis(vecino[1:3], orden[None], axis=1)
+        k = np.clip(np.sum(P[None] <= medio[0][:, None], axis=1) - 1, 0, len(P) - 2) # (c del medio, k)
+        P0, P1 = np.take_along_axis(P, k, axis=0), np.take_along_axis(P, k + 1, axis=0)
+        w = np.clip((medio[0] - P0) / np.where(P1 > P0, P1 - P0, 1.0), 0.0, 1.0)
+        M0, M1 = np.take_along_axis(M, k[None], axis=1), np.take_along_axis(M, k[None] + 1, axis=1)
+        return M0 + w * (M1 - M0)
+
+    error = np.sqrt(np.sum((medio[1:3] - 0.5 * (momentos_en_P(vecino_a) + momentos_en_P(vecino_b)))**2, axis=0))
+    en_rango = ((medio[0] >= np.maximum(vecino_a[0].min(axis=0), vecino_b[0].min(axis=0))) &
+                (medio[0] <= np.minimum(vecino_a[0].max(axis=0), vecino_b[0].max(axis=0))) & (medio[0] <= limite_P))
+    return np.where(en_rango, error, 0.0).max(axis=0)
+
+def _refinar_malla_adaptativa(evaluar, c_base, c_clave_en, theta_values, tolerancia, P_tope_N=np.inf):
+    """
+    Malla adaptativa de la superficie de diseño (φPn, φMnx, φMny), normalizada con el máximo |P|
+    y |M| de la malla inicial, con sus propios 'c' en cada meridiano θ:
+    1) Piloto: c_base (vector común) más los 'c' clave del meridiano (c_clave_en(θ) -> (n, θ)), donde
+       cambian la fluencia y phi.
+    2) NUM_C_REPARTIDOS_ADAPTATIVO 'c' más, repartidos por _repartir_c según la piloto.
+    3) θ por bisección de meridianos completos (cada uno con los pasos 1 y 2) mientras el
+       meridiano medio se aleje del promedio de sus vecinos a P constante más que 'tolerancia'.
+    Todos los meridianos tienen el mismo número de 'c' y cada punto se evalúa una sola vez.
+    evaluar(c_values, theta_values) -> (Pn, Mnx, Mny, phi) con forma (c, θ); c_values (c, θ).
+    Retorna (c (c, θ), theta_values, (Pn, Mnx, Mny, phi) en la malla, num_evaluaciones).
+    """
+    def c_piloto_en(theta):
+        return np.sort(np.concatenate([np.repeat(c_base[:, None], len(theta), axis=1), c_clave_en(theta)]), axis=0)
+
+    c_piloto = c_piloto_en(theta_values)
+    piloto = np.stack(evaluar(c_piloto, theta_values))
+    Pn, Mnx, Mny, phi = piloto
+    escala_P = max(np.abs(phi * Pn).max(), 1.0)
+    escala_M = max(np.abs(phi * Mnx).max(), np.abs(phi * Mny).max(), 1.0)
+    escala = np.array([escala_P, escala_M, escala_M])[:, None, None]
+    limite_P = P_tope_N / escala_P
+
+    def normalizar(salidas): # (φPn, φMnx, φMny) normalizada y las cuatro salidas de evaluar: (7, c, θ)
+        return np.concatenate([salidas[:3] * salidas[3] / escala, salidas])
+
+    def meridianos(theta, c_piloto=None, piloto=None):
+        if c_piloto is None:
+            c_piloto = c_piloto_en(theta)
+            piloto = np.stack(evaluar(c_piloto, theta))
+        piloto = normalizar(piloto)
+        c_nuevos = _repartir_c(c_piloto, piloto, NUM_C_REPARTIDOS_ADAPTATIVO, limite_P)
+        c = np.concatenate([c_piloto, c_nuevos])
+        valores = np.concatenate([piloto, normalizar(np.stack(evaluar(c_nuevos, theta)))], axis=1)
+        orden = np.argsort(c, axis=0, kind="stable")
+        return np.take_along_axis(c, orden, axis=0), np.take_along_axis(valores, orden[None], axis=1)
+
+    c, valores = meridianos(theta_values, c_piloto, piloto)
+
+    # Bisección en θ: el último intervalo se cierra con θ0 + 2π
+    a, b = theta_values, np.append(theta_values[1:], theta_values[0] + 2 * np.pi)
+    v_a, v_b = valores, np.roll(valores, -1, axis=-1)
+    nodos, c_nodos, valores_nodos = [theta_values], [c], [valores]
+    for _ in range(NIVELES_ADAPTATIVO_THETA):
+        if len(a) == 0 or sum(map(len, nodos)) >= MAX_PUNTOS_ADAPTATIVO_THETA:
+            break
+        m = 0.5 * (a + b)
+        c_m, v_m = meridianos(m)
+        nodos.append(m)
+        c_nodos.append(c_m)
+        valores_nodos.append(v_m)
+
+        dividir = _error_a_P_constante(v_m[:3], v_a[:3], v_b[:3], limite_P) > tolerancia
+        # Cada intervalo que no cumple se reemplaza por sus dos mitades
+        a, b = np.concatenate([a[dividir], m[dividir]]), np.concatenate([m[dividir], b[dividir]])
+        v_a = np.concatenate([v_a[..., dividir], v_m[..., dividir]], axis=-1)
+        v_b = np.concatenate([v_m[..., dividir], v_b[..., dividir]], axis=-1)
+
+    orden = np.argsort(np.concatenate(nodos), kind="stable")
+    c = np.concatenate(c_nodos, axis=-1)[:, orden]
+    valores = np.concatenate(valores_nodos, axis=-1)[..., orden]
+    return c, np.concatenate(nodos)[orden], tuple(valores[3:]), c.size
+
+def _envolvente_convexa(diagrama, num_franjas=FRANJAS_ENVOLVENTE):
+    """
+    Envolvente convexa triangulada de la malla completa en (P kN, Mx kN·m, My kN·m).
+    Las ecuaciones de las caras cumplen n·x + d <= 0 en el interior. Se agrega un índice por
+    franjas de P (formato CSR): para cada franja, las caras cuyo rango de P la cruza.
+    """
+    if ConvexHull is None:
+        raise ImportError("La envolvente convexa requiere scipy (pip install scipy).")
+    puntos = np.column_stack([n_to_kn(diagrama["P_malla_N"].ravel()),
+                              nmm_to_knm(diagrama["Mx_malla_Nmm"].ravel()),
+                              nmm_to_knm(diagrama["My_malla_Nmm"].ravel())])
+    envolvente = ConvexHull(puntos)
+
+    P_caras = puntos[envolvente.simplices, 0] # (caras, 3 vértices)
+    cortes_P = np.linspace(P_caras.min(), P_caras.max(), num_franjas + 1)
+    cruza = ((P_caras.min(axis=1)[None, :] <= cortes_P[1:, None]) &
+             (P_caras.max(axis=1)[None, :] >= cortes_P[:-1, None])) # (franjas, caras)
+    franja, cara = np.nonzero(cruza) # Ordenado por franja
+    punteros = np.concatenate([[0], np.cumsum(np.bincount(franja, minlength=num_franjas))])
+    return {
+        "envolvente_puntos": puntos,
+        "envolvente_simplices": envolvente.simplices,
+        "envolvente_ecuaciones": envolvente.equations,
+        "envolvente_cortes_P_kN": cortes_P,
+        "envolvente_caras_franja": cara,
+        "envolvente_punteros_franja": punteros,
+    }
+
+def _triangulos_malla(num_c, num_theta):
+    """
+    Triángulos (índices) de una malla (c, θ) cerrada en θ, con un abanico en cada extremo de c
+    hacia un vértice polar (índices num_c·num_theta y num_c·num_theta + 1).
+    """
+    indices = np.arange(num_c * num_theta).reshape(num_c, num_theta)
+    a, b = indices[:-1], indices[1:]
+    c, d = np.roll(b, -1, axis=1), np.roll(a, -1, axis=1)
+    cuerpo = np.concatenate([np.stack([a, b, c], axis=-1).reshape(-1, 3), np.stack([a, c, d], axis=-1).reshape(-1, 3)])
+    polo_inf, polo_sup = num_c * num_theta, num_c * num_theta + 1
+    fila_inf, fila_sup = indices[0], indices[-1]
+    abanico_inf = np.column_stack([np.full(num_theta, polo_inf), fila_inf, np.roll(fila_inf, -1)])
+    abanico_sup = np.column_stack([np.full(num_theta, polo_sup), np.roll(fila_sup, -1), fila_sup])
+    return np.concatenate([cuerpo, abanico_inf, abanico_sup]).astype(np.int32)
+
+def _malla_triangulada(diagrama, num_niveles=NIVELES_MALLA):
+    """
+    Malla triangulada de la superficie de diseño sobre la malla estructurada (c, θ), con
+    niveles de detalle (LOD): el nivel k toma cada 2^k valores de c y de θ (siempre el último c).
+    La carga axial se recorta en φPn,max (tapa plana de la superficie de diseño).
+    Cada nivel tiene "puntos" (P kN, Mx kN·m, My kN·m en float32, mismo orden que la
+    envolvente convexa) y "triangulos" (índices int32).
+    """
+    P_kN = np.minimum(n_to_kn(diagrama["P_malla_N"]), n_to_kn(diagrama["params"]["phiPn_max_N"]))
+    Mx_kNm = nmm_to_knm(diagrama["Mx_malla_Nmm"])
+    My_kNm = nmm_to_knm(diagrama["My_malla_Nmm"])
+    num_c, num_theta = P_kN.shape
+
+    niveles = []
+    for nivel in range(num_niveles):
+        paso = 2**nivel
+        filas = np.unique(np.append(np.arange(0, num_c, paso), num_c - 1))
+        columnas = np.arange(0, num_theta, paso)
+        if nivel > 0 and (len(columnas) < MIN_THETA_MALLA or len(filas) < 3):
+            break
+        malla = np.stack([P_kN[np.ix_(filas, columnas)], Mx_kNm[np.ix_(filas, columnas)], My_kNm[np.ix_(filas, columnas)]], axis=-1)
+        polos = malla[[0, -1]].mean(axis=1) # Centro de la primera y última fila de c
+        niveles.append({
+            "puntos": np.concatenate([malla.reshape(-1, 3), polos]).astype(np.float32),
+            "triangulos": _triangulos_malla(len(filas), len(columnas)),
+            "num_c": len(filas), "num_theta": len(columnas),
+        })
+    return {"malla_niveles": niveles}
 
 # --- Función Principal de Cálculo ---
 def calcular_diagrama_interaccion_columna(
@@ -96,25 +377,90 @@ def calcular_diagrama_interaccion_columna(
     diam_estribo_mm, diam_barra_long_mm,
     nx_barras, ny_barras, # Número barras cara 'b' y cara 'h' (sin esquinas)
     fc_MPa, fy_MPa,
-    num_puntos_c=30, num_puntos_theta=36):
+    num_puntos_c=30, num_puntos_theta=36, motor="poligono", usar_cache=True,
+    incluir_envolvente=False, muestreo="uniforme", tolerancia_adaptativa=TOLERANCIA_ADAPTATIVA, incluir_malla=False):
+    """
+    Igual que _calcular_diagrama_interaccion_columna, pero con caché por firma de la sección
+    (geometría, refuerzo, materiales, resolución y motor): primero memoria LRU, luego disco (.npz).
+    Las secciones repetidas de un edificio se recuperan sin recalcular.
+    incluir_envolvente: agrega la envolvente convexa triangulada (requiere scipy) para
+    clasificar demandas con verificacion_columna.puntos_dentro_superficie.
+    muestreo: "uniforme" (linspace en c y θ) o "adaptativo" (ver _calcular_diagrama_interaccion_columna).
+    incluir_malla: agrega la malla triangulada con niveles de detalle (ver _malla_triangulada)
+    para graficar superficies grandes sin enviar todos los puntos.
+    """
+    parametros = dict(b_cm=b_cm, h_cm=h_cm, rec_libre_cm=rec_libre_cm,
+                      diam_estribo_mm=diam_estribo_mm, diam_barra_long_mm=diam_barra_long_mm,
+                      nx_barras=nx_barras, ny_barras=ny_barras, fc_MPa=fc_MPa, fy_MPa=fy_MPa,
+                      num_puntos_c=num_puntos_c, num_puntos_theta=num_puntos_theta, motor=motor,
+                      muestreo=muestreo, tolerancia_adaptativa=tolerancia_adaptativa)
+    return _diagrama_con_cache(partial(_calcular_diagrama_interaccion_columna, **parametros), parametros,
+                               usar_cache, incluir_envolvente, incluir_malla)
+
+def _diagrama_con_cache(calcular, parametros_firma, usar_cache, incluir_envolvente, incluir_malla):
+    """
+    Caché (memoria LRU y disco) alrededor de calcular(), con firma de parametros_firma, y
+    salidas derivadas opcionales (envolvente convexa y malla triangulada).
+    """
+    if not usar_cache:
+        resultado = calcular()
+    else:
+        firma = firma_seccion(**parametros_firma)
+        resultado = obtener_diagrama(firma)
+        if resultado is not None:
+            resultado["mensaje"] += " (recuperado de caché)"
+        else:
+            resultado = calcular()
+            if resultado.get("status") == "OK": # Los errores no se guardan
+                resultado = guardar_diagrama(firma, resultado)
+
+    # La envolvente y la malla triangulada se construyen sobre la malla (también la recuperada
+    # de caché), en una copia para no modificar la entrada guardada en memoria
+    if incluir_envolvente or incluir_malla:
+        resultado = dict(resultado)
+    if incluir_envolvente and resultado.get("status") == "OK":
+        resultado.update(_envolvente_convexa(resultado))
+    if incluir_malla and resultado.get("status") == "OK":
+        resultado.update(_malla_triangulada(resultado))
+    return resultado
+
+def _calcular_diagrama_interaccion_columna(
+    b_cm, h_cm, rec_libre_cm,
+    diam_estribo_mm, diam_barra_long_mm,
+    nx_barras, ny_barras, # Número barras cara 'b' y cara 'h' (sin esquinas)
+    fc_MPa, fy_MPa,
+    num_puntos_c=30, num_puntos_theta=36, motor="poligono",
+    muestreo="uniforme", tolerancia_adaptativa=TOLERANCIA_ADAPTATIVA):
     """
     Calcula puntos (phi*Pn, phi*Mnx, phi*Mny) de la superficie de interacción
-    usando el método iterativo fundamental.
+    usando el método fundamental (compatibilidad de deformaciones), evaluado de
+    forma vectorizada con NumPy sobre toda la malla (c, θ, barra).
+    motor: "poligono" (bloque de compresión exacto por recorte del rectángulo) o
+           "fibras" (núcleo común de seccion_fibras, geometría en caché por sección).
+    muestreo: "uniforme" usa num_puntos_c x num_puntos_theta valores equiespaciados.
+              "adaptativo" ubica los 'c' de cada meridiano donde la superficie se curva (incluye
+              los del punto balanceado y la transición de phi) y refina θ hasta que el error de
+              interpolación a P constante sea menor que tolerancia_adaptativa (num_puntos_* no
+              se usan).
     Retorna un diccionario con los puntos calculados y los parámetros usados.
     """
     # 1) Validaciones
     validate_positive(b_cm=b_cm, h_cm=h_cm, rec_libre_cm=rec_libre_cm, diam_estribo_mm=diam_estribo_mm,
                       diam_barra_long_mm=diam_barra_long_mm, fc_MPa=fc_MPa, fy_MPa=fy_MPa)
+    if motor not in ("poligono", "fibras"):
+        raise ValueError(f"Motor '{motor}' no reconocido. Opciones: ['poligono', 'fibras']")
+    if muestreo not in ("uniforme", "adaptativo"):
+        raise ValueError(f"Muestreo '{muestreo}' no reconocido. Opciones: ['uniforme', 'adaptativo']")
     
     # 2) Conversión a mm y cálculo de beta1
     b_mm = cm_to_mm(b_cm)
     h_mm = cm_to_mm(h_cm)
-    beta_1 = _beta1(fc_MPa)
+    beta_1 = beta1(fc_MPa)
     
     # 3) Generar posiciones y áreas del acero
     try:
         barras = _generar_posicion_barras(b_mm, h_mm, cm_to_mm(rec_libre_cm), diam_estribo_mm, diam_barra_long_mm, nx_barras, ny_barras)
-        As_total_mm2 = sum(b['area'] for b in barras)
+        As_total_mm2 = barras['area'].sum()
         rho_g = As_total_mm2 / (b_mm * h_mm)
         if not (0.01 <= rho_g <= 0.06): # NSR-10 C.10.9.1 (hasta 8%)
             # Podría ser 0.06 en zonas sísmicas DMI/DES - C.21.4.3.1
@@ -123,150 +469,424 @@ def calcular_diagrama_interaccion_columna(
     except ValueError as e:
         return {"status": "Error", "mensaje": f"Error en definición de refuerzo: {e}"}
 
-    # 4) Rangos de iteración
-    # Profundidad del eje neutro 'c'. Desde casi 0 hasta un poco más allá de h (para cubrir tensión pura)
+    # 4) Geometría para el cálculo: rectángulo en sentido antihorario, origen en el centroide
+    vert_x = np.array([-b_mm, b_mm, b_mm, -b_mm]) / 2.0
+    vert_y = np.array([-h_mm, -h_mm, h_mm, h_mm]) / 2.0
+    seccion_fibras = seccion_fibras_rectangular(b_mm, h_mm, barras) if motor == "fibras" else None
+    params = {
+        "b_cm": b_cm, "h_cm": h_cm, "rec_libre_cm": rec_libre_cm,
+        "diam_estribo_mm": diam_estribo_mm, "diam_barra_long_mm": diam_barra_long_mm,
+        "nx_barras": nx_barras, "ny_barras": ny_barras,
+    }
+    return _diagrama_desde_poligono(vert_x, vert_y, barras, fc_MPa, fy_MPa, num_puntos_c, num_puntos_theta,
+                                    motor, muestreo, tolerancia_adaptativa, seccion_fibras, params)
+
+def _diagrama_desde_poligono(vert_x, vert_y, barras, fc_MPa, fy_MPa, num_puntos_c, num_puntos_theta,
+                             motor, muestreo, tolerancia_adaptativa, seccion_fibras, params):
+    """
+    Núcleo común del diagrama biaxial para cualquier sección poligonal: vértices en sentido
+    antihorario con origen en el centroide bruto y barras (BARRA_DTYPE) en el mismo sistema.
+    'params' trae los datos propios del tipo de sección y se completa con los del cálculo.
+    """
+    beta_1 = beta1(fc_MPa)
+    Ag_mm2 = _integrar_segmentos(vert_x, vert_y, np.roll(vert_x, -1), np.roll(vert_y, -1))[0].sum()
+    As_total_mm2 = barras['area'].sum()
+    rho_g = As_total_mm2 / Ag_mm2
+
+    # Chequeo Pn max (NSR-10 C.10.3.6) - Asumiendo estribos
+    Po = (0.85 * fc_MPa * (Ag_mm2 - As_total_mm2) + fy_MPa * As_total_mm2) if As_total_mm2 > 0 else (0.85 * fc_MPa * Ag_mm2)
+    Pn_max_norma = 0.80 * (0.65 * Po) # 0.80 * phi * Po (con phi=0.65 para estribos)
+    x_b, y_b, area_b = barras['x'], barras['y'], barras['area']
+    if motor == "fibras":
+        evaluar = partial(_superficie_fibras, seccion_fibras, fc_MPa, fy_MPa)
+    else:
+        # Eje neutro rotado exacto: bloque de compresión recortado del polígono
+        evaluar = partial(_superficie_interaccion, vert_x, vert_y, x_b, y_b, area_b, fc_MPa, fy_MPa)
+
+    # 5) Rangos de iteración
+    # Profundidad del eje neutro 'c'. Desde casi 0 hasta un poco más allá de la mayor dimensión (para cubrir tensión pura)
     # Ajustar el límite superior puede ser necesario para capturar bien la zona de tensión.
-    c_values = np.linspace(1e-3, max(h_mm, b_mm) * 1.5, num_puntos_c)
-    # Ángulo del eje neutro theta (0 a 360 grados)
-    theta_values = np.linspace(0, 2 * np.pi, num_puntos_theta, endpoint=False)
-
-    # 5) Almacenar resultados
-    resultados = [] # Lista de tuplas (phiPn_N, phiMnx_Nmm, phiMny_Nmm)
-
-    # --- Inicio del Bucle Iterativo ---
-    for c_mm in c_values:
-        a_mm = beta_1 * c_mm # Profundidad bloque compresión (perpendicular al eje neutro)
-        if a_mm < 1e-3: continue # Ignorar si bloque es muy pequeño
-
-        for theta_rad in theta_values:
-            # theta define la orientación del eje neutro.
-            # 0 rad: Eje neutro horizontal, compresión arriba. Flexión alrededor de X.
-            # pi/2 rad: Eje neutro vertical, compresión izquierda. Flexión alrededor de Y.
-
-            Pn_N = 0.0
-            Mnx_Nmm = 0.0
-            Mny_Nmm = 0.0
-            epsilon_t_max = -float('inf') # Para encontrar la deformación máxima en tracción
-
-            # A) Contribución del Concreto (Simplificación: rectangular)
-            # El cálculo exacto requiere integrar sobre el área comprimida (polígono)
-            # Simplificación 1: Usar bloque rectangular equivalente normal al eje de flexión dominante.
-            # Simplificación 2: Interpolar entre uniaxial X y Y (aproximación más gruesa)
-            # Aquí usaremos una aproximación basada en la proyección 'a' y el ancho 'b' o 'h'
-            # Esto es MENOS preciso para theta intermedio.
-
-            # Cálculo aproximado de Cc y su centroide (REQUIERE MEJORA PARA PRECISIÓN)
-            # Usaremos una aproximación muy simple: asumimos bloque rectangular 'a' x 'b_efectivo'
-            # Esto no captura bien la forma real del bloque para theta inclinado.
-            # Centroide del bloque también aproximado.
-            if abs(np.cos(theta_rad)) > abs(np.sin(theta_rad)): # Más cercano a flexión alrededor de X
-                 comp_depth = min(a_mm, h_mm) # 'a' limitado por la altura
-                 comp_width = b_mm
-                 comp_area = comp_depth * comp_width
-                 centroid_y = h_mm / 2.0 - comp_depth / 2.0 # Centroide del bloque (respecto al centroide sección)
-                 centroid_x = 0.0
-            else: # Más cercano a flexión alrededor de Y
-                 comp_depth = min(a_mm, b_mm) # 'a' limitado por el ancho
-                 comp_width = h_mm
-                 comp_area = comp_depth * comp_width
-                 centroid_x = b_mm / 2.0 - comp_depth / 2.0 # Centroide del bloque (respecto al centroide sección)
-                 centroid_y = 0.0
-            
-            Cc_N = 0.85 * fc_MPa * comp_area
-            # Restar área acero en compresión (aproximado)
-            area_acero_comp = 0
-            for barra in barras:
-                 # Distancia perpendicular de la barra al eje neutro
-                 # Ecuación línea eje neutro: x*cos(theta) + y*sin(theta) = h/2 - c (si c se mide desde arriba)
-                 # O y' = c (en sistema coordenado rotado)
-                 # Simplificado: usar distancia 'd_barra' desde fibra más comprimida
-                 # d_barra depende de theta y coordenadas (xi, yi)
-                 # d_barra = (h_mm/2.0 - barra['y'])*abs(np.cos(theta_rad)) + (b_mm/2.0 - barra['x'])*abs(np.sin(theta_rad)) # No es exacto
-                 # Usaremos distancia vertical/horizontal como aproximación
-                 dist_y_comp_fib = h_mm/2.0 - barra['y'] # Distancia desde fibra superior
-                 # dist_x_comp_fib = b_mm/2.0 - barra['x'] # Distancia desde fibra izquierda
-                 # d_prima = dist_y_comp_fib # Asumir flexión X
-                 
-                 # Distancia de la barra a la fibra más comprimida (proyectada normal a EN)
-                 # d_barra_perp = ? Es complejo. Usaremos y_i como aproximación para eps_t
-                 
-                 # Si la barra está dentro de 'a' (aproximado), restar su área
-                 # if d_prima < a_mm: # Muy simplificado
-                 #    area_acero_comp += barra['area'] 
-            # Cc_N -= 0.85 * fc_MPa * area_acero_comp # Corrección por acero desplazado
-
-
-            Pn_N += Cc_N
-            Mnx_Nmm += Cc_N * centroid_y # Momento de Cc respecto a eje X centroidal
-            Mny_Nmm += Cc_N * centroid_x # Momento de Cc respecto a eje Y centroidal
-
-
-            # B) Contribución del Acero
-            for barra in barras:
-                # Calcular deformación basada en distancia a eje neutro 'c'
-                # Distancia 'y_prime' de la barra al eje neutro, perpendicular a este.
-                # Es más fácil calcular deformación basada en la distancia a la fibra más comprimida (d_barra)
-                # y la profundidad 'c'
-                
-                # Aproximación: Calcular deformación basada en la distancia Y de la barra (como si fuera flexión uniaxial X)
-                # Esto es una simplificación importante para theta != 0 o pi/2
-                distancia_y_desde_centro = barra['y']
-                distancia_desde_fibra_comp = h_mm / 2.0 - distancia_y_desde_centro
-                
-                epsilon_s = EPSILON_CU * (c_mm - distancia_desde_fibra_comp) / c_mm if c_mm > 1e-6 else (EPSILON_CU if distancia_desde_fibra_comp < 1e-6 else -EPSILON_CU)
-                
-                # Limitar tensión/compresión por fluencia
-                fs_MPa = max(-fy_MPa, min(fy_MPa, ES_MPA * epsilon_s))
-                
-                Fs_N = barra['area'] * fs_MPa
-                
-                Pn_N += Fs_N
-                Mnx_Nmm += Fs_N * barra['y'] # Momento respecto a eje X centroidal
-                Mny_Nmm += Fs_N * barra['x'] # Momento respecto a eje Y centroidal
-
-                # Rastrear deformación máxima en tracción (para phi)
-                # La barra más traccionada es la más lejana al EN en el lado opuesto a la compresión
-                # Aproximación: Usar la barra con y más negativa (para theta cercano a 0)
-                if epsilon_s < 0: # Si está en tracción
-                     epsilon_t_max = max(epsilon_t_max, abs(epsilon_s))
-
-            # C) Calcular phi y almacenar punto
-            if epsilon_t_max < 0: epsilon_t_max = 0 # Si todo está en compresión, epsilon_t = 0
-            phi = _calcular_phi(epsilon_t_max)
-
-            # D) Chequeo Pn max (NSR-10 C.10.3.6) - Asumiendo estribos
-            Po = (0.85 * fc_MPa * (b_mm * h_mm - As_total_mm2) + fy_MPa * As_total_mm2) if As_total_mm2 > 0 else (0.85 * fc_MPa * b_mm * h_mm)
-            Pn_max_norma = 0.80 * (0.65 * Po) # 0.80 * phi * Po (con phi=0.65 para estribos)
-
-            # Almacenar el punto (phi*Pn, phi*Mnx, phi*Mny)
-            # Solo guardar puntos válidos (P >= 0 y P <= Pn_max_norma)
-            # if Pn_N >= 0 and phi * Pn_N <= Pn_max_norma: # Aplicar límite máximo
-            if Pn_N >= 0: # Guardar todos los puntos P>=0 por ahora
-                resultados.append((phi * Pn_N, phi * Mnx_Nmm, phi * Mny_Nmm))
-            # else: # Considerar puntos en tensión pura si es necesario
-                # if Pn_N < 0: resultados.append((phi * Pn_N, phi * Mnx_Nmm, phi * Mny_Nmm))
-                
-    # --- Fin del Bucle Iterativo ---
-
-    if not resultados:
+    c_max = max(np.ptp(vert_y), np.ptp(vert_x)) * 1.5
+    if muestreo == "adaptativo":
+        theta_values = np.linspace(0, 2 * np.pi, NUM_THETA_INICIAL_ADAPTATIVO, endpoint=False)
+        c_min = 1e-3 / beta_1 # Primer 'c' que no descarta el filtro del bloque mínimo
+        # Piloto más densa cerca de c = 0, donde P cambia más rápido (extremo de tracción)
+        c_values = c_min + (c_max - c_min) * np.linspace(0, 1, NUM_C_PILOTO_ADAPTATIVO)**1.5
+    else:
+        c_values = np.linspace(1e-3, c_max, num_puntos_c)
+        # Ángulo del eje neutro theta (0 a 360 grados)
+        theta_values = np.linspace(0, 2 * np.pi, num_puntos_theta, endpoint=False)
+        c_values = c_values[beta_1 * c_values >= 1e-3] # Ignorar si bloque es muy pequeño
+
+    # 6) Cálculo vectorizado sobre la malla (c, θ, barra)
+    if muestreo == "adaptativo":
+        # La refinación ya evalúa cada punto de la malla final ('c' propios de cada meridiano)
+        c_values, theta_values, (Pn_N, Mnx_Nmm, Mny_Nmm, phi), num_evaluaciones = _refinar_malla_adaptativa(
+            evaluar, c_values, partial(_c_puntos_clave, vert_x, vert_y, x_b, y_b, fy_MPa), theta_values,
+            tolerancia_adaptativa, P_tope_N=Pn_max_norma)
+    else:
+        Pn_N, Mnx_Nmm, Mny_Nmm, phi = evaluar(c_values, theta_values)
+        num_evaluaciones = Pn_N.size
+
+    # Solo guardar puntos válidos (P >= 0 y P <= Pn_max_norma)
+    # valido = (Pn_N >= 0) & (phi * Pn_N <= Pn_max_norma) # Aplicar límite máximo
+    valido = Pn_N >= 0 # Guardar todos los puntos P>=0 por ahora
+    num_puntos = int(np.count_nonzero(valido))
+
+    if num_puntos == 0:
          return {"status": "Error", "mensaje": "No se generaron puntos válidos en el diagrama."}
 
-    # 6) Formatear salida
-    P_N_array, Mnx_Nmm_array, Mny_Nmm_array = zip(*resultados)
-    
+    # 7) Formatear salida (orden c exterior, θ interior)
     return {
         "status": "OK",
-        "mensaje": f"Diagrama calculado con {len(resultados)} puntos. Aproximación de bloque de compresión usada.",
-        "P_N": np.array(P_N_array),
-        "Mx_Nmm": np.array(Mnx_Nmm_array),
-        "My_Nmm": np.array(Mny_Nmm_array),
+        "mensaje": f"Diagrama calculado con {num_puntos} puntos. " + ("Sección de fibras con eje neutro rotado." if motor == "fibras" else "Bloque de compresión exacto con eje neutro rotado."),
+        "P_N": (phi * Pn_N)[valido],
+        "Mx_Nmm": (phi * Mnx_Nmm)[valido],
+        "My_Nmm": (phi * Mny_Nmm)[valido],
+        # Malla estructurada completa (incluye P < 0): ejes (c, θ); cada columna es un meridiano θ.
+        # c_mm es un vector (uniforme) o una matriz (c, θ) con los 'c' de cada meridiano (adaptativo)
+        "c_mm": c_values,
+        "theta_rad": theta_values,
+        "P_malla_N": phi * Pn_N,
+        "Mx_malla_Nmm": phi * Mnx_Nmm,
+        "My_malla_Nmm": phi * Mny_Nmm,
+        "phi_malla": phi,
         # Incluir parámetros usados para referencia
+        "params": {
+            **params, "num_barras_total": len(barras),
+            "fc_MPa": fc_MPa, "fy_MPa": fy_MPa,
+            "rho_g": rho_g, "motor": motor, "muestreo": muestreo,
+            "num_puntos_c": Pn_N.shape[0], "num_puntos_theta": len(theta_values),
+            "num_evaluaciones": num_evaluaciones,
+            "As_total_mm2": As_total_mm2, "phiPn_max_N": Pn_max_norma
+        }
+    }
+
+
+# --- Secciones Generales (poligonales y circulares) ---
+def _poligono_centrado(vert_x, vert_y):
+    """Ordena los vértices en sentido antihorario y los refiere al centroide. Retorna (x, y, (x_g, y_g))."""
+    vert_x, vert_y = np.asarray(vert_x, dtype=float), np.asarray(vert_y, dtype=float)
+    if len(vert_x) < 3:
+        raise ValueError("El polígono debe tener al menos 3 vértices.")
+    area, Sx, Sy = (v.sum() for v in _integrar_segmentos(vert_x, vert_y, np.roll(vert_x, -1), np.roll(vert_y, -1)))
+    if abs(area) < 1e-9:
+        raise ValueError("El polígono tiene área nula.")
+    if area < 0: # Sentido horario: invertir
+        vert_x, vert_y = vert_x[::-1], vert_y[::-1]
+    centroide = (Sx / area, Sy / area)
+    return vert_x - centroide[0], vert_y - centroide[1], centroide
+
+def _contorno_interior(vert_x, vert_y, distancia):
+    """Contorno desplazado 'distancia' hacia el interior (polígono antihorario, vértices en inglete)."""
+    ex, ey = np.roll(vert_x, -1) - vert_x, np.roll(vert_y, -1) - vert_y
+    largo = np.hypot(ex, ey)
+    nx, ny = -ey / largo, ex / largo # Normal interior de cada lado
+    nx_ant, ny_ant = np.roll(nx, 1), np.roll(ny, 1) # Lado que llega a cada vértice
+    factor = distancia / (1.0 + nx_ant * nx + ny_ant * ny)
+    return vert_x + factor * (nx_ant + nx), vert_y + factor * (ny_ant + ny)
+
+def _barras_en_contorno(vert_x, vert_y, distancia_mm, area_barra_mm2, separacion_max_mm):
+    """Barras en los vértices del contorno interior y repartidas en cada lado con separación <= separacion_max_mm."""
+    cx, cy = _contorno_interior(vert_x, vert_y, distancia_mm)
+    ex, ey = np.roll(cx, -1) - cx, np.roll(cy, -1) - cy
+    espacios = np.maximum(np.ceil(np.hypot(ex, ey) / separacion_max_mm).astype(int), 1)
+    lado = np.repeat(np.arange(len(cx)), espacios)
+    fraccion = np.concatenate([np.arange(n) / n for n in espacios]) # Incluye el vértice inicial de cada lado
+    barras = np.empty(len(lado), dtype=BARRA_DTYPE)
+    barras['x'] = cx[lado] + fraccion * ex[lado]
+    barras['y'] = cy[lado] + fraccion * ey[lado]
+    barras['area'] = area_barra_mm2
+    return barras
+
+def _validar_barras(barras, diam_barras_mm):
+    """Separación libre mínima entre barras: max(1.5·db, 40 mm) (NSR-10 C.7.6.3)."""
+    dx = barras['x'][:, None] - barras['x'][None, :]
+    dy = barras['y'][:, None] - barras['y'][None, :]
+    db = np.broadcast_to(np.asarray(diam_barras_mm, dtype=float), barras.shape)
+    libre = np.hypot(dx, dy) - (db[:, None] + db[None, :]) / 2.0
+    minimo = np.maximum(1.5 * np.maximum(db[:, None], db[None, :]), 40.0)
+    np.fill_diagonal(libre, np.inf)
+    if np.any(libre < minimo - 1e-6):
+        raise ValueError("Separación libre entre barras menor que max(1.5·db, 40 mm) (NSR-10 C.7.6.3).")
+
+def _seccion_general(tipo, vert_x_mm, vert_y_mm, barras, diam_barras_mm, params):
+    """Arma el diccionario de una sección general con vértices y barras referidos al centroide."""
+    vert_x, vert_y, (x_g, y_g) = _poligono_centrado(vert_x_mm, vert_y_mm)
+    barras = barras.copy()
+    barras['x'] -= x_g
+    barras['y'] -= y_g
+    _validar_barras(barras, diam_barras_mm)
+    return {"tipo": tipo, "vert_x_mm": vert_x, "vert_y_mm": vert_y, "barras": barras, "params": {"tipo": tipo, **params}}
+
+def seccion_columna_circular(D_cm, rec_libre_cm, diam_estribo_mm, diam_barra_long_mm, num_barras, num_lados=NUM_LADOS_CIRCULO):
+    """
+    Sección circular de diámetro D como polígono regular de num_lados con la misma área del
+    círculo, y num_barras repartidas uniformemente (la primera arriba, θ = 0).
+    """
+    validate_positive(D_cm=D_cm, rec_libre_cm=rec_libre_cm, diam_estribo_mm=diam_estribo_mm,
+                      diam_barra_long_mm=diam_barra_long_mm)
+    if num_barras < 4:
+        raise ValueError("Se requieren al menos 4 barras en secciones circulares (NSR-10 C.10.9.2).")
+    radio_mm = cm_to_mm(D_cm) / 2.0
+    radio_barras_mm = radio_mm - cm_to_mm(rec_libre_cm) - diam_estribo_mm - diam_barra_long_mm / 2.0
+    if radio_barras_mm <= 0:
+        raise ValueError("La sección es muy pequeña para el recubrimiento, estribo y diámetro de barra dados.")
+    angulos = 2 * np.pi * np.arange(num_lados) / num_lados
+    radio_equivalente = radio_mm * np.sqrt(2 * np.pi / (num_lados * np.sin(2 * np.pi / num_lados))) # Igual área
+    angulos_b = np.pi / 2.0 + 2 * np.pi * np.arange(num_barras) / num_barras
+    barras = np.empty(num_barras, dtype=BARRA_DTYPE)
+    barras['x'] = radio_barras_mm * np.cos(angulos_b)
+    barras['y'] = radio_barras_mm * np.sin(angulos_b)
+    barras['area'] = np.pi * (diam_barra_long_mm / 2.0)**2
+    return _seccion_general("circular", radio_equivalente * np.cos(angulos), radio_equivalente * np.sin(angulos), barras,
+                            diam_barra_long_mm, {"D_cm": D_cm, "rec_libre_cm": rec_libre_cm, "diam_estribo_mm": diam_estribo_mm,
+                                                 "diam_barra_long_mm": diam_barra_long_mm, "num_lados": num_lados})
+
+def _seccion_por_contorno(tipo, vert_x_mm, vert_y_mm, rec_libre_cm, diam_estribo_mm, diam_barra_long_mm, separacion_max_cm, params):
+    """Sección poligonal con barras en el contorno interior (vértices y lados)."""
+    validate_positive(rec_libre_cm=rec_libre_cm, diam_estribo_mm=diam_estribo_mm,
+                      diam_barra_long_mm=diam_barra_long_mm, separacion_max_cm=separacion_max_cm)
+    vert_x, vert_y, _ = _poligono_centrado(vert_x_mm, vert_y_mm)
+    distancia_mm = cm_to_mm(rec_libre_cm) + diam_estribo_mm + diam_barra_long_mm / 2.0
+    barras = _barras_en_contorno(vert_x, vert_y, distancia_mm, np.pi * (diam_barra_long_mm / 2.0)**2, cm_to_mm(separacion_max_cm))
+    return _seccion_general(tipo, vert_x, vert_y, barras, diam_barra_long_mm,
+                            {**params, "rec_libre_cm": rec_libre_cm, "diam_estribo_mm": diam_estribo_mm,
+                             "diam_barra_long_mm": diam_barra_long_mm, "separacion_max_cm": separacion_max_cm})
+
+def seccion_columna_L(b_cm, h_cm, e_horizontal_cm, e_vertical_cm, rec_libre_cm, diam_estribo_mm, diam_barra_long_mm, separacion_max_cm=20.0):
+    """
+    Sección en L: ala horizontal b x e_horizontal (abajo) y ala vertical e_vertical x h (izquierda).
+    Barras en los vértices del contorno interior y en cada lado con separación <= separacion_max_cm.
+    """
+    validate_positive(b_cm=b_cm, h_cm=h_cm, e_horizontal_cm=e_horizontal_cm, e_vertical_cm=e_vertical_cm)
+    if e_horizontal_cm >= h_cm or e_vertical_cm >= b_cm:
+        raise ValueError("Los espesores de las alas deben ser menores que b y h.")
+    b, h, eh, ev = (cm_to_mm(v) for v in (b_cm, h_cm, e_horizontal_cm, e_vertical_cm))
+    return _seccion_por_contorno("L", [0, b, b, ev, ev, 0], [0, 0, eh, eh, h, h], rec_libre_cm, diam_estribo_mm,
+                                 diam_barra_long_mm, separacion_max_cm,
+                                 {"b_cm": b_cm, "h_cm": h_cm, "e_horizontal_cm": e_horizontal_cm, "e_vertical_cm": e_vertical_cm})
+
+def seccion_columna_T(b_ala_cm, e_ala_cm, b_alma_cm, h_cm, rec_libre_cm, diam_estribo_mm, diam_barra_long_mm, separacion_max_cm=20.0):
+    """
+    Sección en T: ala b_ala x e_ala arriba y alma b_alma x (h - e_ala) centrada debajo.
+    Barras en los vértices del contorno interior y en cada lado con separación <= separacion_max_cm.
+    """
+    validate_positive(b_ala_cm=b_ala_cm, e_ala_cm=e_ala_cm, b_alma_cm=b_alma_cm, h_cm=h_cm)
+    if e_ala_cm >= h_cm or b_alma_cm >= b_ala_cm:
+        raise ValueError("El ala debe ser más delgada que h y el alma más angosta que el ala.")
+    ba, ea, bw, h = (cm_to_mm(v) for v in (b_ala_cm, e_ala_cm, b_alma_cm, h_cm))
+    vert_x = np.array([-bw, bw, bw, ba, ba, -ba, -ba, -bw]) / 2.0
+    vert_y = np.array([0, 0, h - ea, h - ea, h, h, h - ea, h - ea])
+    return _seccion_por_contorno("T", vert_x, vert_y, rec_libre_cm, diam_estribo_mm, diam_barra_long_mm, separacion_max_cm,
+                                 {"b_ala_cm": b_ala_cm, "e_ala_cm": e_ala_cm, "b_alma_cm": b_alma_cm, "h_cm": h_cm})
+
+def seccion_columna_poligonal(vertices_cm, barras_cm):
+    """
+    Sección con contorno y barras arbitrarios.
+    vertices_cm: secuencia de (x, y) en cm (cualquier sentido de giro).
+    barras_cm: secuencia de (x, y, diámetro_mm) con x, y en cm en el mismo sistema.
+    """
+    vertices = np.asarray(vertices_cm, dtype=float).reshape(-1, 2)
+    datos_barras = np.asarray(barras_cm, dtype=float).reshape(-1, 3)
+    if len(datos_barras) < 4:
+        raise ValueError("Se requieren al menos 4 barras longitudinales.")
+    barras = np.empty(len(datos_barras), dtype=BARRA_DTYPE)
+    barras['x'] = cm_to_mm(datos_barras[:, 0])
+    barras['y'] = cm_to_mm(datos_barras[:, 1])
+    barras['area'] = np.pi * (datos_barras[:, 2] / 2.0)**2
+    return _seccion_general("poligonal", cm_to_mm(vertices[:, 0]), cm_to_mm(vertices[:, 1]), barras, datos_barras[:, 2],
+                            {"vertices_cm": vertices.tolist(), "barras_cm": datos_barras.tolist()})
+
+def calcular_diagrama_interaccion_seccion(
+    seccion, fc_MPa, fy_MPa,
+    num_puntos_c=30, num_puntos_theta=36, motor="poligono", usar_cache=True,
+    incluir_envolvente=False, muestreo="uniforme", tolerancia_adaptativa=TOLERANCIA_ADAPTATIVA, incluir_malla=False):
+    """
+    Diagrama de interacción biaxial de una sección general (seccion_columna_circular, _L, _T o
+    _poligonal) con el mismo motor vectorizado, caché y salidas que
+    calcular_diagrama_interaccion_columna. Verificar con verificacion_columna.calcular_dcr_columna.
+    """
+    parametros = dict(tipo=seccion["tipo"],
+                      vertices=np.column_stack([seccion["vert_x_mm"], seccion["vert_y_mm"]]).round(6).tolist(),
+                      barras=np.column_stack([seccion["barras"]['x'], seccion["barras"]['y'], seccion["barras"]['area']]).round(6).tolist(),
+                      fc_MPa=fc_MPa, fy_MPa=fy_MPa, num_puntos_c=num_puntos_c, num_puntos_theta=num_puntos_theta,
+                      motor=motor, muestreo=muestreo, tolerancia_adaptativa=tolerancia_adaptativa)
+    return _diagrama_con_cache(partial(_calcular_diagrama_interaccion_seccion, seccion, fc_MPa, fy_MPa, num_puntos_c,
+                                       num_puntos_theta, motor, muestreo, tolerancia_adaptativa),
+                               parametros, usar_cache, incluir_envolvente, incluir_malla)
+
+def _calcular_diagrama_interaccion_seccion(seccion, fc_MPa, fy_MPa, num_puntos_c, num_puntos_theta, motor, muestreo, tolerancia_adaptativa):
+    """Validaciones y cuantía de una sección general; el cálculo lo hace _diagrama_desde_poligono."""
+    validate_positive(fc_MPa=fc_MPa, fy_MPa=fy_MPa)
+    if motor not in ("poligono", "fibras"):
+        raise ValueError(f"Motor '{motor}' no reconocido. Opciones: ['poligono', 'fibras']")
+    if muestreo not in ("uniforme", "adaptativo"):
+        raise ValueError(f"Muestreo '{muestreo}' no reconocido. Opciones: ['uniforme', 'adaptativo']")
+    vert_x, vert_y, barras = seccion["vert_x_mm"], seccion["vert_y_mm"], seccion["barras"]
+    Ag_mm2 = _integrar_segmentos(vert_x, vert_y, np.roll(vert_x, -1), np.roll(vert_y, -1))[0].sum()
+    rho_g = barras['area'].sum() / Ag_mm2
+    if not (0.01 <= rho_g <= 0.06): # Mismos límites que la sección rectangular
+        return {"status": "Error", "mensaje": f"Error en definición de refuerzo: Cuantía total {rho_g:.3f} fuera de límites [0.01, 0.06]."}
+    seccion_fibras = seccion_fibras_poligonal(vert_x, vert_y, barras) if motor == "fibras" else None
+    return _diagrama_desde_poligono(vert_x, vert_y, barras, fc_MPa, fy_MPa, num_puntos_c, num_puntos_theta,
+                                    motor, muestreo, tolerancia_adaptativa, seccion_fibras, dict(seccion["params"]))
+
+
+# --- Diagrama Uniaxial en Forma Cerrada ---
+def _capas_uniaxiales(barras, b_mm, h_mm, eje):
+    """
+    Agrupa las barras en capas para flexión uniaxial. eje "X": comprime la cara superior (+y,
+    θ = 0); eje "Y": comprime la cara +x (θ = π/2).
+    Retorna (ancho, altura, profundidades de las capas desde la fibra comprimida, áreas por capa).
+    """
+    if eje == "X":
+        ancho, altura = b_mm, h_mm
+        prof = h_mm / 2.0 - barras['y']
+    else:
+        ancho, altura = h_mm, b_mm
+        prof = b_mm / 2.0 - barras['x']
+    d_capas, inversa = np.unique(np.round(prof, 6), return_inverse=True)
+    return ancho, altura, d_capas, np.bincount(inversa, weights=barras['area'])
+
+def _estado_uniaxial(c_mm, ancho, altura, d_capas, A_capas, fc_MPa, fy_MPa, beta_1):
+    """(Pn_N, Mn_Nmm, epsilon_t) para cada profundidad del eje neutro c_mm (forma cerrada)."""
+    c = np.asarray(c_mm, dtype=float)[:, None]
+    a_mm = np.minimum(beta_1 * c[:, 0], altura)
+    epsilon_s = EPSILON_CU * (c - d_capas) / c
+    fs_MPa = np.minimum(np.maximum(ES_MPA * epsilon_s, -fy_MPa), fy_MPa) - np.where(d_capas <= beta_1 * c, 0.85 * fc_MPa, 0.0)
+    Fs_N = A_capas * fs_MPa
+    Cc_N = 0.85 * fc_MPa * ancho * a_mm
+    Pn_N = Cc_N + Fs_N.sum(axis=1)
+    Mn_Nmm = Cc_N * (altura - a_mm) / 2.0 + Fs_N @ (altura / 2.0 - d_capas)
+    epsilon_t = np.maximum(-epsilon_s[:, -1], 0.0) # Capa más profunda
+    return Pn_N, Mn_Nmm, epsilon_t
+
+def _c_para_carga_axial(P_obj_N, quiebres, P_quiebres, ancho, altura, d_capas, A_capas, fc_MPa, fy_MPa, beta_1):
+    """
+    Profundidades c exactas para las cuales Pn(c) = P_obj_N (arreglo), todas a la vez. Entre dos
+    quiebres consecutivos el estado de cada capa (fluencia, elástica, dentro del bloque) no
+    cambia y Pn·c es un polinomio de grado 2 en c, así que la raíz se obtiene con la fórmula
+    cuadrática. Fuera del rango de P_quiebres se retorna el quiebre extremo.
+    """
+    P_obj_N = np.asarray(P_obj_N, dtype=float)
+    k = np.minimum(np.maximum(np.searchsorted(P_quiebres, P_obj_N), 1), len(quiebres) - 1) # Pn(c) es creciente con c
+    c_lo, c_hi = quiebres[k - 1], quiebres[k]
+    c_m = 0.5 * (c_lo + c_hi)
+
+    # Coeficientes de Pn·c = k2 c² + k1 c + k0 en el tramo de cada objetivo (objetivos x capas)
+    bloque_parcial = beta_1 * c_m < altura
+    k2 = np.where(bloque_parcial, 0.85 * fc_MPa * ancho * beta_1, 0.0)
+    k1 = np.where(bloque_parcial, 0.0, 0.85 * fc_MPa * ancho * altura)
+    epsilon_m = EPSILON_CU * (c_m[:, None] - d_capas) / c_m[:, None]
+    elastica = np.abs(ES_MPA * epsilon_m) < fy_MPa
+    k1 = k1 + np.where(elastica, ES_MPA * EPSILON_CU, np.sign(epsilon_m) * fy_MPa) @ A_capas
+    k1 = k1 - (d_capas <= beta_1 * c_m[:, None]) @ A_capas * 0.85 * fc_MPa - P_obj_N
+    k0 = -np.where(elastica, ES_MPA * EPSILON_CU * d_capas, 0.0) @ A_capas
+
+    # (Pn - P_obj)·c pasa de negativo a positivo en el tramo y, con k2 > 0, es convexo: la raíz
+    # del tramo es la mayor. Con el bloque completo (k2 = 0) es lineal.
+    cuadratica = k2 > 0
+    raiz_mayor = (-k1 + np.sqrt(np.maximum(k1**2 - 4.0 * k2 * k0, 0.0))) / np.where(cuadratica, 2.0 * k2, 1.0)
+    c = np.where(cuadratica, raiz_mayor, -k0 / np.where(k1 != 0, k1, 1.0))
+    c = np.minimum(np.maximum(c, c_lo), c_hi)
+    c = np.where(P_obj_N <= P_quiebres[0], quiebres[0], c)
+    return np.where(P_obj_N > P_quiebres[-1], quiebres[-1], c)
+
+def calcular_diagrama_uniaxial_columna(
+    b_cm, h_cm, rec_libre_cm,
+    diam_estribo_mm, diam_barra_long_mm,
+    nx_barras, ny_barras,
+    fc_MPa, fy_MPa, eje="X", puntos_por_tramo=4):
+    """
+    Diagrama P-M uniaxial (eje "X": θ = 0, o eje "Y": θ = π/2) sin búsqueda en malla.
+    Las barras se agrupan en capas y el diagrama se arma por tramos entre los quiebres de c
+    donde cambia el estado de alguna capa (deformación nula, fluencia, entrada al bloque) o el
+    bloque cubre toda la sección. Los puntos clave se obtienen en forma cerrada:
+    compresión pura, tope 0.80·φ·Po, punto balanceado, εt = 0.005, flexión pura y tracción pura.
+    Retorna un diccionario con los puntos clave y las curvas (Pn, Mn, φ) en orden de c creciente.
+    """
+    validate_positive(b_cm=b_cm, h_cm=h_cm, rec_libre_cm=rec_libre_cm, diam_estribo_mm=diam_estribo_mm,
+                      diam_barra_long_mm=diam_barra_long_mm, fc_MPa=fc_MPa, fy_MPa=fy_MPa)
+    if eje not in ("X", "Y"):
+        raise ValueError(f"Eje '{eje}' no reconocido. Opciones: ['X', 'Y']")
+
+    b_mm = cm_to_mm(b_cm)
+    h_mm = cm_to_mm(h_cm)
+    beta_1 = beta1(fc_MPa)
+    try:
+        barras = _generar_posicion_barras(b_mm, h_mm, cm_to_mm(rec_libre_cm), diam_estribo_mm, diam_barra_long_mm, nx_barras, ny_barras)
+        As_total_mm2 = barras['area'].sum()
+        rho_g = As_total_mm2 / (b_mm * h_mm)
+        if not (0.01 <= rho_g <= 0.06): # Mismos límites que el diagrama biaxial
+            raise ValueError(f"Cuantía total {rho_g:.3f} fuera de límites [0.01, 0.06].")
+    except ValueError as e:
+        return {"status": "Error", "mensaje": f"Error en definición de refuerzo: {e}"}
+
+    ancho, altura, d_capas, A_capas = _capas_uniaxiales(barras, b_mm, h_mm, eje)
+    args = (ancho, altura, d_capas, A_capas, fc_MPa, fy_MPa, beta_1)
+    epsilon_y = fy_MPa / ES_MPA
+
+    # Quiebres de c: cambios de estado de cada capa y bloque completo
+    quiebres = np.concatenate([
+        d_capas / beta_1,                                  # La capa entra al bloque de compresión
+        d_capas,                                           # Deformación nula
+        d_capas * EPSILON_CU / (EPSILON_CU + epsilon_y),   # Fluencia en tracción
+        d_capas * EPSILON_CU / (EPSILON_CU - epsilon_y) if EPSILON_CU > epsilon_y else [],  # Fluencia en compresión
+        [altura / beta_1],                                 # Bloque cubre toda la sección
+    ])
+    c_Po = quiebres.max() # Desde aquí todas las capas fluyen en compresión y Pn = Po
+    quiebres = np.unique(np.concatenate([[1e-9 * altura], quiebres[quiebres > 0]]))
+    P_quiebres, _, _ = _estado_uniaxial(quiebres, *args)
+
+    Po = 0.85 * fc_MPa * (b_mm * h_mm - As_total_mm2) + fy_MPa * As_total_mm2
+    phiPn_max = 0.80 * 0.65 * Po # NSR-10 C.10.3.6 (estribos)
+
+    d_t = d_capas[-1]
+    c_tope, c_flexion = _c_para_carga_axial([0.80 * Po, 0.0], quiebres, P_quiebres, *args) # φ = 0.65 en el tope
+    c_clave = {
+        "tope": float(c_tope),
+        "balanceado": d_t * EPSILON_CU / (EPSILON_CU + epsilon_y),
+        "traccion_controlada": d_t * EPSILON_CU / (EPSILON_CU + 0.005),
+        "flexion_pura": float(c_flexion),
+    }
+
+    # Curvas por tramos: quiebres, puntos clave y puntos interiores de cada tramo (hasta Po),
+    # evaluados en una sola pasada junto con los puntos clave
+    tramos = np.unique(np.append(quiebres[quiebres <= c_Po], list(c_clave.values())))
+    fracciones = np.arange(puntos_por_tramo + 1) / (puntos_por_tramo + 1) # Incluye el inicio del tramo
+    c_curva = np.append((tramos[:-1, None] + np.diff(tramos)[:, None] * fracciones).ravel(), tramos[-1]) # Ya ordenado
+    Pn_N, Mn_Nmm, epsilon_t = _estado_uniaxial(c_curva, *args)
+    phi = calcular_phi(epsilon_t)
+    i_clave = np.searchsorted(c_curva, list(c_clave.values()))
+    Pn_clave, Mn_clave, et_clave, phi_clave = Pn_N[i_clave], Mn_Nmm[i_clave], epsilon_t[i_clave], phi[i_clave]
+
+    puntos = {"compresion_pura": {"c_mm": np.inf, "Pn_N": Po, "Mn_Nmm": 0.0, "phi": 0.65,
+                                  "phiPn_N": 0.65 * Po, "phiMn_Nmm": 0.0, "epsilon_t": 0.0}}
+    for i, nombre in enumerate(c_clave):
+        puntos[nombre] = {"c_mm": c_clave[nombre], "Pn_N": Pn_clave[i], "Mn_Nmm": Mn_clave[i], "phi": float(phi_clave[i]),
+                          "phiPn_N": phi_clave[i] * Pn_clave[i], "phiMn_Nmm": phi_clave[i] * Mn_clave[i],
+                          "epsilon_t": et_clave[i]}
+    puntos["traccion_pura"] = {"c_mm": 0.0, "Pn_N": -fy_MPa * As_total_mm2, "Mn_Nmm": -fy_MPa * np.dot(A_capas, altura / 2.0 - d_capas),
+                               "phi": 0.90, "phiPn_N": -0.90 * fy_MPa * As_total_mm2,
+                               "phiMn_Nmm": -0.90 * fy_MPa * np.dot(A_capas, altura / 2.0 - d_capas), "epsilon_t": np.inf}
+
+    return {
+        "status": "OK",
+        "mensaje": f"Diagrama uniaxial (eje {eje}) en forma cerrada con {len(tramos) - 1} tramos.",
+        "puntos_clave": puntos,
+        "c_mm": c_curva,
+        "Pn_N": Pn_N,
+        "Mn_Nmm": Mn_Nmm,
+        "phi": phi,
+        "phiPn_N": phi * Pn_N,
+        "phiMn_Nmm": phi * Mn_Nmm,
         "params": {
             "b_cm": b_cm, "h_cm": h_cm, "rec_libre_cm": rec_libre_cm,
             "diam_estribo_mm": diam_estribo_mm, "diam_barra_long_mm": diam_barra_long_mm,
             "nx_barras": nx_barras, "ny_barras": ny_barras, "num_barras_total": len(barras),
-            "fc_MPa": fc_MPa, "fy_MPa": fy_MPa,
-            "rho_g": rho_g
+            "fc_MPa": fc_MPa, "fy_MPa": fy_MPa, "eje": eje,
+            "rho_g": rho_g, "As_total_mm2": As_total_mm2, "phiPn_max_N": phiPn_max
         }
     }
 
@@ -296,9 +916,17 @@ def graficar_diagrama_interaccion(datos: dict, titulo: str = "Diagrama P–M Bia
         fig = plt.figure(figsize=(8, 8))
         ax = fig.add_subplot(111, projection='3d')
 
-    # Filtrar solo puntos con P >= 0 para visualización típica
-    mask_comp = P_kN >= -1e-6 # Tolerancia pequeña
-    sc = ax.scatter(Mx_kNm[mask_comp], My_kNm[mask_comp], P_kN[mask_comp], s=3, c=P_kN[mask_comp], cmap='viridis', alpha=0.8)
+    if "malla_niveles" in datos:
+        # Superficie triangulada con el nivel de detalle más fino que no excede MAX_TRIANGULOS_GRAFICO
+        nivel = next((n for n in datos["malla_niveles"] if len(n["triangulos"]) <= MAX_TRIANGULOS_GRAFICO), datos["malla_niveles"][-1])
+        P_m, Mx_m, My_m = nivel["puntos"].T
+        sc = ax.plot_trisurf(Mx_m, My_m, P_m, triangles=nivel["triangulos"], cmap='viridis', linewidth=0.1, alpha=0.8)
+        P_min_plot = min(float(P_m.min()), 0.0) # La malla incluye la zona de tracción
+    else:
+        P_min_plot = 0.0
+        # Filtrar solo puntos con P >= 0 para visualización típica
+        mask_comp = P_kN >= -1e-6 # Tolerancia pequeña
+        sc = ax.scatter(Mx_kNm[mask_comp], My_kNm[mask_comp], P_kN[mask_comp], s=3, c=P_kN[mask_comp], cmap='viridis', alpha=0.8)
     
     # Añadir colorbar si se está creando el eje aquí
     if own_ax:
@@ -320,7 +948,7 @@ def graficar_diagrama_interaccion(datos: dict, titulo: str = "Diagrama P–M Bia
     # Ajustar límites si es necesario
     ax.set_xlim(-max_M_plot, max_M_plot)
     ax.set_ylim(-max_M_plot, max_M_plot)
-    ax.set_zlim(0, P_kN.max() * 1.1 if P_kN.max() > 0 else 1)
+    ax.set_zlim(P_min_plot * 1.1, P_kN.max() * 1.1 if P_kN.max() > 0 else 1)
 
     if own_ax:
         plt.tight_layout()
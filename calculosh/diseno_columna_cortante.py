@@ -112,4 +112,69 @@ def diseno_columna_cortante_dmo(
         "s_final_confinado_mm": round(np.floor(s_final_confinado_mm / 10) * 10, 0), # Redondear a 10mm
         "s_fuera_confinado_mm": round(np.floor(s_fuera_confinado_mm / 10) * 10, 0),
         "diam_estribo_usado_mm": diam_estribo_mm
-    }
\ No newline at end of file
+    }
+
+
+def diseno_columna_cortante_dmo_lote(
+    b_col_cm, h_col_cm, fc_MPa, fy_MPa,
+    Pu_kN, Vu_analisis_kN,
+    Mn_viga_izq_kNm, Mn_viga_der_kNm, L_libre_vigas_m,
+    rec_libre_mm, diam_estribo_mm, H_libre_col_m
+):
+    """
+    Versión vectorizada de diseno_columna_cortante_dmo: cada parámetro acepta un escalar o un
+    arreglo (se combinan por broadcasting) y cada elemento es una columna en un piso.
+    Retorna las mismas claves con arreglos; 'Vc_nulo' indica dónde Pu < 0.05·Ag·f'c.
+    """
+    (b_col_cm, h_col_cm, fc_MPa, fy_MPa, Pu_kN, Vu_analisis_kN, Mn_viga_izq_kNm, Mn_viga_der_kNm,
+     L_libre_vigas_m, rec_libre_mm, diam_estribo_mm, H_libre_col_m) = np.broadcast_arrays(
+        *(np.asarray(v, dtype=float) for v in (b_col_cm, h_col_cm, fc_MPa, fy_MPa, Pu_kN, Vu_analisis_kN,
+                                               Mn_viga_izq_kNm, Mn_viga_der_kNm, L_libre_vigas_m,
+                                               rec_libre_mm, diam_estribo_mm, H_libre_col_m)))
+    for nombre, valor in (("b_col_cm", b_col_cm), ("h_col_cm", h_col_cm), ("fc_MPa", fc_MPa), ("fy_MPa", fy_MPa),
+                          ("L_libre_vigas_m", L_libre_vigas_m), ("H_libre_col_m", H_libre_col_m)):
+        if np.any(valor <= 0):
+            raise ValueError(f"'{nombre}' debe ser positivo en todas las columnas")
+
+    b_col_mm = cm_to_mm(b_col_cm)
+    h_col_mm = cm_to_mm(h_col_cm)
+    Ag_mm2 = b_col_mm * h_col_mm
+
+    # --- 1. Diseño por Cortante (NSR-10 C.21.4.5) ---
+    Ve_capacidad_kN = 1.25 * (Mn_viga_izq_kNm + Mn_viga_der_kNm) / L_libre_vigas_m
+    Vu_diseno_kN = np.minimum(Vu_analisis_kN, Ve_capacidad_kN)
+    Vc_nulo = kn_to_n(Pu_kN) < 0.05 * Ag_mm2 * fc_MPa
+    Vc_kN = np.where(Vc_nulo, 0.0, n_to_kn(0.17 * np.sqrt(fc_MPa) * b_col_mm * h_col_mm))
+    Vs_req_kN = np.maximum(Vu_diseno_kN / PHI_CORTANTE_COL - Vc_kN, 0.0)
+
+    # --- 2. Diseño por Confinamiento (NSR-10 C.21.4.4) ---
+    lo = np.maximum.reduce([h_col_mm, b_col_mm, H_libre_col_m * 1000 / 6.0, np.full_like(h_col_mm, 450.0)])
+    bc_mm = b_col_mm - 2 * rec_libre_mm - diam_estribo_mm
+    hc_mm = h_col_mm - 2 * rec_libre_mm - diam_estribo_mm
+    Ach_mm2 = bc_mm * hc_mm
+    Ash_s_req1 = 0.3 * (Ag_mm2 / Ach_mm2 - 1) * (fc_MPa / fy_MPa) * bc_mm
+    Ash_s_req2 = 0.09 * (fc_MPa / fy_MPa) * bc_mm
+    Ash_s_requerido_mm2_por_mm = np.maximum(Ash_s_req1, Ash_s_req2)
+    s_confinado_max_mm = np.minimum(np.minimum(bc_mm, hc_mm) / 4.0, np.minimum(6 * diam_estribo_mm, 100.0))
+
+    # --- 3. Determinación del Espaciamiento Final (estribo de 2 ramas) ---
+    A_estribo_mm2 = 2 * (np.pi * (diam_estribo_mm / 2)**2)
+    with np.errstate(divide="ignore"):
+        s_por_confinamiento_mm = np.where(Ash_s_requerido_mm2_por_mm > 0, A_estribo_mm2 / Ash_s_requerido_mm2_por_mm, np.inf)
+    s_final_confinado_mm = np.minimum(s_por_confinamiento_mm, s_confinado_max_mm)
+    s_fuera_confinado_mm = np.minimum(2 * s_final_confinado_mm, H_libre_col_m * 1000 / 2)
+
+    return {
+        "status": "OK",
+        "Vu_diseno_kN": np.round(Vu_diseno_kN, 2),
+        "Ve_capacidad_kN": np.round(Ve_capacidad_kN, 2),
+        "Vc_kN": np.round(Vc_kN, 2),
+        "Vc_nulo": Vc_nulo,
+        "Vs_req_kN": np.round(Vs_req_kN, 2),
+        "longitud_confinamiento_lo_cm": np.round(mm_to_cm(lo), 1),
+        "Ash_s_req_mm2_por_m": np.round(Ash_s_requerido_mm2_por_mm * 1000, 2),
+        "s_max_confinado_mm": np.round(s_confinado_max_mm, 1),
+        "s_final_confinado_mm": np.round(np.floor(s_final_confinado_mm / 10) * 10, 0),
+        "s_fuera_confinado_mm": np.round(np.floor(s_fuera_confinado_mm / 10) * 10, 0),
+        "diam_estribo_usado_mm": diam_estribo_mm
+    }
@@ -5,8 +5,24 @@ import numpy as np
 from unidades import *
 from validate_positive import validate_positive
 from .diseno_vigas import diseno_viga_flexion_simple
+from .seleccion_barras import indice_barras_por_metro, seleccionar_barras
 
 PHI_FLEXION_LOSA = 0.90
+S_MIN_BARRAS_LOSA_CM = 7.5 # Separación mínima práctica entre barras de losa
+
+def _barras_por_metro(As_req_cm2_por_m, diam_barra_mm, s_max_cm):
+    """
+    Separación múltiplo de 2.5 cm (la mayor que cubre As_req, sin pasar de s_max_cm) con el
+    índice de seleccion_barras. Retorna (separación en cm, descripción) o (None, "") si As_req
+    pide una separación menor que S_MIN_BARRAS_LOSA_CM.
+    """
+    indice = indice_barras_por_metro((diam_barra_mm,), s_min_cm=min(S_MIN_BARRAS_LOSA_CM, s_max_cm), s_max_cm=s_max_cm)
+    if len(indice["area_mm2"]) == 0:
+        return None, ""
+    seleccion = seleccionar_barras(As_req_cm2_por_m, indice)
+    if seleccion["status"] != "OK":
+        return None, ""
+    return seleccion["separacion_cm"], seleccion["descripcion"]
 
 def diseno_losa_maciza_unidireccional(
     h_losa_cm,
@@ -76,6 +92,11 @@ def diseno_losa_maciza_unidireccional(
         if As_req_ppal_cm2_por_m <= cm2_to_mm2(0.0001): # Si es prácticamente cero
              s_final_ppal_cm = s_max_norma_ppal_cm
 
+        # Separación constructiva (múltiplo de 2.5 cm); si no hay, se conserva la calculada
+        s_barras_ppal_cm, barras_ppal = _barras_por_metro(As_req_ppal_cm2_por_m, diam_barra_ppal_mm, s_max_norma_ppal_cm)
+        if s_barras_ppal_cm is not None:
+            s_final_ppal_cm = s_barras_ppal_cm
+
         Ag_mm2_por_m = 1000 * cm_to_mm(h_losa_cm)
         
         rho_temp = 0.0018 if fy_MPa >= 420 else 0.0020
@@ -92,6 +113,9 @@ def diseno_losa_maciza_unidireccional(
             
         s_max_norma_temp_cm = min(5 * h_losa_cm, 45.0)
         s_final_temp_cm = min(s_calculado_temp_cm, s_max_norma_temp_cm)
+        s_barras_temp_cm, barras_temp = _barras_por_metro(mm2_to_cm2(As_req_temp_mm2_por_m), diam_barra_temp_mm, s_max_norma_temp_cm)
+        if s_barras_temp_cm is not None:
+            s_final_temp_cm = s_barras_temp_cm
 
         mensaje_h_min = ("Recordatorio: Verificar espesor mínimo de losa según Tabla C.9.5(a) "
                          "de la NSR-10 (ej. $L_n/20$ para apoyos simples, $L_n/24$ para un "
@@ -103,9 +127,11 @@ def diseno_losa_maciza_unidireccional(
             "As_req_ppal_cm2_por_m": round(As_req_ppal_cm2_por_m, 3),
             "espaciamiento_ppal_cm": round(s_final_ppal_cm, 1) if s_final_ppal_cm != float('inf') else "N/A (Máx. normativo)",
             "diam_barra_ppal_usada_mm": diam_barra_ppal_mm,
+            "barras_ppal": barras_ppal,
             "As_req_temp_cm2_por_m": round(mm2_to_cm2(As_req_temp_mm2_por_m), 3),
             "espaciamiento_temp_cm": round(s_final_temp_cm, 1) if s_final_temp_cm != float('inf') else "N/A (Máx. normativo)",
             "diam_barra_temp_usada_mm": diam_barra_temp_mm,
+            "barras_temp": barras_temp,
             "mensaje_espesor": mensaje_h_min,
             "d_efectivo_ppal_cm": round(mm_to_cm(d_efectivo_mm), 1)
         }
@@ -4,20 +4,14 @@
 import numpy as np
 from unidades import *
 from validate_positive import validate_positive
+from .constantes_concreto import ES_MPA, EPSILON_CU, beta1, calcular_phi
+from .seccion_fibras import seccion_fibras_rectangular, momento_nominal_uniaxial
+from .seleccion_barras import indice_capa_viga, seleccionar_barras
 
 PHI_FLEXION_VIGA = 0.90
 PHI_CORTANTE_VIGA = 0.75
-ES_MPA = 200000.0 # Módulo de elasticidad del acero
 LAMBDA_CONCRETO_VIGA = 1.0 # Para concreto de peso normal
 
-def _beta1_viga(fc_MPa):
-    """Calcula beta1 según NSR-10 C.10.2.7.3"""
-    if fc_MPa <= 28.0:
-        return 0.85
-    else:
-        beta = 0.85 - 0.05 * ((fc_MPa - 28.0) / 7.0)
-        return max(beta, 0.65)
-
 def calcular_peralte_efectivo_viga(h_cm, rec_libre_cm, diam_estribo_mm, diam_barra_long_mm):
     """Calcula el peralte efectivo 'd' en mm para vigas."""
     h_mm = cm_to_mm(h_cm)
@@ -27,6 +21,13 @@ def calcular_peralte_efectivo_viga(h_cm, rec_libre_cm, diam_estribo_mm, diam_bar
         raise ValueError("Peralte efectivo 'd' calculado es negativo o cero. Revise dimensiones y recubrimientos.")
     return d_mm
 
+# Códigos de estado de diseno_viga_flexion_simple_lote
+CODIGO_FLEXION_OK = 0
+CODIGO_FLEXION_CUANTIA_MINIMA = 1
+CODIGO_FLEXION_ERROR_PERALTE = 2
+CODIGO_FLEXION_ERROR_CAPACIDAD = 3
+ESTADOS_FLEXION = np.array(["OK", "Cuantía Mínima Controla", "Error", "Error"], dtype=object) # Indexado por código
+
 def diseno_viga_flexion_simple(
     b_cm, h_cm, rec_libre_cm,
     diam_estribo_mm, diam_barra_long_mm,
@@ -34,7 +35,9 @@ def diseno_viga_flexion_simple(
 ):
     """
     Diseño a flexión de viga rectangular.
-    Retorna un diccionario con As_req_cm2 y otros detalles.
+    Retorna un diccionario con As_req_cm2 y otros detalles, incluidos φ, φMn y εt de la sección
+    real con As_req (calcular_momento_nominal_viga, núcleo de fibras).
+    Para muchas secciones o momentos a la vez usar diseno_viga_flexion_simple_lote.
     """
     # Validación de parámetros:
     # diam_estribo_mm puede ser 0 (para losas), así que no se incluye en validate_positive.
@@ -47,64 +50,174 @@ def diseno_viga_flexion_simple(
     if not isinstance(diam_estribo_mm, (int, float)) or diam_estribo_mm < 0:
         raise ValueError(f"'diam_estribo_mm' debe ser un número no negativo, se recibió: {diam_estribo_mm}")
 
-    if Mu_kNm < 0: Mu_kNm = abs(Mu_kNm)
-    if Mu_kNm == 0: Mu_kNm = 1e-6
+    res = diseno_viga_flexion_simple_lote(b_cm, h_cm, rec_libre_cm, diam_estribo_mm, diam_barra_long_mm,
+                                          fc_MPa, fy_MPa, Mu_kNm)
+    resultado = {
+        "status": res["status"][0],
+        "As_req_cm2": float(res["As_req_cm2"][0]),
+        "rho_calculado": float(res["rho_calculado"][0]),
+        "d_mm": float(res["d_mm"][0]), # Devolver d_mm para que la función de losa pueda usarlo
+        "mensaje": res["mensaje"][0]
+    }
+    if res["codigo"][0] == CODIGO_FLEXION_ERROR_PERALTE:
+        resultado["d_mm"] = 0 # Estructura de error consistente
+    capacidad = {"status": "Error"}
+    if resultado["status"] != "Error" and resultado["As_req_cm2"] > 0:
+        capacidad = calcular_momento_nominal_viga(b_cm, h_cm, rec_libre_cm, diam_estribo_mm, diam_barra_long_mm,
+                                                  fc_MPa, fy_MPa, resultado["As_req_cm2"])
+    resultado.update({clave: float(capacidad[clave]) if capacidad["status"] == "OK" else None
+                      for clave in ("phi", "phi_Mn_kNm", "epsilon_t")})
+    return resultado
+
+def diseno_viga_flexion_simple_lote(
+    b_cm, h_cm, rec_libre_cm,
+    diam_estribo_mm, diam_barra_long_mm,
+    fc_MPa, fy_MPa, Mu_kNm
+):
+    """
+    Versión vectorizada de diseno_viga_flexion_simple: cada argumento es un escalar o un
+    arreglo y se combinan por broadcasting (una fila por sección y momento).
+    Retorna un diccionario de arreglos 1D: codigo (CODIGO_FLEXION_*), status, As_req_cm2,
+    rho_calculado, d_mm y mensaje. Las filas con error no detienen el cálculo de las demás.
+    """
+    b_cm, h_cm, rec_libre_cm, diam_estribo_mm, diam_barra_long_mm, fc_MPa, fy_MPa, Mu_kNm = (
+        np.atleast_1d(v) for v in np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (
+            b_cm, h_cm, rec_libre_cm, diam_estribo_mm, diam_barra_long_mm, fc_MPa, fy_MPa, Mu_kNm))))
+    for nombre, valor in (("b_cm", b_cm), ("h_cm", h_cm), ("rec_libre_cm", rec_libre_cm),
+                          ("diam_barra_long_mm", diam_barra_long_mm), ("fc_MPa", fc_MPa), ("fy_MPa", fy_MPa)):
+        if np.any(valor <= 0):
+            raise ValueError(f"'{nombre}' debe ser positivo en todas las filas")
+    if np.any(diam_estribo_mm < 0):
+        raise ValueError("'diam_estribo_mm' debe ser no negativo en todas las filas")
+
+    Mu_kNm = np.abs(Mu_kNm)
+    Mu_kNm = np.where(Mu_kNm == 0, 1e-6, Mu_kNm)
+    b_mm = cm_to_mm(b_cm)
+    d_mm = cm_to_mm(h_cm) - cm_to_mm(rec_libre_cm) - diam_estribo_mm - diam_barra_long_mm / 2.0
+    peralte_ok = d_mm > 0
+    d_calculo = np.where(peralte_ok, d_mm, 1.0) # Evita divisiones por cero en las filas con error
+
+    k_rn = knm_to_nmm(Mu_kNm) / (PHI_FLEXION_VIGA * b_mm * d_calculo**2)
+    discriminante = 1.0 - (2.0 * k_rn) / (0.85 * fc_MPa)
+    capacidad_ok = discriminante >= 0
+    rho_req = (0.85 * fc_MPa / fy_MPa) * (1.0 - np.sqrt(np.maximum(discriminante, 0.0)))
+    rho_min = np.maximum(0.25 * np.sqrt(fc_MPa) / fy_MPa, 1.4 / fy_MPa)
+    rho_final = np.maximum(rho_req, rho_min)
+
+    codigo = np.select([~peralte_ok, ~capacidad_ok, rho_req < rho_min],
+                       [CODIGO_FLEXION_ERROR_PERALTE, CODIGO_FLEXION_ERROR_CAPACIDAD, CODIGO_FLEXION_CUANTIA_MINIMA],
+                       CODIGO_FLEXION_OK).astype(np.int8)
+    rho_final = np.select([~peralte_ok, ~capacidad_ok], [0.0, np.inf], rho_final)
+    As_req_cm2 = mm2_to_cm2(rho_final * b_mm * np.where(peralte_ok, d_mm, 0.0))
+
+    mensaje = np.where(codigo == CODIGO_FLEXION_CUANTIA_MINIMA, "Cuantía mínima controla el diseño a flexión.",
+                       "Cálculo de flexión completado.").astype(object)
+    mensaje[codigo == CODIGO_FLEXION_ERROR_PERALTE] = (
+        "Peralte efectivo 'd' calculado es negativo o cero. Revise dimensiones y recubrimientos.")
+    for i in np.nonzero(codigo == CODIGO_FLEXION_ERROR_CAPACIDAD)[0]: # Solo las filas que fallan
+        mensaje[i] = f"Momento Mu ({Mu_kNm[i]:.1f} kNm) excede capacidad (k_Rn={k_rn[i]:.2f} MPa). Aumentar sección."
+
+    return {
+        "codigo": codigo,
+        "status": ESTADOS_FLEXION[codigo],
+        "As_req_cm2": As_req_cm2,
+        "rho_calculado": rho_final,
+        "d_mm": d_mm,
+        "mensaje": mensaje,
+    }
+
+def calcular_momento_nominal_viga(
+    b_cm, h_cm, rec_libre_cm,
+    diam_estribo_mm, diam_barra_long_mm,
+    fc_MPa, fy_MPa, As_traccion_cm2, As_compresion_cm2=0.0
+):
+    """
+    Momento nominal Mn de viga rectangular con el acero provisto (compatibilidad de
+    deformaciones sobre la sección de fibras compartida con columnas y nervios).
+    El acero a compresión se ubica a d' = rec + estribo + db/2 de la fibra comprimida.
+    Retorna un diccionario con Mn_kNm, phi y phi_Mn_kNm.
+    """
+    validate_positive(b_cm=b_cm, h_cm=h_cm, rec_libre_cm=rec_libre_cm, diam_barra_long_mm=diam_barra_long_mm,
+                      fc_MPa=fc_MPa, fy_MPa=fy_MPa, As_traccion_cm2=As_traccion_cm2)
+    if As_compresion_cm2 < 0:
+        raise ValueError(f"'As_compresion_cm2' debe ser no negativo, se recibió: {As_compresion_cm2}")
 
     b_mm = cm_to_mm(b_cm)
+    h_mm = cm_to_mm(h_cm)
     try:
-        # calcular_peralte_efectivo_viga maneja diam_estribo_mm = 0 correctamente
         d_mm = calcular_peralte_efectivo_viga(h_cm, rec_libre_cm, diam_estribo_mm, diam_barra_long_mm)
     except ValueError as e:
-        return {"status": "Error", "mensaje": str(e), "As_req_cm2": 0, "rho_calculado": 0, "d_mm": 0} # Estructura de error consistente
+        return {"status": "Error", "mensaje": str(e)}
+    d_prima_mm = h_mm - d_mm
 
-    Mu_Nmm = knm_to_nmm(Mu_kNm)
-    
-    k_rn_val = 0 # Inicializar por si d_mm es cero y no se calcula k
-    if d_mm > 0: # Evitar división por cero si d_mm fuera cero (aunque calcular_peralte_efectivo_viga ya lo valida)
-        k_rn_val = Mu_Nmm / (PHI_FLEXION_VIGA * b_mm * d_mm**2)
-    else: # d_mm es cero o negativo
-        return {
-            "status": "Error",
-            "mensaje": "Peralte efectivo 'd' es cero o negativo después del cálculo.",
-            "As_req_cm2": float('inf'), "rho_calculado": float('inf'), "d_mm": d_mm
-        }
+    # Cada capa de refuerzo se modela como una fibra de acero (flexión alrededor de X)
+    barras = [{'x': 0.0, 'y': h_mm / 2.0 - d_mm, 'area': cm2_to_mm2(As_traccion_cm2)}]
+    if As_compresion_cm2 > 0:
+        barras.append({'x': 0.0, 'y': h_mm / 2.0 - d_prima_mm, 'area': cm2_to_mm2(As_compresion_cm2)})
+    seccion = seccion_fibras_rectangular(b_mm, h_mm, barras, n_fibras_x=1, n_fibras_y=200)
 
-    # Renombrar 'k' para evitar posible conflicto con 'k_rn_val' si se usara 'k' para otra cosa.
-    # Usaremos k_rn = k_rn_val
-    
-    discriminante = 1.0 - (2.0 * k_rn_val) / (0.85 * fc_MPa)
-    if discriminante < 0:
-        return {
-            "status": "Error",
-            "mensaje": f"Momento Mu ({Mu_kNm:.1f} kNm) excede capacidad (k_Rn={k_rn_val:.2f} MPa). Aumentar sección.",
-            "As_req_cm2": float('inf'), "rho_calculado": float('inf'), "d_mm": d_mm
-        }
-        
-    rho_req = (0.85 * fc_MPa / fy_MPa) * (1.0 - np.sqrt(discriminante))
-    As_req_mm2 = rho_req * b_mm * d_mm
-
-    rho_min1 = 0.25 * np.sqrt(fc_MPa) / fy_MPa if fy_MPa > 0 else 0
-    rho_min2 = 1.4 / fy_MPa if fy_MPa > 0 else 0
-    rho_min = max(rho_min1, rho_min2)
-    As_min_mm2 = rho_min * b_mm * d_mm
-    
-    As_final_mm2 = max(As_req_mm2, As_min_mm2)
-    status_flex = "OK"
-    mensaje_detallado = "Cálculo de flexión completado."
-    if As_final_mm2 == As_min_mm2 and As_req_mm2 < As_min_mm2:
-        status_flex = "Cuantía Mínima Controla"
-        mensaje_detallado = "Cuantía mínima controla el diseño a flexión."
-    
-    rho_final_calculado = As_final_mm2 / (b_mm * d_mm) if (b_mm * d_mm) > 0 else 0
+    try:
+        res = momento_nominal_uniaxial(seccion, fc_MPa, fy_MPa)
+    except ValueError as e:
+        return {"status": "Error", "mensaje": str(e)}
 
+    phi = float(calcular_phi(res["epsilon_t"]))
+    Mn_kNm = nmm_to_knm(res["Mn_Nmm"])
     return {
-        "status": status_flex,
-        "As_req_cm2": mm2_to_cm2(As_final_mm2),
-        "rho_calculado": rho_final_calculado,
-        "d_mm": d_mm, # Devolver d_mm para que la función de losa pueda usarlo
-        "mensaje": mensaje_detallado
+        "status": "OK",
+        "Mn_kNm": Mn_kNm,
+        "phi": phi,
+        "phi_Mn_kNm": phi * Mn_kNm,
+        "c_mm": res["c_mm"],
+        "epsilon_t": res["epsilon_t"],
+        "d_mm": d_mm,
+        "mensaje": "Momento nominal calculado con sección de fibras."
     }
 
+def _momento_nominal_whitney(b_mm, d_mm, d_prima_mm, fc_MPa, fy_MPa, As_mm2, As_prima_mm2):
+    """
+    Mn (N·mm) de viga rectangular doblemente reforzada con el bloque de Whitney, en forma
+    cerrada por compatibilidad de deformaciones: cada capa trabaja con fs = Es·0.003·(c - di)/c
+    limitado a ±fy (el acero a tracción no se supone en fluencia) y el acero dentro del bloque
+    descuenta el concreto desplazado (0.85·f'c). Entre quiebres consecutivos de c el estado de
+    las dos capas no cambia y el equilibrio C = T·c es cuadrático en c, igual que en
+    _c_para_carga_axial de diseno_columna. Retorna (Mn_Nmm, epsilon_t).
+    """
+    beta_1 = beta1(fc_MPa)
+    epsilon_y = fy_MPa / ES_MPA
+    d_capas = np.array([d_prima_mm, d_mm])
+    A_capas = np.array([As_prima_mm2, As_mm2])
+
+    def esfuerzos(c): # fs (compresión positiva) de cada capa para cada c (c x capas)
+        c = np.asarray(c, dtype=float)[..., None]
+        fs = np.minimum(np.maximum(ES_MPA * EPSILON_CU * (c - d_capas) / c, -fy_MPa), fy_MPa)
+        return fs - np.where(d_capas <= beta_1 * c, 0.85 * fc_MPa, 0.0)
+
+    # Quiebres de c (entrada al bloque y fluencia de cada capa) dentro de (0, d]; en c = d la
+    # capa a tracción no tiene deformación y la fuerza neta es de compresión
+    quiebres = np.concatenate([d_capas / beta_1, d_capas * EPSILON_CU / (EPSILON_CU + epsilon_y),
+                               d_capas * EPSILON_CU / (EPSILON_CU - epsilon_y) if EPSILON_CU > epsilon_y else []])
+    quiebres = np.unique(np.concatenate([[1e-6 * d_mm], quiebres[(quiebres > 1e-6 * d_mm) & (quiebres < d_mm)], [d_mm]]))
+    P_quiebres = 0.85 * fc_MPa * b_mm * beta_1 * quiebres + esfuerzos(quiebres) @ A_capas
+    k = min(max(int(np.searchsorted(P_quiebres, 0.0)), 1), len(quiebres) - 1)
+    c_lo, c_hi = quiebres[k - 1], quiebres[k]
+    c_m = 0.5 * (c_lo + c_hi)
+
+    # P·c = k2 c² + k1 c + k0 en el tramo; pasa de negativo a positivo y es convexo: raíz mayor
+    epsilon_m = EPSILON_CU * (c_m - d_capas) / c_m
+    elastica = np.abs(ES_MPA * epsilon_m) < fy_MPa
+    k2 = 0.85 * fc_MPa * b_mm * beta_1
+    k1 = np.where(elastica, ES_MPA * EPSILON_CU, np.sign(epsilon_m) * fy_MPa) @ A_capas \
+        - (d_capas <= beta_1 * c_m) @ A_capas * 0.85 * fc_MPa
+    k0 = -np.where(elastica, ES_MPA * EPSILON_CU * d_capas, 0.0) @ A_capas
+    c = (-k1 + np.sqrt(max(k1**2 - 4.0 * k2 * k0, 0.0))) / (2.0 * k2)
+    c = min(max(c, c_lo), c_hi)
+
+    a = beta_1 * c
+    fs_prima = esfuerzos(c)[0]
+    Mn_Nmm = 0.85 * fc_MPa * b_mm * a * (d_mm - a / 2.0) + As_prima_mm2 * fs_prima * (d_mm - d_prima_mm)
+    return Mn_Nmm, EPSILON_CU * (d_mm - c) / c
+
 def diseno_viga_cortante_estandar(
     b_cm, h_cm, rec_libre_cm,
     diam_estribo_mm, diam_barra_long_mm,
@@ -217,9 +330,12 @@ def diseno_viga_dmo(
 
 
     # 2. Diseño por Flexión y Verificación de Cuantías (NSR-10 C.21.3.2)
-    flex_neg_ext = diseno_viga_flexion_simple(b_cm, h_cm, rec_libre_cm, diam_estribo_mm, diam_barra_long_principal_mm, fc_MPa, fy_MPa_long, Mu_neg_ext_kNm)
-    flex_pos = diseno_viga_flexion_simple(b_cm, h_cm, rec_libre_cm, diam_estribo_mm, diam_barra_long_principal_mm, fc_MPa, fy_MPa_long, Mu_pos_kNm)
-    flex_neg_int = diseno_viga_flexion_simple(b_cm, h_cm, rec_libre_cm, diam_estribo_mm, diam_barra_long_principal_mm, fc_MPa, fy_MPa_long, Mu_neg_int_kNm)
+    # Las tres secciones en una sola llamada vectorizada
+    flex = diseno_viga_flexion_simple_lote(b_cm, h_cm, rec_libre_cm, diam_estribo_mm, diam_barra_long_principal_mm, fc_MPa, fy_MPa_long,
+                                           [Mu_neg_ext_kNm, Mu_pos_kNm, Mu_neg_int_kNm])
+    flex_neg_ext, flex_pos, flex_neg_int = ({"status": flex["status"][i], "As_req_cm2": float(flex["As_req_cm2"][i]),
+                                             "rho_calculado": float(flex["rho_calculado"][i]), "mensaje": flex["mensaje"][i]}
+                                            for i in range(3))
 
     if any(f['status'] == "Error" for f in [flex_neg_ext, flex_pos, flex_neg_int]):
         return {"status": "Error", "mensaje_global": "Error en diseño a flexión. " + flex_neg_ext.get('mensaje', '') + flex_pos.get('mensaje', '') + flex_neg_int.get('mensaje', '')}
@@ -243,6 +359,36 @@ def diseno_viga_dmo(
     # Se asume que Mu_pos_kNm ya considera el momento mínimo en la cara si es aplicable.
     # O se podría verificar As_req_pos_cm2 vs 0.5 * As_req_neg_ext/int_cm2
 
+    # Acero provisto: una capa de barras de diam_barra_long_principal_mm (la más liviana que cubre
+    # As_req). Si no cabe en una capa, Mn se calcula con As_req, la descripción queda vacía y se
+    # advierte en mensaje_armado.
+    try:
+        indice = indice_capa_viga(b_cm, rec_libre_cm, diam_estribo_mm, diametros_mm=(diam_barra_long_principal_mm,))
+    except ValueError:
+        indice = None
+    caras_sin_capa = []
+    for cara, flex_res in (("neg_ext", flex_neg_ext), ("pos", flex_pos), ("neg_int", flex_neg_int)):
+        seleccion = seleccionar_barras(flex_res['As_req_cm2'], indice) if indice is not None else {"status": "Error"}
+        flex_res['una_capa'] = seleccion['status'] == "OK"
+        flex_res['barras'] = seleccion['descripcion'] if flex_res['una_capa'] else ""
+        flex_res['As_prov_cm2'] = seleccion['As_prov_cm2'] if flex_res['una_capa'] else flex_res['As_req_cm2']
+        if not flex_res['una_capa']:
+            caras_sin_capa.append(cara)
+    mensaje_armado = ""
+    if caras_sin_capa:
+        mensaje_armado = (f"ADVERTENCIA: As requerido en {', '.join(caras_sin_capa)} no cabe en una capa de barras de "
+                          f"{diam_barra_long_principal_mm:g} mm; Mn de esas caras calculado con As_req.")
+
+    # Momentos nominales en las caras con el acero provisto (para columna fuerte - viga débil),
+    # bloque de Whitney en forma cerrada. El acero de la cara opuesta trabaja a compresión.
+    d_prima_mm = h_mm - d_mm
+    Mn_caras = {}
+    for nombre, As_t, As_c in (("Mn_neg_ext_kNm", flex_neg_ext, flex_pos), ("Mn_pos_kNm", flex_pos, flex_neg_ext),
+                               ("Mn_neg_int_kNm", flex_neg_int, flex_pos)):
+        Mn_Nmm, _ = _momento_nominal_whitney(b_mm, d_mm, d_prima_mm, fc_MPa, fy_MPa_long,
+                                          cm2_to_mm2(As_t['As_prov_cm2']), cm2_to_mm2(As_c['As_prov_cm2']))
+        Mn_caras[nombre] = round(float(nmm_to_knm(Mn_Nmm)), 2)
+
     # 3. Diseño por Cortante (NSR-10 C.21.3.4)
     # Cortante probable Ve
     # Mpr = Momento probable de la viga en la cara del nudo, con fy -> 1.25fy y phi=1.0
@@ -333,11 +479,19 @@ def diseno_viga_dmo(
 
     return {
         "status": "OK",
-        "mensaje_global": "Diseño DMO de viga completado.",
-        "flexion_neg_ext": {"As_req_cm2": flex_neg_ext['As_req_cm2'], "rho": flex_neg_ext['rho_calculado']},
-        "flexion_pos": {"As_req_cm2": flex_pos['As_req_cm2'], "rho": flex_pos['rho_calculado']},
-        "flexion_neg_int": {"As_req_cm2": flex_neg_int['As_req_cm2'], "rho": flex_neg_int['rho_calculado']},
+        "mensaje_global": "Diseño DMO de viga completado." + (f" {mensaje_armado}" if mensaje_armado else ""),
+        "flexion_neg_ext": {"As_req_cm2": flex_neg_ext['As_req_cm2'], "rho": flex_neg_ext['rho_calculado'],
+                           "As_prov_cm2": flex_neg_ext['As_prov_cm2'], "barras": flex_neg_ext['barras'],
+                           "una_capa": flex_neg_ext['una_capa']},
+        "flexion_pos": {"As_req_cm2": flex_pos['As_req_cm2'], "rho": flex_pos['rho_calculado'],
+                           "As_prov_cm2": flex_pos['As_prov_cm2'], "barras": flex_pos['barras'],
+                           "una_capa": flex_pos['una_capa']},
+        "flexion_neg_int": {"As_req_cm2": flex_neg_int['As_req_cm2'], "rho": flex_neg_int['rho_calculado'],
+                           "As_prov_cm2": flex_neg_int['As_prov_cm2'], "barras": flex_neg_int['barras'],
+                           "una_capa": flex_neg_int['una_capa']},
         "mensaje_cuantia": mensaje_cuantia,
+        "mensaje_armado": mensaje_armado,
+        **Mn_caras,
         "cortante_diseno_Ve_ext_kN": round(Ve_ext_kN, 2),
         "cortante_diseno_Ve_int_kN": round(Ve_int_kN, 2),
         "Vs_requerido_max_kN": round(n_to_kn(Vs_req_max_N), 2),
@@ -346,4 +500,142 @@ def diseno_viga_dmo(
         "espaciamiento_zona_confinada_cm": round(mm_to_cm(s_final_confinado_mm), 1),
         "espaciamiento_zona_central_cm": round(mm_to_cm(s_final_central_mm), 1),
         "d_usado_cm": round(mm_to_cm(d_mm),1)
-    }
\ No newline at end of file
+    }
+
+
+def _zonas_contiguas(S):
+    """Zonas (tramos contiguos de igual separación) de cada viga: id global por intervalo y viga de cada zona."""
+    inicio = np.ones(S.shape, dtype=bool)
+    inicio[:, 1:] = S[:, 1:] != S[:, :-1]
+    zona = np.cumsum(inicio.ravel()) - 1 # Cada fila empieza zona: las zonas nunca cruzan vigas
+    viga_zona = np.nonzero(inicio)[0]
+    return zona, viga_zona, inicio
+
+def zonificar_estribos_vigas(
+    x_m, Vu_kN, b_cm, h_cm, rec_libre_cm, diam_estribo_mm, diam_barra_long_mm,
+    fc_MPa, fy_MPa_estribos, num_ramas=2, paso_mm=25.0, longitud_min_zona_m=0.5, max_zonas=5):
+    """
+    Zonas de estribos a lo largo de la luz libre a partir del cortante muestreado, para
+    todas las vigas de un cuadro a la vez.
+    - x_m, Vu_kN: (vigas x estaciones), x desde la cara del apoyo izquierdo (0) hasta ln
+      (ver analizar_viga_continua); un vector se toma como una sola viga.
+    - Los demás parámetros son escalares o un valor por viga.
+    En cada estación: Vs = Vu/φ - Vc, con Vc = 0 dentro de 2h de cada cara (zona confinada
+    DMO, C.21.3.3) y 0.17·λ·√f'c·b·d fuera; Av/s >= mínimo de C.11.4.6.3; s <= d/2 (d/4 si
+    Vs > 0.33·√f'c·b·d) y, en la zona confinada, s <= min(d/4, 8·db, 24·de, 300 mm).
+    Cada intervalo entre estaciones usa la menor separación de sus extremos (Vu lineal entre
+    muestras), redondeada hacia abajo a múltiplo de paso_mm. Luego se unen zonas vecinas,
+    siempre hacia la menor separación (nunca se relaja un requisito), eligiendo en cada paso
+    la unión que agrega menos estribos, hasta que ninguna zona mide menos de
+    longitud_min_zona_m y hay a lo sumo max_zonas por viga.
+    Retorna separación por intervalo, zonas de cada viga (inicio, fin, s, cantidad,
+    confinada), cantidad y peso total de estribos por viga, y cumplimiento de Vs <= Vs_max y s >= 50 mm.
+    """
+    x = np.atleast_2d(np.asarray(x_m, dtype=float))
+    Vu = np.abs(np.atleast_2d(np.asarray(Vu_kN, dtype=float)))
+    if x.shape != Vu.shape or x.shape[1] < 2:
+        return {"status": "Error", "mensaje": "x_m y Vu_kN deben tener la misma forma (vigas x estaciones, al menos 2)."}
+    if np.any(np.diff(x, axis=1) <= 0):
+        return {"status": "Error", "mensaje": "Las estaciones x_m deben ser crecientes en cada viga."}
+    num_vigas = x.shape[0]
+    b_cm, h_cm, rec_libre_cm, diam_estribo_mm, diam_barra_long_mm, fc_MPa, fy_MPa_estribos, num_ramas = (
+        np.broadcast_to(np.asarray(v, dtype=float), (num_vigas,))[:, None] for v in (
+            b_cm, h_cm, rec_libre_cm, diam_estribo_mm, diam_barra_long_mm, fc_MPa, fy_MPa_estribos, num_ramas))
+    for nombre, valor in (("b_cm", b_cm), ("h_cm", h_cm), ("rec_libre_cm", rec_libre_cm), ("diam_estribo_mm", diam_estribo_mm),
+                          ("diam_barra_long_mm", diam_barra_long_mm), ("fc_MPa", fc_MPa), ("fy_MPa_estribos", fy_MPa_estribos)):
+        if np.any(valor <= 0):
+            raise ValueError(f"'{nombre}' debe ser positivo en todas las vigas")
+
+    b_mm, h_mm = cm_to_mm(b_cm), cm_to_mm(h_cm)
+    d_mm = h_mm - cm_to_mm(rec_libre_cm) - diam_estribo_mm - diam_barra_long_mm / 2.0
+    if np.any(d_mm <= 0):
+        raise ValueError("Peralte efectivo 'd' calculado es negativo o cero en alguna viga.")
+    x_mm = m_to_mm(x)
+    ln_mm = x_mm[:, -1:]
+    confinada = (x_mm < 2.0 * h_mm) | (x_mm > ln_mm - 2.0 * h_mm) # Por estación
+
+    # 1) Separación requerida en cada estación
+    raiz_fc = LAMBDA_CONCRETO_VIGA * np.sqrt(fc_MPa)
+    Vc_N = np.where(confinada, 0.0, 0.17 * raiz_fc * b_mm * d_mm)
+    Vs_req_N = np.maximum(kn_to_n(Vu) / PHI_CORTANTE_VIGA - Vc_N, 0.0)
+    Av_mm2 = num_ramas * np.pi * (diam_estribo_mm / 2.0)**2
+    Av_s_min = np.maximum(0.062 * np.sqrt(fc_MPa), 0.35) * b_mm / fy_MPa_estribos
+    Av_s_req = np.maximum(Vs_req_N / (fy_MPa_estribos * d_mm), Av_s_min)
+    s_max = np.where(Vs_req_N > 0.33 * raiz_fc * b_mm * d_mm, d_mm / 4.0, d_mm / 2.0)
+    so_mm = np.minimum(np.minimum(d_mm / 4.0, 8.0 * diam_barra_long_mm), np.minimum(24.0 * diam_estribo_mm, 300.0))
+    s_max = np.where(confinada, np.minimum(s_max, so_mm), s_max)
+    s_estacion = np.minimum(Av_mm2 / Av_s_req, s_max)
+    cumple = np.all(Vs_req_N <= 0.66 * raiz_fc * b_mm * d_mm, axis=1)
+
+    # 2) Intervalos entre estaciones: la menor separación de los extremos, redondeada
+    S = np.floor(np.minimum(s_estacion[:, :-1], s_estacion[:, 1:]) / paso_mm) * paso_mm
+    cumple &= np.all(S >= 50.0, axis=1)
+    S = np.maximum(S, 50.0) # Mínimo práctico
+    dx = np.diff(x_mm, axis=1)
+    confinado_intervalo = confinada[:, :-1] | confinada[:, 1:]
+    longitud_min_mm = m_to_mm(longitud_min_zona_m)
+
+    # 3) Unión de zonas: una por viga y por iteración (la de menor costo), todas las vigas a la vez
+    while True:
+        zona, viga_zona, inicio = _zonas_contiguas(S)
+        num_zonas = len(viga_zona)
+        largo = np.bincount(zona, weights=dx.ravel(), minlength=num_zonas)
+        s_zona = S[inicio]
+        cantidad = largo / s_zona
+        costo = np.full(num_zonas, np.inf)
+        vecina = np.full(num_zonas, -1)
+        for desplazamiento in (-1, 1): # Vecina izquierda y derecha en la misma viga
+            j = np.arange(num_zonas) + desplazamiento
+            valida = (j >= 0) & (j < num_zonas)
+            valida[valida] &= viga_zona[j[valida]] == viga_zona[valida]
+            jv = np.where(valida, j, 0)
+            c = np.where(valida, (largo + largo[jv]) / np.minimum(s_zona, s_zona[jv]) - cantidad - cantidad[jv], np.inf)
+            mejor = c < costo
+            costo, vecina = np.where(mejor, c, costo), np.where(mejor, jv, vecina)
+        zonas_por_viga = np.bincount(viga_zona, minlength=num_vigas)
+        corta = largo < longitud_min_mm
+        clave = np.where(corta | (zonas_por_viga[viga_zona] > max_zonas), costo + np.where(corta, 0.0, 1e12), np.inf)
+        minimo = np.full(num_vigas, np.inf)
+        np.minimum.at(minimo, viga_zona, clave)
+        candidatas = np.flatnonzero(np.isfinite(clave) & (clave == minimo[viga_zona]))
+        if len(candidatas) == 0:
+            break
+        _, primera = np.unique(viga_zona[candidatas], return_index=True)
+        elegidas = candidatas[primera]
+        nueva = np.minimum(s_zona[elegidas], s_zona[vecina[elegidas]])
+        s_zona[elegidas] = nueva
+        s_zona[vecina[elegidas]] = nueva
+        S = s_zona[zona].reshape(S.shape)
+
+    # 4) Zonas finales, cantidades y peso (estribo cerrado con ganchos de 135°: 2·max(6·de, 75 mm))
+    zona, viga_zona, inicio = _zonas_contiguas(S)
+    largo = np.bincount(zona, weights=dx.ravel())
+    s_zona = S[inicio]
+    cantidad = np.ceil(largo / s_zona - 1e-9).astype(int)
+    zona_confinada = np.bincount(zona, weights=confinado_intervalo.ravel()) > 0
+    x_inicio = x[:, :-1][inicio]
+    x_fin = x_inicio + mm_to_m(largo)
+    zonas = [[] for _ in range(num_vigas)]
+    for k in range(len(viga_zona)):
+        zonas[viga_zona[k]].append({"x_inicio_m": round(float(x_inicio[k]), 3), "x_fin_m": round(float(x_fin[k]), 3),
+                                    "s_mm": float(s_zona[k]), "num_estribos": int(cantidad[k]), "confinada": bool(zona_confinada[k])})
+    num_estribos = np.bincount(viga_zona, weights=cantidad, minlength=num_vigas).astype(int)
+    de = diam_estribo_mm[:, 0]
+    recubrimiento_mm = cm_to_mm(rec_libre_cm[:, 0])
+    longitud_estribo_mm = (2.0 * (b_mm[:, 0] - 2.0 * recubrimiento_mm - de) + 2.0 * (h_mm[:, 0] - 2.0 * recubrimiento_mm - de)
+                           + 2.0 * np.maximum(6.0 * de, 75.0))
+    peso_kg = num_estribos * longitud_estribo_mm * np.pi * (de / 2.0)**2 * 7.85e-6 # 7850 kg/m³
+
+    num_fallas = int(np.count_nonzero(~cumple))
+    return {
+        "status": "OK",
+        "mensaje": "Zonificación de estribos completada." if num_fallas == 0 else
+                   f"{num_fallas} vigas con Vs > Vs_max o separación requerida < 50 mm. Redimensionar.",
+        "s_intervalo_mm": S,
+        "zonas": zonas,
+        "num_zonas": np.bincount(viga_zona, minlength=num_vigas),
+        "num_estribos": num_estribos,
+        "longitud_estribo_cm": mm_to_cm(longitud_estribo_mm),
+        "peso_estribos_kg": peso_kg,
+        "cumple": cumple,
+    }
@@ -4,6 +4,7 @@
 import numpy as np
 from unidades import *
 from validate_positive import validate_positive
+from .seleccion_barras import indice_barras_por_metro, seleccionar_barras
 
 # Asumiendo algunas constantes 
 PHI_FLEXION_ZAP = 0.90
@@ -359,6 +360,14 @@ def diseno_zapata_aislada_v2(
     As_L_final_mm2_per_m = As_L_final_mm2 / B_m if B_m > 0 else 0
     As_B_final_mm2_per_m = As_B_final_mm2 / L_m if L_m > 0 else 0
 
+    # Separación constructiva (múltiplo de 2.5 cm) con s <= min(3h, 45 cm) (NSR-10 C.7.6.5)
+    indice_barras = indice_barras_por_metro((diam_barra_zapata_mm,), s_max_cm=min(3.0 * mm_to_cm(h_final_mm), 45.0))
+    armado = {}
+    for direccion, As_mm2_per_m in (("L", As_L_final_mm2_per_m), ("B", As_B_final_mm2_per_m)):
+        seleccion = seleccionar_barras(mm2_to_cm2(As_mm2_per_m), indice_barras)
+        armado[direccion] = ({"barras": seleccion["descripcion"], "separacion_cm": seleccion["separacion_cm"]}
+                             if seleccion["status"] == "OK" else {"barras": "", "separacion_cm": None})
+
     return {
         "status": "OK",
         "mensaje": "Diseño de zapata completado.",
@@ -370,8 +379,8 @@ def diseno_zapata_aislada_v2(
         "chequeo_cortante_unidir_B": resultados_cortante_uni_B,
         "chequeo_punzonamiento": resultados_punzonamiento,
         "refuerzo_flexion": {
-            "dir_L_paralelo_a_B": {"As_total_cm2": round(As_L_final_mm2/100,2), "As_cm2_per_m": round(As_L_final_mm2_per_m/100,2)},
-            "dir_B_paralelo_a_L": {"As_total_cm2": round(As_B_final_mm2/100,2), "As_cm2_per_m": round(As_B_final_mm2_per_m/100,2)},
+            "dir_L_paralelo_a_B": {"As_total_cm2": round(As_L_final_mm2/100,2), "As_cm2_per_m": round(As_L_final_mm2_per_m/100,2), **armado["L"]},
+            "dir_B_paralelo_a_L": {"As_total_cm2": round(As_B_final_mm2/100,2), "As_cm2_per_m": round(As_B_final_mm2_per_m/100,2), **armado["B"]},
             "As_min_temp_cm2_per_m": round(rho_min_temp * h_final_mm * 1000 / 100, 2) # cm2/m
         }
     }
@@ -0,0 +1,145 @@
+# ==============================================================================
+# EFECTOS DE ESBELTEZ EN COLUMNAS - MAGNIFICACIÓN DE MOMENTOS (NSR-10 C.10.10)
+# ==============================================================================
+import numpy as np
+from unidades import *
+
+PHI_RIGIDEZ = 0.75 # Factor de reducción de rigidez en δns y δs (NSR-10 C.10.10.6)
+LIMITE_SEGUNDO_ORDEN = 1.4 # Relación máxima momento de segundo orden / primer orden (NSR-10 C.10.10.2.1)
+
+def _positivos(**arreglos):
+    """Versión para arreglos de validate_positive."""
+    for nombre, valor in arreglos.items():
+        if np.any(np.asarray(valor) <= 0):
+            raise ValueError(f"'{nombre}' debe ser positivo en todas las columnas")
+
+def factor_k_no_desplazable(psi_sup, psi_inf):
+    """Factor de longitud efectiva para pórticos arriostrados (NSR-10 CR.10.10.1, ecuaciones de Furlong)."""
+    psi_sup, psi_inf = np.asarray(psi_sup, dtype=float), np.asarray(psi_inf, dtype=float)
+    k = np.minimum(0.7 + 0.05 * (psi_sup + psi_inf), 0.85 + 0.05 * np.minimum(psi_sup, psi_inf))
+    return np.minimum(k, 1.0)
+
+def factor_k_desplazable(psi_sup, psi_inf):
+    """Factor de longitud efectiva para pórticos no arriostrados (NSR-10 CR.10.10.1)."""
+    psi_m = (np.asarray(psi_sup, dtype=float) + np.asarray(psi_inf, dtype=float)) / 2.0
+    return np.where(psi_m < 2.0, (20.0 - psi_m) / 20.0 * np.sqrt(1.0 + psi_m), 0.9 * np.sqrt(1.0 + psi_m))
+
+def carga_critica_pandeo(b_cm, h_cm, fc_MPa, k, lu_m, beta_d):
+    """
+    Pc = π²·EI/(k·lu)² en kN con EI = 0.4·Ec·Ig/(1 + βd) (NSR-10 C.10.10.6.1),
+    Ec = 4700·√f'c e Ig = b·h³/12 (h en el plano de flexión). Retorna (Pc_kN, EI_Nmm2).
+    """
+    Ig_mm4 = cm_to_mm(b_cm) * cm_to_mm(h_cm)**3 / 12.0
+    EI_Nmm2 = 0.4 * 4700.0 * np.sqrt(fc_MPa) * Ig_mm4 / (1.0 + beta_d)
+    Pc_N = np.pi**2 * EI_Nmm2 / (k * m_to_mm(lu_m))**2
+    return n_to_kn(Pc_N), EI_Nmm2
+
+def _magnificador(Pu_kN, Pc_kN, Cm=1.0):
+    """Cm/(1 - Pu/(0.75·Pc)) >= 1; infinito si Pu >= 0.75·Pc (inestable)."""
+    denominador = 1.0 - Pu_kN / (PHI_RIGIDEZ * Pc_kN)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        delta = np.where(denominador > 0, Cm / denominador, np.inf)
+    return np.maximum(delta, 1.0)
+
+def efectos_esbeltez_columnas(
+    b_cm, h_cm, fc_MPa, lu_m, Pu_kN, M1_kNm, M2_kNm, psi_sup, psi_inf,
+    desplazable=False, M1s_kNm=0.0, M2s_kNm=0.0, grupo_piso=None,
+    beta_dns=0.6, beta_ds=0.0, cargas_transversales=False):
+    """
+    Magnificación de momentos por esbeltez (NSR-10 C.10.10) para todas las columnas a la vez.
+    Todos los argumentos aceptan escalares o arreglos (se combinan por broadcasting); cada
+    elemento es una columna en una combinación y una dirección de flexión.
+
+    - h_cm: dimensión en el plano de flexión; r = 0.3·h (C.10.10.1.2).
+    - M1_kNm, M2_kNm: momentos de extremo (no desplazables) con |M1| <= |M2|; M1/M2 negativo
+      en curvatura doble. Si |M1| > |M2| se intercambian.
+    - psi_sup, psi_inf: relaciones de rigidez Ψ = Σ(EI/l)columnas / Σ(EI/l)vigas en cada nudo.
+    - desplazable: pórtico no arriostrado (C.10.10.7). M1s_kNm y M2s_kNm son los momentos por
+      desplazamiento lateral y se magnifican con δs = 1/(1 - ΣPu/(0.75·ΣPc)) >= 1, sumando Pu y
+      Pc de todas las columnas con igual grupo_piso (piso y combinación).
+    - beta_dns, beta_ds: relaciones de carga sostenida para EI en los casos sin y con desplazamiento.
+
+    Retorna un diccionario de arreglos; Mc_kNm es el momento de diseño que entra a la
+    verificación biaxial (ver demandas_magnificadas).
+    """
+    b_cm, h_cm, fc_MPa, lu_m, Pu_kN, M1_kNm, M2_kNm, psi_sup, psi_inf, desplazable, M1s_kNm, M2s_kNm = np.broadcast_arrays(
+        *(np.asarray(v, dtype=float) for v in (b_cm, h_cm, fc_MPa, lu_m, Pu_kN, M1_kNm, M2_kNm, psi_sup, psi_inf, desplazable, M1s_kNm, M2s_kNm)))
+    _positivos(b_cm=b_cm, h_cm=h_cm, fc_MPa=fc_MPa, lu_m=lu_m)
+    if np.any(psi_sup < 0) or np.any(psi_inf < 0):
+        raise ValueError("Las relaciones de rigidez Ψ no pueden ser negativas")
+    desplazable = desplazable.astype(bool)
+    Pu_comp_kN = np.maximum(Pu_kN, 0.0) # La tracción no magnifica
+    r_mm = 0.3 * cm_to_mm(h_cm)
+    h_mm = cm_to_mm(h_cm)
+
+    # 1) Momentos de extremo: desplazables magnificados con δs por piso (C.10.10.7)
+    delta_s = np.ones_like(Pu_kN)
+    k_s = factor_k_desplazable(psi_sup, psi_inf)
+    if np.any(desplazable):
+        Pc_s_kN, _ = carga_critica_pandeo(b_cm, h_cm, fc_MPa, k_s, lu_m, beta_ds)
+        grupos = np.zeros(Pu_kN.shape, dtype=int) if grupo_piso is None else np.broadcast_to(np.asarray(grupo_piso), Pu_kN.shape)
+        _, inversa = np.unique(grupos.ravel(), return_inverse=True)
+        suma_Pu = np.bincount(inversa, weights=(Pu_comp_kN * desplazable).ravel())
+        suma_Pc = np.bincount(inversa, weights=(Pc_s_kN * desplazable).ravel())
+        with np.errstate(divide="ignore", invalid="ignore"):
+            delta_s_piso = _magnificador(suma_Pu, np.where(suma_Pc > 0, suma_Pc, np.inf))
+        delta_s = np.where(desplazable, delta_s_piso[inversa].reshape(Pu_kN.shape), 1.0)
+    M1_ext = M1_kNm + delta_s * M1s_kNm
+    M2_ext = M2_kNm + delta_s * M2s_kNm
+    intercambiar = np.abs(M1_ext) > np.abs(M2_ext)
+    M1_ext, M2_ext = np.where(intercambiar, M2_ext, M1_ext), np.where(intercambiar, M1_ext, M2_ext)
+    M2_abs = np.abs(M2_ext)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        relacion_M1_M2 = np.where(M2_abs > 0, M1_ext * np.sign(M2_ext) / M2_abs, 1.0)
+
+    # 2) Esbeltez (C.10.10.1): límite 34 - 12·M1/M2 <= 40 arriostrado, 22 desplazable
+    k_ns = factor_k_no_desplazable(psi_sup, psi_inf)
+    k = np.where(desplazable, k_s, k_ns)
+    klu_r = k * m_to_mm(lu_m) / r_mm
+    limite = np.where(desplazable, 22.0, np.minimum(34.0 - 12.0 * relacion_M1_M2, 40.0))
+    esbelta = klu_r > limite
+
+    # 3) Magnificación a lo largo de la columna (C.10.10.6), con k de pórtico arriostrado.
+    #    En desplazables solo aplica si lu/r > 35/√(Pu/(f'c·Ag)) (C.10.10.7.4)
+    Pc_kN, EI_Nmm2 = carga_critica_pandeo(b_cm, h_cm, fc_MPa, k_ns, lu_m, beta_dns)
+    M2_min = Pu_comp_kN * (15.0 + 0.03 * h_mm) / 1000.0 # Pu·(15 + 0.03h) en kN·m (C.10.10.6.5)
+    usa_M2_min = M2_abs < M2_min
+    Cm = np.where(cargas_transversales | usa_M2_min, 1.0, 0.6 + 0.4 * relacion_M1_M2)
+    delta_ns = _magnificador(Pu_comp_kN, Pc_kN, Cm)
+    Ag_mm2 = cm_to_mm(b_cm) * h_mm
+    with np.errstate(divide="ignore"):
+        lu_r_limite = 35.0 / np.sqrt(kn_to_n(Pu_comp_kN) / (fc_MPa * Ag_mm2))
+    aplica_ns = np.where(desplazable, m_to_mm(lu_m) / r_mm > lu_r_limite, esbelta)
+    delta_ns = np.where(aplica_ns, delta_ns, 1.0)
+    M2_diseno = np.maximum(M2_abs, np.where(esbelta | desplazable, M2_min, 0.0))
+    Mc_kNm = delta_ns * M2_diseno
+
+    # 4) Relación segundo/primer orden (C.10.10.2.1)
+    M_primer_orden = np.maximum(np.maximum(np.abs(M1_kNm + M1s_kNm), np.abs(M2_kNm + M2s_kNm)),
+                                np.where(esbelta | desplazable, M2_min, 0.0))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        relacion_segundo_orden = np.where(M_primer_orden > 0, Mc_kNm / M_primer_orden, 1.0)
+    estable = np.isfinite(Mc_kNm) & np.isfinite(delta_s)
+    cumple = estable & (relacion_segundo_orden <= LIMITE_SEGUNDO_ORDEN)
+
+    num_fallas = int(np.count_nonzero(~cumple))
+    return {
+        "status": "OK",
+        "mensaje": "Todas las columnas cumplen C.10.10." if num_fallas == 0 else
+                   f"{num_fallas} casos inestables o con momento de segundo orden > {LIMITE_SEGUNDO_ORDEN}·primer orden.",
+        "k": k, "klu_r": klu_r, "limite_esbeltez": limite, "esbelta": esbelta,
+        "EI_Nmm2": EI_Nmm2, "Pc_kN": Pc_kN, "Cm": Cm,
+        "delta_ns": delta_ns, "delta_s": delta_s,
+        "Mc_kNm": Mc_kNm, "relacion_segundo_orden": relacion_segundo_orden,
+        "estable": estable, "cumple": cumple,
+    }
+
+def demandas_magnificadas(Pu_kN, esbeltez_x, esbeltez_y, Mux_kNm, Muy_kNm):
+    """
+    Arma la matriz (N x 3) de demandas (Pu, Mux, Muy) para verificar_columna o
+    calcular_dcr_columna con los momentos magnificados de cada dirección; conserva el signo
+    de los momentos de análisis.
+    """
+    Mx = np.copysign(esbeltez_x["Mc_kNm"], Mux_kNm)
+    My = np.copysign(esbeltez_y["Mc_kNm"], Muy_kNm)
+    return np.column_stack(np.broadcast_arrays(np.asarray(Pu_kN, dtype=float), Mx, My))
@@ -5,14 +5,14 @@ import numpy as np
 import matplotlib.pyplot as plt
 from unidades import *
 from validate_positive import validate_positive
-from .diseno_vigas import _beta1_viga, calcular_peralte_efectivo_viga
+from .constantes_concreto import ES_MPA, EPSILON_CU, beta1, calcular_phi
+from .diseno_vigas import calcular_peralte_efectivo_viga, calcular_momento_nominal_viga
+from .seccion_fibras import seccion_fibras_T, momento_nominal_uniaxial
 
 # Constantes 
 GAMMA_CONCRETO_KN_M3 = 24.0
 PHI_FLEXION_LOSA = 0.90
 PHI_CORTANTE_LOSA = 0.75
-ES_MPA = 200000.0
-EPSILON_CU = 0.003
 LAMBDA_CONCRETO = 1.0
 
 def calcular_cargas_losa_nervada(
@@ -96,7 +96,7 @@ def diseno_nervio_flexion(
     except ValueError as e:
         return {"status": "Error", "mensaje": f"Error calculando peralte efectivo: {e}"}
 
-    beta_1 = _beta1_viga(fc_MPa)
+    beta_1 = beta1(fc_MPa)
     As_req_mm2 = 0
     a_mm = 0
     status_flex = "OK"
@@ -266,14 +266,22 @@ def diseno_nervio_flexion(
         a_mm = (As_final_mm2 * fy_MPa) / (0.85 * fc_MPa * b_diseno_flex) if (0.85*fc_MPa*b_diseno_flex)>0 else 0
         c_mm = a_mm / beta_1 if beta_1 > 0 else float('inf')
         epsilon_t = epsilon_cu * (d_mm - c_mm) / c_mm if c_mm > 0 else float('inf')
-        phi_calc = _beta1_viga(fc_MPa) # Esta es la función phi de vigas, no _beta1_viga
-        # Usar _calcular_phi de diseno_columna.py o definirla aquí
-        # def _calcular_phi_flex(epsilon_t_val): (similar a _calcular_phi de columnas)
-        #    ...
-        # phi_val = _calcular_phi_flex(epsilon_t)
     else:
         epsilon_t = float('inf')
-        # phi_val = PHI_FLEXION_LOSA
+
+    # φ y φMn con As_final sobre la sección real (núcleo de fibras): T para M+, bw x h para M-
+    capacidad = {"status": "Error"}
+    if As_final_mm2 > 0 and status_flex != "Error - Excede Cuantía Máxima":
+        try:
+            if Mu_Nmm >= -1e-3:
+                capacidad = calcular_momento_nominal_nervio_T(
+                    mm2_to_cm2(As_final_mm2), fc_MPa, fy_MPa, h_total_cm, bw_cm, hf_cm,
+                    separacion_nervios_m, L_libre_nervio_m, rec_libre_inf_cm, diam_estribo_mm, diam_barra_long_mm)
+            else:
+                capacidad = calcular_momento_nominal_viga(bw_cm, h_total_cm, rec_libre_inf_cm, diam_estribo_mm,
+                                                          diam_barra_long_mm, fc_MPa, fy_MPa, mm2_to_cm2(As_final_mm2))
+        except ValueError:
+            pass
 
     return {
         "status": status_flex, "mensaje": mensaje_flex,
@@ -285,7 +293,48 @@ def diseno_nervio_flexion(
         "As_max_et005_cm2": round(As_max_mm2/100.0, 3),
         "As_final_cm2": round(As_final_mm2/100.0, 3),
         "epsilon_t_final": round(epsilon_t, 5) if epsilon_t != float('inf') else "inf",
-        # "phi_calculado": round(phi_val, 2)
+        "phi_calculado": round(capacidad["phi"], 3) if capacidad["status"] == "OK" else None,
+        "phi_Mn_kNm": round(capacidad["phi_Mn_kNm"], 2) if capacidad["status"] == "OK" else None,
+    }
+
+
+def calcular_momento_nominal_nervio_T(
+    As_cm2, fc_MPa, fy_MPa,
+    h_total_cm, bw_cm, hf_cm,
+    separacion_nervios_m, L_libre_nervio_m,
+    rec_libre_inf_cm, diam_estribo_mm, diam_barra_long_mm):
+    """
+    Momento nominal positivo (loseta comprimida) de un nervio como sección T real,
+    con el mismo b_eff de diseno_nervio_flexion y la sección de fibras compartida.
+    Retorna un diccionario con Mn_kNm, phi y phi_Mn_kNm.
+    """
+    validate_positive(As_cm2=As_cm2, fc_MPa=fc_MPa, fy_MPa=fy_MPa, h_total_cm=h_total_cm, bw_cm=bw_cm, hf_cm=hf_cm,
+                      separacion_nervios_m=separacion_nervios_m, L_libre_nervio_m=L_libre_nervio_m)
+    try:
+        d_mm = calcular_peralte_efectivo_viga(h_total_cm, rec_libre_inf_cm, diam_estribo_mm, diam_barra_long_mm)
+    except ValueError as e:
+        return {"status": "Error", "mensaje": f"Error calculando peralte efectivo: {e}"}
+
+    bw_mm = cm_to_mm(bw_cm)
+    hf_mm = cm_to_mm(hf_cm)
+    # Ancho efectivo del ala (NSR-10 C.8.12.2), igual que en diseno_nervio_flexion
+    b_eff_mm = min(L_libre_nervio_m * 1000 / 4.0, bw_mm + 16 * hf_mm, separacion_nervios_m * 1000)
+
+    barras = [{'x': 0.0, 'y': -d_mm, 'area': cm2_to_mm2(As_cm2)}] # Origen en la fibra superior
+    seccion = seccion_fibras_T(b_eff_mm, hf_mm, bw_mm, cm_to_mm(h_total_cm), barras, n_fibras_x=1, n_fibras_y=200)
+    try:
+        res = momento_nominal_uniaxial(seccion, fc_MPa, fy_MPa)
+    except ValueError as e:
+        return {"status": "Error", "mensaje": str(e)}
+
+    phi = float(calcular_phi(res["epsilon_t"]))
+    Mn_kNm = nmm_to_knm(res["Mn_Nmm"])
+    return {
+        "status": "OK",
+        "Mn_kNm": round(Mn_kNm, 2), "phi": round(phi, 3), "phi_Mn_kNm": round(phi * Mn_kNm, 2),
+        "c_mm": round(res["c_mm"], 1), "a_mm": round(beta1(fc_MPa) * res["c_mm"], 1),
+        "b_eff_mm": round(b_eff_mm, 1), "d_mm": round(d_mm, 1),
+        "epsilon_t": round(res["epsilon_t"], 5)
     }
 
 
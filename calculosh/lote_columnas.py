@@ -0,0 +1,136 @@
+# ==============================================================================
+# DISEÑO POR LOTES DE UN CUADRO DE COLUMNAS (CSV / PARQUET)
+# ==============================================================================
+import argparse
+
+import numpy as np
+from unidades import *
+from .verificacion_columna import verificar_columna
+from .diseno_columna_cortante import diseno_columna_cortante_dmo_lote
+from .esbeltez_columnas import efectos_esbeltez_columnas
+from .lotes import leer_tabla, validar_columnas, procesar_en_paralelo, escribir_en_flujo
+
+# Formato largo: una fila por (id, combinación); la sección se repite en cada fila de la columna
+COLUMNAS_SECCION = ("b_cm", "h_cm", "rec_libre_cm", "diam_estribo_mm", "diam_barra_long_mm",
+                    "nx_barras", "ny_barras", "fc_MPa", "fy_MPa")
+COLUMNAS_FUERZAS = ("combinacion", "Pu_kN", "Mux_kNm", "Muy_kNm")
+# Opcionales: si están todas, se diseña también el cortante y el confinamiento (DMO)
+COLUMNAS_CORTANTE = ("Vu_kN", "Mn_viga_izq_kNm", "Mn_viga_der_kNm", "L_libre_vigas_m", "H_libre_col_m")
+# Opcionales: si están todas, los momentos se magnifican por esbeltez (C.10.10) antes de verificar.
+# También se leen, si existen: desplazable, M1x_kNm, M1y_kNm (momento menor de extremo; por
+# defecto igual a Mu, Cm = 1) y Mux_s_kNm, Muy_s_kNm (parte de Mu por desplazamiento lateral)
+COLUMNAS_ESBELTEZ = ("lu_m", "psi_sup_x", "psi_inf_x", "psi_sup_y", "psi_inf_y")
+
+def _aplicar_esbeltez(df):
+    """
+    Reemplaza Mux_kNm y Muy_kNm por los momentos magnificados de todas las filas a la vez.
+    Mux flexiona en el plano de h y Muy en el de b. δs se calcula por piso y combinación.
+    """
+    df = df.copy()
+    grupo_piso = (df["piso"].astype(str) + "|" + df["combinacion"].astype(str)).to_numpy()
+    desplazable = df["desplazable"].to_numpy(dtype=bool) if "desplazable" in df.columns else False
+    cumple = np.ones(len(df), dtype=bool)
+    for eje, ancho, peralte in (("x", "b_cm", "h_cm"), ("y", "h_cm", "b_cm")):
+        Mu = df[f"Mu{eje}_kNm"].to_numpy(dtype=float)
+        Mu_s = df[f"Mu{eje}_s_kNm"].to_numpy(dtype=float) if f"Mu{eje}_s_kNm" in df.columns else 0.0
+        M1 = df[f"M1{eje}_kNm"].to_numpy(dtype=float) if f"M1{eje}_kNm" in df.columns else Mu - Mu_s
+        res = efectos_esbeltez_columnas(
+            df[ancho].to_numpy(dtype=float), df[peralte].to_numpy(dtype=float), df["fc_MPa"].to_numpy(dtype=float),
+            df["lu_m"].to_numpy(dtype=float), df["Pu_kN"].to_numpy(dtype=float),
+            M1, Mu - Mu_s, df[f"psi_sup_{eje}"].to_numpy(dtype=float), df[f"psi_inf_{eje}"].to_numpy(dtype=float),
+            desplazable=desplazable, M2s_kNm=Mu_s, grupo_piso=grupo_piso)
+        df[f"Mu{eje}_kNm"] = np.copysign(res["Mc_kNm"], Mu)
+        cumple &= res["cumple"]
+    df["cumple_esbeltez"] = cumple
+    return df
+
+def _tareas_desde_tabla(df):
+    """Agrupa las filas por columna y arma una tarea (diccionario) por cada una."""
+    con_cortante = all(c in df.columns for c in COLUMNAS_CORTANTE)
+    tareas = []
+    for (id_columna, piso), grupo in df.groupby(["id", "piso"], sort=False):
+        primera = grupo.iloc[0]
+        tarea = {
+            "id": id_columna, "piso": piso,
+            "seccion": {c: primera[c].item() if hasattr(primera[c], "item") else primera[c] for c in COLUMNAS_SECCION},
+            "demandas": grupo[["Pu_kN", "Mux_kNm", "Muy_kNm"]].to_numpy(dtype=float),
+            "nombres": grupo["combinacion"].astype(str).tolist(),
+        }
+        if "cumple_esbeltez" in grupo.columns:
+            tarea["cumple_esbeltez"] = bool(grupo["cumple_esbeltez"].all())
+        tareas.append(tarea)
+    if con_cortante:
+        _agregar_cortante(df, tareas)
+    return tareas
+
+def _agregar_cortante(df, tareas):
+    """Diseño a cortante y confinamiento (DMO) de todas las columnas en una sola llamada vectorizada."""
+    por_columna = df.groupby(["id", "piso"], sort=False).agg(
+        Pu_kN=("Pu_kN", "min"), # Menor carga axial: Vc conservador
+        Vu_kN=("Vu_kN", lambda v: v.abs().max()),
+        **{c: (c, "first") for c in COLUMNAS_SECCION + COLUMNAS_CORTANTE[1:]})
+    res = diseno_columna_cortante_dmo_lote(
+        por_columna["b_cm"].to_numpy(), por_columna["h_cm"].to_numpy(), por_columna["fc_MPa"].to_numpy(),
+        por_columna["fy_MPa"].to_numpy(), por_columna["Pu_kN"].to_numpy(), por_columna["Vu_kN"].to_numpy(),
+        por_columna["Mn_viga_izq_kNm"].to_numpy(), por_columna["Mn_viga_der_kNm"].to_numpy(),
+        por_columna["L_libre_vigas_m"].to_numpy(), cm_to_mm(por_columna["rec_libre_cm"].to_numpy()),
+        por_columna["diam_estribo_mm"].to_numpy(), por_columna["H_libre_col_m"].to_numpy())
+    salidas = {"Vu_diseno_kN": "Vu_diseno_kN", "Vs_req_kN": "Vs_req_kN", "lo_cm": "longitud_confinamiento_lo_cm",
+               "s_confinado_mm": "s_final_confinado_mm", "s_fuera_confinado_mm": "s_fuera_confinado_mm"}
+    for i, tarea in enumerate(tareas): # Mismo orden de grupos que _tareas_desde_tabla
+        tarea["cortante"] = {nombre: float(res[clave][i]) for nombre, clave in salidas.items()}
+
+def disenar_columna_lote(tarea):
+    """Diseña y verifica una columna del cuadro. Retorna una fila (diccionario) de resultados."""
+    seccion = tarea["seccion"]
+    fila = {"id": tarea["id"], "piso": tarea["piso"], **seccion}
+    As_mm2 = (2 * seccion["nx_barras"] + 2 * seccion["ny_barras"]) * np.pi * (seccion["diam_barra_long_mm"] / 2.0)**2
+    fila["As_total_cm2"] = round(mm2_to_cm2(As_mm2), 2)
+    fila["rho_g"] = round(As_mm2 / (cm_to_mm(seccion["b_cm"]) * cm_to_mm(seccion["h_cm"])), 4)
+
+    try:
+        flexion = verificar_columna(**seccion, demandas=tarea["demandas"], nombres_combinaciones=tarea["nombres"])
+    except ValueError as e:
+        flexion = {"status": "Error", "mensaje": str(e)}
+    if flexion.get("status") != "OK":
+        return {**fila, "status": "Error", "mensaje": flexion.get("mensaje", "")}
+
+    fila.update({
+        "status": "OK",
+        "dcr_max": round(flexion["dcr_max"], 3),
+        "combinacion_gobernante": flexion["combinacion_gobernante"],
+        "cumple_flexocompresion": flexion["cumple"],
+        "modo_verificacion": flexion["modo"],
+    })
+    if "cumple_esbeltez" in tarea:
+        fila["cumple_esbeltez"] = tarea["cumple_esbeltez"]
+
+    fila.update(tarea.get("cortante", {}))
+    fila["mensaje"] = ""
+    return fila
+
+def disenar_lote_columnas(ruta_entrada, ruta_salida=None, max_workers=None):
+    """
+    Lee el cuadro de columnas (CSV o Parquet, una fila por columna y combinación), diseña cada
+    columna en un pool de procesos y escribe los resultados a medida que terminan.
+    Columnas requeridas: id, piso, las de COLUMNAS_SECCION y COLUMNAS_FUERZAS; las de
+    COLUMNAS_CORTANTE y COLUMNAS_ESBELTEZ son opcionales. Retorna el DataFrame de resultados ordenado por piso e id.
+    """
+    df = leer_tabla(ruta_entrada)
+    validar_columnas(df, ("id", "piso") + COLUMNAS_SECCION + COLUMNAS_FUERZAS)
+    if all(c in df.columns for c in COLUMNAS_ESBELTEZ):
+        df = _aplicar_esbeltez(df)
+    tareas = _tareas_desde_tabla(df)
+    return escribir_en_flujo(procesar_en_paralelo(disenar_columna_lote, tareas, max_workers),
+                             ruta_salida, columnas_orden=["piso", "id"])
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Diseño por lotes de un cuadro de columnas (NSR-10).")
+    parser.add_argument("entrada", help="Cuadro de columnas (.csv o .parquet), una fila por columna y combinación")
+    parser.add_argument("salida", help="Archivo de resultados (.csv o .parquet)")
+    parser.add_argument("--workers", type=int, default=None, help="Procesos del pool (1 = sin pool)")
+    args = parser.parse_args()
+
+    resultados = disenar_lote_columnas(args.entrada, args.salida, args.workers)
+    num_ok = int((resultados["status"] == "OK").sum()) if len(resultados) else 0
+    print(f"{len(resultados)} columnas procesadas ({num_ok} OK). Resultados en {args.salida}")
@@ -0,0 +1,110 @@
+# ==============================================================================
+# DISEÑO POR LOTES DE UN CUADRO DE VIGAS DMO (CSV / PARQUET)
+# ==============================================================================
+import argparse
+
+import numpy as np
+from .diseno_vigas import diseno_viga_dmo, zonificar_estribos_vigas
+from .lotes import leer_tabla, escribir_tabla, validar_columnas, procesar_en_paralelo, escribir_en_flujo
+
+# Una fila por viga. Opcionales: piso (agrupa y ordena la salida) y fy_estribos_MPa (por defecto fy_MPa)
+COLUMNAS_VIGA = ("b_cm", "h_cm", "rec_libre_cm", "diam_estribo_mm", "diam_barra_long_mm", "fc_MPa", "fy_MPa")
+COLUMNAS_DEMANDAS = ("Mu_neg_ext_kNm", "Mu_pos_kNm", "Mu_neg_int_kNm", "ln_m", "Vu_grav_ext_kN", "Vu_grav_int_kN")
+ESTACIONES_CORTANTE = 41 # Estaciones a lo largo de ln para zonificar estribos
+
+def _tareas_desde_tabla(df):
+    """Una tarea (diccionario con los valores de la fila) por viga."""
+    df = df.copy()
+    if "fy_estribos_MPa" not in df.columns:
+        df["fy_estribos_MPa"] = df["fy_MPa"]
+    columnas = ["id"] + (["piso"] if "piso" in df.columns else []) + list(COLUMNAS_VIGA) + ["fy_estribos_MPa"] + list(COLUMNAS_DEMANDAS)
+    return [{c: v.item() if hasattr(v, "item") else v for c, v in fila.items()}
+            for fila in df[columnas].to_dict(orient="records")]
+
+def disenar_viga_lote(tarea):
+    """Diseña una viga del cuadro con diseno_viga_dmo. Retorna una fila (diccionario) de resultados."""
+    fila = dict(tarea)
+    try:
+        res = diseno_viga_dmo(
+            tarea["b_cm"], tarea["h_cm"], tarea["rec_libre_cm"], tarea["diam_estribo_mm"], tarea["diam_barra_long_mm"],
+            tarea["fc_MPa"], tarea["fy_MPa"], tarea["fy_estribos_MPa"],
+            tarea["Mu_neg_ext_kNm"], tarea["Mu_pos_kNm"], tarea["Mu_neg_int_kNm"], tarea["ln_m"],
+            tarea["Vu_grav_ext_kN"], tarea["Vu_grav_int_kN"])
+    except ValueError as e:
+        res = {"status": "Error", "mensaje_global": str(e)}
+    if res.get("status") != "OK":
+        return {**fila, "status": "Error", "mensaje": res.get("mensaje_global", "")}
+
+    fila["status"] = "OK"
+    for cara in ("neg_ext", "pos", "neg_int"):
+        fila[f"As_{cara}_cm2"] = round(float(res[f"flexion_{cara}"]["As_req_cm2"]), 2)
+        fila[f"rho_{cara}"] = round(float(res[f"flexion_{cara}"]["rho"]), 4)
+    for cara in ("neg_ext", "pos", "neg_int"):
+        fila[f"Mn_{cara}_kNm"] = res[f"Mn_{cara}_kNm"]
+    # Armado de una capa de barras de diam_barra_long_mm elegido por diseno_viga_dmo (vacío si no cabe en una capa)
+    for cara in ("neg_ext", "pos", "neg_int"):
+        fila[f"barras_{cara}"] = res[f"flexion_{cara}"]["barras"]
+    fila.update({
+        "Ve_ext_kN": res["cortante_diseno_Ve_ext_kN"],
+        "Ve_int_kN": res["cortante_diseno_Ve_int_kN"],
+        "Vs_req_max_kN": res["Vs_requerido_max_kN"],
+        "d_cm": res["d_usado_cm"],
+        "lo_cm": res["longitud_confinamiento_lo_cm"],
+        "s_confinado_cm": res["espaciamiento_zona_confinada_cm"],
+        "s_central_cm": res["espaciamiento_zona_central_cm"],
+        "mensaje": " ".join(m for m in (res["mensaje_cuantia"], res["mensaje_armado"]) if m),
+    })
+    return fila
+
+def _agregar_zonas_estribos(df):
+    """
+    Zonas de estribos de todas las vigas diseñadas en una sola llamada vectorizada, con el
+    cortante de diseño lineal entre Ve_ext (izquierda) y -Ve_int (derecha).
+    """
+    df = df.copy()
+    ok = (df["status"] == "OK").to_numpy() if len(df) else np.zeros(0, dtype=bool)
+    if not ok.any():
+        return df
+    v = df[ok]
+    ln_m = v["ln_m"].to_numpy(dtype=float)[:, None]
+    x_m = np.linspace(0.0, 1.0, ESTACIONES_CORTANTE) * ln_m
+    Ve_ext, Ve_int = v["Ve_ext_kN"].to_numpy(dtype=float)[:, None], v["Ve_int_kN"].to_numpy(dtype=float)[:, None]
+    res = zonificar_estribos_vigas(
+        x_m, Ve_ext - (Ve_ext + Ve_int) * x_m / ln_m, v["b_cm"].to_numpy(dtype=float), v["h_cm"].to_numpy(dtype=float),
+        v["rec_libre_cm"].to_numpy(dtype=float), v["diam_estribo_mm"].to_numpy(dtype=float),
+        v["diam_barra_long_mm"].to_numpy(dtype=float), v["fc_MPa"].to_numpy(dtype=float), v["fy_estribos_MPa"].to_numpy(dtype=float))
+    df.loc[ok, "zonas_estribos"] = [" + ".join(f"{z['num_estribos']}@{z['s_mm'] / 10.0:g}" for z in zonas) for zonas in res["zonas"]]
+    df.loc[ok, "num_estribos"] = res["num_estribos"]
+    df["num_estribos"] = df["num_estribos"].astype("Int64") # Entero (nulo en las vigas con error)
+    df.loc[ok, "peso_estribos_kg"] = np.round(res["peso_estribos_kg"], 2)
+    return df
+
+def disenar_lote_vigas(ruta_entrada, ruta_salida=None, max_workers=None):
+    """
+    Lee el cuadro de vigas (CSV o Parquet, una fila por viga), diseña cada viga (DMO) en un
+    pool de procesos y escribe los resultados a medida que terminan. Al final agrega las
+    zonas de estribos (cantidad@separación en cm), su número y peso para el despiece.
+    Columnas requeridas: id, las de COLUMNAS_VIGA y COLUMNAS_DEMANDAS.
+    Retorna el DataFrame de resultados ordenado por piso (si existe) e id.
+    """
+    df = leer_tabla(ruta_entrada)
+    validar_columnas(df, ("id",) + COLUMNAS_VIGA + COLUMNAS_DEMANDAS)
+    tareas = _tareas_desde_tabla(df)
+    columnas_orden = ["piso", "id"] if "piso" in df.columns else ["id"]
+    resultados = escribir_en_flujo(procesar_en_paralelo(disenar_viga_lote, tareas, max_workers),
+                                   ruta_salida, columnas_orden=columnas_orden)
+    resultados = _agregar_zonas_estribos(resultados)
+    if ruta_salida is not None:
+        escribir_tabla(resultados, ruta_salida)
+    return resultados
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Diseño por lotes de un cuadro de vigas DMO (NSR-10).")
+    parser.add_argument("entrada", help="Cuadro de vigas (.csv o .parquet), una fila por viga")
+    parser.add_argument("salida", help="Archivo de resultados (.csv o .parquet)")
+    parser.add_argument("--workers", type=int, default=None, help="Procesos del pool (1 = sin pool)")
+    args = parser.parse_args()
+
+    resultados = disenar_lote_vigas(args.entrada, args.salida, args.workers)
+    num_ok = int((resultados["status"] == "OK").sum()) if len(resultados) else 0
+    print(f"{len(resultados)} vigas procesadas ({num_ok} OK). Resultados en {args.salida}")
@@ -0,0 +1,83 @@
+# ==============================================================================
+# PROCESAMIENTO POR LOTES - LECTURA/ESCRITURA DE TABLAS Y POOL DE PROCESOS
+# ==============================================================================
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import pandas as pd
+
+FILAS_POR_ESCRITURA = 50 # Resultados acumulados antes de agregarlos al archivo CSV
+
+def leer_tabla(ruta):
+    """Lee una tabla CSV o Parquet según la extensión del archivo."""
+    extension = os.path.splitext(ruta)[1].lower()
+    if extension == ".csv":
+        return pd.read_csv(ruta)
+    if extension in (".parquet", ".pq"):
+        return pd.read_parquet(ruta)
+    raise ValueError(f"Formato '{extension}' no soportado. Use .csv o .parquet")
+
+def escribir_tabla(df, ruta):
+    """Escribe una tabla CSV o Parquet según la extensión del archivo."""
+    extension = os.path.splitext(ruta)[1].lower()
+    if extension == ".csv":
+        df.to_csv(ruta, index=False)
+    elif extension in (".parquet", ".pq"):
+        df.to_parquet(ruta, index=False)
+    else:
+        raise ValueError(f"Formato '{extension}' no soportado. Use .csv o .parquet")
+
+def validar_columnas(df, requeridas):
+    """Lanza ValueError si faltan columnas requeridas en la tabla."""
+    faltantes = [c for c in requeridas if c not in df.columns]
+    if faltantes:
+        raise ValueError(f"Faltan columnas en la tabla de entrada: {faltantes}")
+
+def procesar_en_paralelo(funcion, tareas, max_workers=None):
+    """
+    Generador que ejecuta funcion(tarea) para cada tarea en un pool de procesos y entrega los
+    resultados a medida que terminan (no en el orden de entrada).
+    'funcion' debe estar definida a nivel de módulo para poder enviarse a los procesos.
+    max_workers = 1 ejecuta en el proceso actual.
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+    if max_workers == 1:
+        for tarea in tareas:
+            yield funcion(tarea)
+        return
+    with ProcessPoolExecutor(max_workers=max_workers) as ejecutor:
+        futuros = [ejecutor.submit(funcion, tarea) for tarea in tareas]
+        for futuro in as_completed(futuros):
+            yield futuro.result()
+
+def escribir_en_flujo(resultados, ruta_salida=None, columnas_orden=None):
+    """
+    Consume un iterable de filas (diccionarios) y las escribe a medida que llegan: en CSV se
+    agregan por bloques de FILAS_POR_ESCRITURA filas; en Parquet se escribe al final.
+    Retorna el DataFrame completo, ordenado por 'columnas_orden' si se indica.
+    """
+    filas, pendientes = [], []
+    es_csv = ruta_salida is not None and os.path.splitext(ruta_salida)[1].lower() == ".csv"
+    encabezado = True
+
+    def volcar():
+        nonlocal encabezado
+        pd.DataFrame(pendientes).to_csv(ruta_salida, mode="w" if encabezado else "a", header=encabezado, index=False)
+        encabezado = False
+        pendientes.clear()
+
+    for fila in resultados:
+        filas.append(fila)
+        if es_csv:
+            pendientes.append(fila)
+            if len(pendientes) >= FILAS_POR_ESCRITURA:
+                volcar()
+    if es_csv and pendientes:
+        volcar()
+
+    df = pd.DataFrame(filas)
+    if columnas_orden and len(df):
+        df = df.sort_values(columnas_orden, kind="stable").reset_index(drop=True)
+    if ruta_salida is not None:
+        escribir_tabla(df, ruta_salida) # Reescribe ordenado (el CSV parcial sirve mientras corre)
+    return df
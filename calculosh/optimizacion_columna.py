@@ -0,0 +1,133 @@
+# ==============================================================================
+# OPTIMIZACIÓN DEL REFUERZO DE COLUMNAS (b, h, nx, ny, diámetro)
+# ==============================================================================
+import os
+import itertools
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from unidades import *
+from .verificacion_columna import verificar_columna
+
+DIAMETROS_BARRA_MM = (15.9, 19.1, 22.2, 25.4, 28.7, 32.3) # #5 a #10
+
+def _evaluar_candidato(argumentos):
+    """Verifica un candidato en un proceso del pool. Retorna (índice, dcr_max, cumple, modo)."""
+    indice, seccion, demandas, nombres = argumentos
+    res = verificar_columna(**seccion, demandas=demandas, nombres_combinaciones=nombres)
+    if res.get("status") != "OK":
+        return indice, np.inf, False, res.get("modo", "error")
+    return indice, res["dcr_max"], res["cumple"], res["modo"]
+
+def _generar_candidatos(b_cm_opciones, h_cm_opciones, nx_opciones, ny_opciones, diametros_mm):
+    """Producto cartesiano del espacio discreto como arreglo (N x 5): b, h, nx, ny, diámetro."""
+    return np.array(list(itertools.product(b_cm_opciones, h_cm_opciones, nx_opciones, ny_opciones, diametros_mm)), dtype=float)
+
+def optimizar_refuerzo_columna(
+    demandas, rec_libre_cm, diam_estribo_mm, fc_MPa, fy_MPa,
+    b_cm_opciones, h_cm_opciones,
+    nx_opciones=range(2, 9), ny_opciones=range(0, 7), diametros_mm=DIAMETROS_BARRA_MM,
+    nombres_combinaciones=None, max_workers=None):
+    """
+    Busca el arreglo de mínima área de acero (desempate por menor Ag) que cumple los límites de
+    cuantía de calcular_diagrama_interaccion_columna y DCR <= 1 en todas las combinaciones.
+    1) Filtros vectorizados: cuantía 1%-6%, separación libre mínima (NSR-10 C.7.6.3) y
+       Pu_max <= 0.80·φ·Po.
+    2) Los candidatos se ordenan por As creciente y, con igual As, por Ag decreciente, y se
+       evalúan por lotes en un pool de procesos (verificar_columna: Bresler y, si está cerca
+       del límite, la superficie completa).
+    3) Cuando un candidato no cumple, se descartan los dominados: los que tienen b, h, nx, ny y
+       diámetro menores o iguales (menor capacidad). Con el orden anterior, una sección grande
+       que no cumple descarta las menores con el mismo refuerzo.
+    La búsqueda termina al agotar el nivel de As del primer candidato que cumple: todos los de
+    menor As ya se evaluaron o fueron descartados.
+    max_workers = 1 evalúa en el proceso actual (sin pool).
+    """
+    demandas = np.atleast_2d(np.asarray(demandas, dtype=float))
+    candidatos = _generar_candidatos(b_cm_opciones, h_cm_opciones, nx_opciones, ny_opciones, diametros_mm)
+    if len(candidatos) == 0:
+        return {"status": "Error", "mensaje": "El espacio de búsqueda está vacío."}
+    b_mm, h_mm = cm_to_mm(candidatos[:, 0]), cm_to_mm(candidatos[:, 1])
+    nx, ny, db = candidatos[:, 2], candidatos[:, 3], candidatos[:, 4]
+
+    # 1) Filtros necesarios (vectorizados sobre todos los candidatos)
+    As_mm2 = (2 * nx + 2 * ny) * np.pi * (db / 2.0)**2
+    Ag_mm2 = b_mm * h_mm
+    rho_g = As_mm2 / Ag_mm2
+    ok_cuantia = (rho_g >= 0.01) & (rho_g <= 0.06) & (nx >= 2)
+
+    nucleo = 2 * (cm_to_mm(rec_libre_cm) + diam_estribo_mm) # Recubrimiento + estribo a ambos lados
+    s_min = np.maximum(1.5 * db, 40.0) # NSR-10 C.7.6.3: max(1.5 db, 40 mm) libre entre barras
+    libre_b = (b_mm - nucleo - nx * db) / np.maximum(nx - 1, 1)
+    libre_h = (h_mm - nucleo - (ny + 2) * db) / (ny + 1)
+    ok_separacion = (libre_b >= s_min) & (libre_h >= s_min)
+
+    Po_N = 0.85 * fc_MPa * (Ag_mm2 - As_mm2) + fy_MPa * As_mm2
+    ok_axial = kn_to_n(demandas[:, 0].max()) <= 0.80 * 0.65 * Po_N
+
+    viables = np.nonzero(ok_cuantia & ok_separacion & ok_axial)[0]
+    viables = viables[np.lexsort((-Ag_mm2[viables], As_mm2[viables]))] # As creciente, luego Ag decreciente
+
+    descartado = np.zeros(len(candidatos), dtype=bool)
+    evaluado = np.zeros(len(candidatos), dtype=bool)
+    evaluados, mejor = [], None
+    max_workers = max_workers or os.cpu_count() or 1
+    ejecutor = ProcessPoolExecutor(max_workers=max_workers) if max_workers > 1 else None
+    try:
+        pendientes = deque(viables)
+        while pendientes:
+            lote = []
+            while pendientes and len(lote) < max_workers:
+                i = pendientes.popleft()
+                if mejor is not None and As_mm2[i] > As_mm2[mejor[0]]:
+                    pendientes.clear() # Nivel de As del óptimo agotado
+                    break
+                if not descartado[i]:
+                    lote.append(i)
+            if not lote:
+                break
+
+            argumentos = [(i, dict(b_cm=candidatos[i, 0], h_cm=candidatos[i, 1], rec_libre_cm=rec_libre_cm,
+                                   diam_estribo_mm=diam_estribo_mm, diam_barra_long_mm=candidatos[i, 4],
+                                   nx_barras=int(nx[i]), ny_barras=int(ny[i]), fc_MPa=fc_MPa, fy_MPa=fy_MPa),
+                           demandas, nombres_combinaciones) for i in lote]
+            resultados = list(ejecutor.map(_evaluar_candidato, argumentos) if ejecutor else map(_evaluar_candidato, argumentos))
+
+            for i, dcr_max, cumple, modo in resultados:
+                evaluados.append({"indice": i, "dcr_max": dcr_max, "cumple": cumple, "modo": modo})
+                if cumple:
+                    if mejor is None or (As_mm2[i], Ag_mm2[i]) < (As_mm2[mejor[0]], Ag_mm2[mejor[0]]):
+                        mejor = (i, dcr_max, modo)
+                else:
+                    # Descartar los candidatos dominados por el que no cumple
+                    descartado |= np.all(candidatos <= candidatos[i], axis=1)
+            evaluado[lote] = True
+    finally:
+        if ejecutor is not None:
+            ejecutor.shutdown()
+
+    resumen = {
+        "num_candidatos": len(candidatos),
+        "num_descartados_cuantia": int(np.count_nonzero(~ok_cuantia)),
+        "num_descartados_separacion": int(np.count_nonzero(ok_cuantia & ~ok_separacion)),
+        "num_descartados_axial": int(np.count_nonzero(ok_cuantia & ok_separacion & ~ok_axial)),
+        "num_descartados_dominados": int(np.count_nonzero((descartado & ~evaluado)[viables])),
+        "num_evaluados": len(evaluados),
+    }
+    if mejor is None:
+        return {"status": "Error", "mensaje": "Ningún candidato cumple con DCR <= 1 en el espacio de búsqueda.", **resumen}
+
+    i, dcr_max, modo = mejor
+    return {
+        "status": "OK",
+        "mensaje": f"Arreglo óptimo encontrado tras evaluar {len(evaluados)} de {len(viables)} candidatos viables.",
+        "mejor": {
+            "b_cm": float(candidatos[i, 0]), "h_cm": float(candidatos[i, 1]),
+            "nx_barras": int(nx[i]), "ny_barras": int(ny[i]), "diam_barra_long_mm": float(candidatos[i, 4]),
+            "num_barras_total": int(2 * nx[i] + 2 * ny[i]),
+            "As_total_cm2": float(mm2_to_cm2(As_mm2[i])), "rho_g": float(rho_g[i]),
+            "dcr_max": dcr_max, "modo_verificacion": modo
+        },
+        **resumen
+    }
@@ -0,0 +1,159 @@
+# ==============================================================================
+# OPTIMIZACIÓN DE LA SECCIÓN DE VIGAS (b, h) - FRENTE DE PARETO CONCRETO vs ACERO
+# ==============================================================================
+import numpy as np
+from unidades import *
+from .constantes_concreto import ES_MPA
+from .diseno_vigas import (diseno_viga_flexion_simple_lote, zonificar_estribos_vigas,
+                           CODIGO_FLEXION_ERROR_PERALTE, CODIGO_FLEXION_ERROR_CAPACIDAD)
+from .deflexiones import calcular_deflexion_instantanea, calcular_deflexion_largo_plazo, verificar_limites_deflexion_nsr10
+
+RHO_MAX_DMO = 0.025 # Igual que diseno_viga_dmo (NSR-10 C.21.3.2.1)
+DENSIDAD_ACERO_KG_M3 = 7850.0
+ESTACIONES_CORTANTE = 21 # Estaciones a lo largo de ln para los estribos de cada candidato
+
+def _frente_pareto(volumen, peso, factible):
+    """
+    Máscara del frente de Pareto por fila (viga) de los candidatos factibles, minimizando
+    volumen y peso: se ordena por volumen (y peso) y queda en el frente el que baja el mínimo
+    acumulado de peso.
+    """
+    volumen = np.where(factible, volumen, np.inf)
+    peso = np.where(factible, peso, np.inf)
+    orden = np.lexsort((peso, volumen)) # Por fila, sobre el último eje
+    peso_ordenado = np.take_along_axis(peso, orden, axis=1)
+    minimo_previo = np.concatenate([np.full((len(peso), 1), np.inf),
+                                    np.minimum.accumulate(peso_ordenado, axis=1)[:, :-1]], axis=1)
+    en_frente_ordenado = np.isfinite(peso_ordenado) & (peso_ordenado < minimo_previo)
+    en_frente = np.zeros_like(en_frente_ordenado)
+    np.put_along_axis(en_frente, orden, en_frente_ordenado, axis=1)
+    return en_frente
+
+def optimizar_seccion_viga(
+    Mu_neg_kNm, Mu_pos_kNm, Vu_kN, ln_m, w_muerta_servicio_kN_m, w_viva_servicio_kN_m,
+    b_cm_opciones, h_cm_opciones, rec_libre_cm, diam_estribo_mm, diam_barra_long_mm,
+    fc_MPa, fy_MPa, fy_MPa_estribos=None, rho_max=RHO_MAX_DMO,
+    tipo_apoyo='simples', xi_factor_tiempo=2.0,
+    condicion_deflexion='Total_diferida_no_susceptible'):
+    """
+    Evalúa todas las secciones b x h de la malla (b_cm_opciones x h_cm_opciones) para una o
+    varias vigas a la vez (Mu_neg_kNm, Mu_pos_kNm, Vu_kN, ln_m y cargas de servicio son
+    escalares o un valor por viga), sin ciclos por candidato:
+    - Flexión con diseno_viga_flexion_simple_lote para Mu_neg y Mu_pos, y ρ <= rho_max.
+    - Cortante y estribos con zonificar_estribos_vigas (Vu lineal de +Vu a -Vu en ln; C.11 y
+      confinamiento DMO en 2h), que además da la cantidad de estribos.
+    - Deflexión (deflexiones.py): Ie de Branson con Ma = momento de servicio a mitad de luz
+      (proporcional a Mu_pos), inmediata por carga viva <= L/360 y diferida
+      (λ·δ muerta + δ viva) <= el límite de condicion_deflexion.
+    Las cargas y momentos ya incluyen el peso propio (no se recalcula por candidato).
+    Objetivos: volumen de concreto (b·h·ln) y peso de acero (refuerzo superior e inferior
+    continuo en ln, más estribos). Retorna las métricas en arreglos (vigas x b x h), la
+    máscara de factibilidad por chequeo y el frente de Pareto de cada viga ordenado por volumen.
+    """
+    fy_MPa_estribos = fy_MPa if fy_MPa_estribos is None else fy_MPa_estribos
+    b_op = np.asarray(b_cm_opciones, dtype=float)
+    h_op = np.asarray(h_cm_opciones, dtype=float)
+    Mu_neg, Mu_pos, Vu, ln, wD, wL = np.broadcast_arrays(*(np.atleast_1d(np.asarray(v, dtype=float)) for v in (
+        Mu_neg_kNm, Mu_pos_kNm, Vu_kN, ln_m, w_muerta_servicio_kN_m, w_viva_servicio_kN_m)))
+    if b_op.ndim != 1 or h_op.ndim != 1 or len(b_op) == 0 or len(h_op) == 0:
+        return {"status": "Error", "mensaje": "Las opciones de b y h deben ser listas no vacías."}
+    if np.any(ln <= 0):
+        return {"status": "Error", "mensaje": "ln_m debe ser positivo en todas las vigas."}
+    forma = (len(ln), len(b_op), len(h_op))
+
+    # Malla (vigas x b x h) aplanada: cada fila es un candidato
+    b = np.broadcast_to(b_op[None, :, None], forma).ravel()
+    h = np.broadcast_to(h_op[None, None, :], forma).ravel()
+    viga = np.broadcast_to(np.arange(forma[0])[:, None, None], forma).ravel()
+    L = ln[viga]
+
+    # 1) Flexión
+    flex_neg = diseno_viga_flexion_simple_lote(b, h, rec_libre_cm, diam_estribo_mm, diam_barra_long_mm, fc_MPa, fy_MPa, Mu_neg[viga])
+    flex_pos = diseno_viga_flexion_simple_lote(b, h, rec_libre_cm, diam_estribo_mm, diam_barra_long_mm, fc_MPa, fy_MPa, Mu_pos[viga])
+    errores = (CODIGO_FLEXION_ERROR_PERALTE, CODIGO_FLEXION_ERROR_CAPACIDAD)
+    ok_flexion = ~np.isin(flex_neg["codigo"], errores) & ~np.isin(flex_pos["codigo"], errores)
+    ok_cuantia = ok_flexion & (flex_neg["rho_calculado"] <= rho_max) & (flex_pos["rho_calculado"] <= rho_max)
+    d_mm = np.where(ok_flexion, flex_pos["d_mm"], np.nan)
+    As_neg_mm2 = np.where(ok_flexion, cm2_to_mm2(flex_neg["As_req_cm2"]), np.nan)
+    As_pos_mm2 = np.where(ok_flexion, cm2_to_mm2(flex_pos["As_req_cm2"]), np.nan)
+
+    # 2) Cortante y estribos (solo candidatos con peralte válido)
+    num_estribos = np.zeros(len(b))
+    peso_estribos = np.full(len(b), np.nan)
+    ok_cortante = np.zeros(len(b), dtype=bool)
+    validos = np.flatnonzero(ok_flexion)
+    if len(validos):
+        x = np.linspace(0.0, 1.0, ESTACIONES_CORTANTE) * L[validos, None]
+        V = Vu[viga[validos], None] * (1.0 - 2.0 * x / L[validos, None])
+        estribos = zonificar_estribos_vigas(x, V, b[validos], h[validos], rec_libre_cm, diam_estribo_mm, diam_barra_long_mm,
+                                            fc_MPa, fy_MPa_estribos)
+        num_estribos[validos] = estribos["num_estribos"]
+        peso_estribos[validos] = estribos["peso_estribos_kg"]
+        ok_cortante[validos] = estribos["cumple"]
+
+    # 3) Deflexiones con Ie (sección rectangular, acero inferior a tracción)
+    b_mm, h_mm = cm_to_mm(b), cm_to_mm(h)
+    Ec_MPa = 4700.0 * np.sqrt(fc_MPa)
+    Ig = b_mm * h_mm**3 / 12.0
+    Mcr_kNm = nmm_to_knm(0.62 * np.sqrt(fc_MPa) * Ig / (h_mm / 2.0))
+    n_mod = ES_MPA / Ec_MPa
+    rho_n = As_pos_mm2 / (b_mm * d_mm) * n_mod
+    kd = (np.sqrt(2.0 * rho_n + rho_n**2) - rho_n) * d_mm
+    Icr = b_mm * kd**3 / 3.0 + n_mod * As_pos_mm2 * (d_mm - kd)**2
+    w_total = wD[viga] + wL[viga]
+    # Ma de servicio: Mu_pos escalado por la relación de cargas de servicio a mayoradas (1.2D + 1.6L)
+    w_mayorada = 1.2 * wD[viga] + 1.6 * wL[viga]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        Ma_kNm = np.where(w_mayorada > 0, np.abs(Mu_pos[viga]) * w_total / w_mayorada, 0.0)
+        relacion = np.where(Ma_kNm > 0, np.minimum(Mcr_kNm / Ma_kNm, 1.0), 1.0)
+    Ie = np.minimum(relacion**3 * Ig + (1.0 - relacion**3) * Icr, Ig)
+
+    k_apoyo = calcular_deflexion_instantanea(0.1, 1.0, 1.0, 1.0, tipo_apoyo) # Coeficiente de wL⁴/(EI): L = 1 mm
+    lambda_delta = calcular_deflexion_largo_plazo(1.0, xi_factor_tiempo) # Sin acero a compresión
+    n_diferida = verificar_limites_deflexion_nsr10(0.0, 100.0, 'Viga Rectangular', condicion_deflexion)[2]
+    n_viva = verificar_limites_deflexion_nsr10(0.0, 100.0, 'Viga Rectangular', 'CV_inmediata_no_susceptible')[2]
+    L_mm = m_to_mm(L)
+    delta_unitaria = k_apoyo * L_mm**4 / (mp_to_n_mm2(Ec_MPa) * Ie) # Por 1 kN/m (= 1 N/mm)
+    delta_viva = delta_unitaria * wL[viga]
+    delta_diferida = lambda_delta * delta_unitaria * wD[viga] + delta_viva
+    ok_deflexion = ok_flexion & (delta_viva <= L_mm / n_viva) & (delta_diferida <= L_mm / n_diferida)
+
+    # 4) Objetivos y frente de Pareto por viga
+    volumen_m3 = cm_to_m(b) * cm_to_m(h) * L
+    peso_long_kg = (As_neg_mm2 + As_pos_mm2) * L_mm * DENSIDAD_ACERO_KG_M3 * 1e-9
+    peso_acero_kg = peso_long_kg + peso_estribos
+    factible = ok_flexion & ok_cuantia & ok_cortante & ok_deflexion
+    en_frente = _frente_pareto(volumen_m3.reshape(forma[0], -1), peso_acero_kg.reshape(forma[0], -1),
+                               factible.reshape(forma[0], -1)).ravel()
+
+    frentes = [[] for _ in range(forma[0])]
+    indices = np.flatnonzero(en_frente)
+    for i in indices[np.lexsort((volumen_m3[indices], viga[indices]))]:
+        frentes[viga[i]].append({
+            "b_cm": float(b[i]), "h_cm": float(h[i]),
+            "volumen_concreto_m3": round(float(volumen_m3[i]), 4),
+            "peso_acero_kg": round(float(peso_acero_kg[i]), 2),
+            "As_neg_cm2": round(float(mm2_to_cm2(As_neg_mm2[i])), 2),
+            "As_pos_cm2": round(float(mm2_to_cm2(As_pos_mm2[i])), 2),
+            "num_estribos": int(num_estribos[i]),
+            "deflexion_diferida_mm": round(float(delta_diferida[i]), 2),
+        })
+
+    num_factibles = np.count_nonzero(factible.reshape(forma[0], -1), axis=1)
+    return {
+        "status": "OK" if np.all(num_factibles > 0) else "Error",
+        "mensaje": f"Frente de Pareto calculado sobre {b.size} candidatos." if np.all(num_factibles > 0) else
+                   f"{int(np.count_nonzero(num_factibles == 0))} vigas sin ninguna sección factible en la malla.",
+        "b_cm_opciones": b_op, "h_cm_opciones": h_op,
+        "volumen_concreto_m3": volumen_m3.reshape(forma),
+        "peso_acero_kg": peso_acero_kg.reshape(forma),
+        "deflexion_diferida_mm": delta_diferida.reshape(forma),
+        "cumple_flexion": ok_flexion.reshape(forma),
+        "cumple_cuantia": ok_cuantia.reshape(forma),
+        "cumple_cortante": ok_cortante.reshape(forma),
+        "cumple_deflexion": ok_deflexion.reshape(forma),
+        "factible": factible.reshape(forma),
+        "en_frente_pareto": en_frente.reshape(forma),
+        "num_factibles": num_factibles,
+        "frente_pareto": frentes,
+    }
@@ -0,0 +1,199 @@
+# ==============================================================================
+# SECCIÓN DE FIBRAS - NÚCLEO COMÚN PARA FLEXIÓN Y FLEXOCOMPRESIÓN
+# ==============================================================================
+from functools import lru_cache
+
+import numpy as np
+from .constantes_concreto import ES_MPA, EPSILON_CU, beta1
+
+# --- Constantes ---
+MATERIAL_CONCRETO = 0
+MATERIAL_ACERO = 1
+PLANOS_POR_BLOQUE = 2000 # Planos evaluados por bloque (limita la memoria de la matriz planos x fibras)
+
+def _barras_a_tupla(barras):
+    """Convierte barras ({'x','y','area'} o arreglo estructurado) en una tupla hashable para la caché."""
+    if isinstance(barras, np.ndarray):
+        return tuple(zip(barras['x'].tolist(), barras['y'].tolist(), barras['area'].tolist()))
+    return tuple((float(barra['x']), float(barra['y']), float(barra['area'])) for barra in barras)
+
+@lru_cache(maxsize=256)
+def _discretizar(rectangulos, barras, n_fibras_x, n_fibras_y):
+    """
+    Discretiza una unión de rectángulos (x0, y0, x1, y1) de concreto en fibras y agrega las barras.
+    El origen se traslada al centroide bruto del concreto.
+    La geometría solo depende de la forma, por eso se guarda en caché sin f'c ni fy.
+    """
+    xs, ys, areas, esquinas = [], [], [], []
+    for x0, y0, x1, y1 in rectangulos:
+        esquinas.extend([(x0, y0), (x1, y0), (x1, y1), (x0, y1)])
+        dx = (x1 - x0) / n_fibras_x
+        dy = (y1 - y0) / n_fibras_y
+        xc = x0 + dx * (np.arange(n_fibras_x) + 0.5)
+        yc = y0 + dy * (np.arange(n_fibras_y) + 0.5)
+        X, Y = np.meshgrid(xc, yc)
+        xs.append(X.ravel()); ys.append(Y.ravel()); areas.append(np.full(X.size, dx * dy))
+
+    return _armar_seccion(np.concatenate(xs), np.concatenate(ys), np.concatenate(areas), np.array(esquinas), barras)
+
+@lru_cache(maxsize=256)
+def _discretizar_poligono(vertices, barras, n_fibras_x, n_fibras_y):
+    """
+    Discretiza un polígono simple (vértices (x, y) en orden) en una malla de fibras sobre su
+    rectángulo envolvente; se conservan las celdas con centro dentro del polígono (regla par-impar)
+    y su área se escala para que la suma sea el área exacta del polígono.
+    """
+    vert = np.array(vertices, dtype=float)
+    x0, y0 = vert.min(axis=0)
+    x1, y1 = vert.max(axis=0)
+    dx = (x1 - x0) / n_fibras_x
+    dy = (y1 - y0) / n_fibras_y
+    X, Y = np.meshgrid(x0 + dx * (np.arange(n_fibras_x) + 0.5), y0 + dy * (np.arange(n_fibras_y) + 0.5))
+    X, Y = X.ravel(), Y.ravel()
+
+    xi, yi = vert[:, 0], vert[:, 1]
+    xj, yj = np.roll(xi, -1), np.roll(yi, -1)
+    cruza_y = (yi[None, :] > Y[:, None]) != (yj[None, :] > Y[:, None])
+    x_corte = xi + (Y[:, None] - yi) * (xj - xi) / np.where(yj != yi, yj - yi, 1.0)
+    dentro = np.count_nonzero(cruza_y & (X[:, None] < x_corte), axis=1) % 2 == 1
+
+    area_poligono = abs(np.sum(xi * yj - xj * yi)) / 2.0
+    area_c = np.full(np.count_nonzero(dentro), area_poligono / max(np.count_nonzero(dentro), 1))
+    return _armar_seccion(X[dentro], Y[dentro], area_c, vert, barras)
+
+def _armar_seccion(x_c, y_c, area_c, esquinas, barras):
+    """Une fibras de concreto y barras y traslada el origen al centroide bruto del concreto."""
+    Ag_mm2 = area_c.sum()
+    x_g = np.dot(x_c, area_c) / Ag_mm2
+    y_g = np.dot(y_c, area_c) / Ag_mm2
+
+    barras_arr = np.array(barras, dtype=float).reshape(-1, 3)
+    x = np.concatenate([x_c, barras_arr[:, 0]]) - x_g
+    y = np.concatenate([y_c, barras_arr[:, 1]]) - y_g
+    seccion = {
+        "x": x,
+        "y": y,
+        "area": np.concatenate([area_c, barras_arr[:, 2]]),
+        "material": np.concatenate([np.full(x_c.size, MATERIAL_CONCRETO), np.full(len(barras_arr), MATERIAL_ACERO)]),
+        # Matriz geométrica [1, x, y] (3 x fibras) para evaluar planos con un solo producto matricial
+        "G": np.vstack([np.ones_like(x), x, y]),
+        # Esquinas del contorno de concreto (para ubicar la fibra extrema comprimida)
+        "esquinas": esquinas - (x_g, y_g),
+        "Ag_mm2": Ag_mm2,
+        "As_mm2": barras_arr[:, 2].sum(),
+        "centroide_mm": (x_g, y_g),
+    }
+    for arr in seccion.values():
+        if isinstance(arr, np.ndarray):
+            arr.setflags(write=False) # Compartida entre llamadas: solo lectura
+    return seccion
+
+def seccion_fibras_rectangular(b_mm, h_mm, barras, n_fibras_x=40, n_fibras_y=40):
+    """
+    Sección rectangular b x h (origen en el centroide) con las barras dadas
+    (p. ej. las de _generar_posicion_barras). Retorna el diccionario de fibras en caché.
+    """
+    rectangulos = ((-b_mm / 2.0, -h_mm / 2.0, b_mm / 2.0, h_mm / 2.0),)
+    return _discretizar(rectangulos, _barras_a_tupla(barras), int(n_fibras_x), int(n_fibras_y))
+
+def seccion_fibras_T(b_eff_mm, hf_mm, bw_mm, h_mm, barras, n_fibras_x=40, n_fibras_y=40):
+    """
+    Sección T: ala b_eff x hf sobre alma bw x (h - hf).
+    Coordenadas de las barras con origen en la fibra superior (y negativo hacia abajo);
+    la sección resultante queda referida a su centroide bruto.
+    """
+    rectangulos = (
+        (-b_eff_mm / 2.0, -hf_mm, b_eff_mm / 2.0, 0.0),  # Ala
+        (-bw_mm / 2.0, -h_mm, bw_mm / 2.0, -hf_mm),      # Alma
+    )
+    return _discretizar(rectangulos, _barras_a_tupla(barras), int(n_fibras_x), int(n_fibras_y))
+
+def seccion_fibras_poligonal(vert_x_mm, vert_y_mm, barras, n_fibras_x=40, n_fibras_y=40):
+    """
+    Sección poligonal arbitraria (p. ej. L, T o círculo aproximado) con las barras dadas en el
+    mismo sistema de coordenadas. Retorna el diccionario de fibras en caché, referido al centroide.
+    """
+    vertices = tuple(zip(np.asarray(vert_x_mm, dtype=float).tolist(), np.asarray(vert_y_mm, dtype=float).tolist()))
+    return _discretizar_poligono(vertices, _barras_a_tupla(barras), int(n_fibras_x), int(n_fibras_y))
+
+def planos_desde_eje_neutro(seccion, c_values, theta_values):
+    """
+    Planos de deformación con εcu en la fibra más comprimida para cada (c, θ).
+    u = (sen θ, cos θ) apunta hacia la fibra más comprimida (misma convención de diseno_columna).
+    c_values: vector común a todos los θ o matriz (c, θ) con los 'c' de cada θ.
+    Retorna la matriz de planos (N x 3) con coeficientes de [1, x, y], N = len(c) * len(θ)
+    en orden c exterior, θ interior.
+    """
+    c = np.asarray(c_values, dtype=float)
+    if c.ndim == 1:
+        c = c[:, None]
+    ux = np.sin(theta_values)[None, :]
+    uy = np.cos(theta_values)[None, :]
+    esquinas = seccion["esquinas"]
+    s_max = np.max(esquinas[:, :1] * ux + esquinas[:, 1:] * uy, axis=0)[None, :] # Fibra extrema comprimida
+    # ε = εcu (c - (s_max - x ux - y uy)) / c
+    eps0 = EPSILON_CU * (1.0 - s_max / c)
+    kx = EPSILON_CU * ux / c
+    ky = EPSILON_CU * uy / c
+    return np.stack(np.broadcast_arrays(eps0, kx, ky), axis=-1).reshape(-1, 3)
+
+def evaluar_planos_deformacion(seccion, planos, fc_MPa, fy_MPa):
+    """
+    Evalúa N planos de deformación (N x 3) sobre la sección de fibras.
+    Concreto: bloque de Whitney (0.85 f'c donde ε >= εcu (1 - β1)).
+    Acero: elastoplástico, descontando el concreto desplazado dentro del bloque.
+    Retorna dict con P_N, Mx_Nmm, My_Nmm y epsilon_t (deformación de tracción de la barra
+    más traccionada, 0 si todas están comprimidas).
+    """
+    beta_1 = beta1(fc_MPa)
+    eps_bloque = EPSILON_CU * (1.0 - beta_1)
+    acero = seccion["material"] == MATERIAL_ACERO
+    G = seccion["G"]
+    # Brazos de palanca [1, y, x] para (P, Mx, My)
+    brazos = np.vstack([np.ones_like(seccion["x"]), seccion["y"], seccion["x"]]).T * seccion["area"][:, None]
+
+    planos = np.atleast_2d(planos)
+    resultado = np.empty((len(planos), 3))
+    epsilon_t = np.zeros(len(planos))
+    for i in range(0, len(planos), PLANOS_POR_BLOQUE):
+        eps = planos[i:i + PLANOS_POR_BLOQUE] @ G # (planos, fibras)
+        en_bloque = eps >= eps_bloque
+        sigma = np.where(acero,
+                         np.clip(ES_MPA * eps, -fy_MPa, fy_MPa) - np.where(en_bloque, 0.85 * fc_MPa, 0.0),
+                         np.where(en_bloque, 0.85 * fc_MPa, 0.0))
+        resultado[i:i + PLANOS_POR_BLOQUE] = sigma @ brazos
+        if acero.any():
+            epsilon_t[i:i + PLANOS_POR_BLOQUE] = np.maximum(-np.min(eps[:, acero], axis=1), 0.0)
+
+    return {"P_N": resultado[:, 0], "Mx_Nmm": resultado[:, 1], "My_Nmm": resultado[:, 2], "epsilon_t": epsilon_t}
+
+def momento_nominal_uniaxial(seccion, fc_MPa, fy_MPa, P_N=0.0, theta_rad=0.0, num_c=200, num_refinamientos=2):
+    """
+    Momento nominal para la carga axial P_N (compresión positiva) en la dirección θ.
+    Cada refinamiento evalúa num_c profundidades 'c' a la vez y se queda con el intervalo
+    donde cambia el signo de P - P_N.
+    Retorna dict con Mn_Nmm (en la dirección θ), c_mm y epsilon_t.
+    """
+    proy = seccion["esquinas"] @ [np.sin(theta_rad), np.cos(theta_rad)]
+    profundidad = proy.max() - proy.min()
+    c_min, c_max = 1e-3 * profundidad, 3.0 * profundidad
+
+    for _ in range(num_refinamientos + 1):
+        c_values = np.linspace(c_min, c_max, num_c)
+        res = evaluar_planos_deformacion(seccion, planos_desde_eje_neutro(seccion, c_values, [theta_rad]), fc_MPa, fy_MPa)
+        exceso = res["P_N"] - P_N
+        cambio = np.nonzero(np.diff(np.sign(exceso)) != 0)[0]
+        if len(cambio) == 0:
+            raise ValueError(f"No se encontró equilibrio para P = {P_N:.0f} N en el rango de 'c'.")
+        k = cambio[0]
+        c_min, c_max = c_values[k], c_values[k + 1]
+
+    # Interpolación lineal final entre los dos planos que encierran el equilibrio
+    w = exceso[k] / (exceso[k] - exceso[k + 1])
+    Mx = res["Mx_Nmm"][k] + w * (res["Mx_Nmm"][k + 1] - res["Mx_Nmm"][k])
+    My = res["My_Nmm"][k] + w * (res["My_Nmm"][k + 1] - res["My_Nmm"][k])
+    return {
+        "Mn_Nmm": Mx * np.cos(theta_rad) + My * np.sin(theta_rad),
+        "c_mm": c_values[k] + w * (c_values[k + 1] - c_values[k]),
+        "epsilon_t": res["epsilon_t"][k] + w * (res["epsilon_t"][k + 1] - res["epsilon_t"][k]),
+    }
@@ -0,0 +1,121 @@
+# ==============================================================================
+# SELECCIÓN DE BARRAS - ÍNDICE ORDENADO DE COMBINACIONES CONSTRUIBLES
+# ==============================================================================
+from functools import lru_cache
+
+import numpy as np
+from unidades import *
+from validate_positive import validate_positive
+
+# Barras corrugadas (designación en octavos de pulgada) y diámetro nominal en mm
+BARRAS_MM = {"#3": 9.5, "#4": 12.7, "#5": 15.9, "#6": 19.1, "#7": 22.2, "#8": 25.4, "#9": 28.7, "#10": 32.3}
+DIAMETROS_BARRA_MM = tuple(BARRAS_MM.values())
+NOMBRE_BARRA = {d: nombre for nombre, d in BARRAS_MM.items()}
+DENSIDAD_ACERO_KG_M3 = 7850.0
+SEPARACION_LIBRE_MIN_MM = 25.0 # NSR-10 C.7.6.1
+
+def _area_barra(diam_mm):
+    return np.pi * (np.asarray(diam_mm, dtype=float) / 2.0)**2
+
+def _congelar(indice):
+    """Marca los arreglos del índice como solo lectura (el índice se comparte desde la caché)."""
+    for v in indice.values():
+        if isinstance(v, np.ndarray):
+            v.setflags(write=False)
+    return indice
+
+@lru_cache(maxsize=256)
+def indice_capa_viga(b_cm, rec_libre_cm, diam_estribo_mm, diametros_mm=DIAMETROS_BARRA_MM,
+                     tamano_agregado_mm=19.0, max_diferencia_diametros=2):
+    """
+    Combinaciones construibles de una capa de refuerzo en una viga de ancho b: n1 barras de
+    diámetro d1 (al menos 2, en las esquinas) más n2 barras de un diámetro menor d2, con a lo
+    sumo max_diferencia_diametros números de diferencia entre ellos.
+    Filtro de separación libre >= max(db mayor, 25 mm, 4/3·tamaño del agregado) (NSR-10 C.7.6.1, C.3.3.2).
+    Retorna un diccionario de arreglos ordenados por área creciente (con igual área, menos
+    barras primero), listo para búsqueda binaria con seleccionar_barras. Se guarda en caché
+    por argumentos (diametros_mm como tupla): llamadas repetidas con la misma sección no recalculan.
+    """
+    validate_positive(b_cm=b_cm, rec_libre_cm=rec_libre_cm, tamano_agregado_mm=tamano_agregado_mm)
+    diametros = np.sort(np.asarray(diametros_mm, dtype=float))
+    ancho_libre = cm_to_mm(b_cm) - 2.0 * (cm_to_mm(rec_libre_cm) + diam_estribo_mm)
+    s_min = np.maximum(np.maximum(diametros, SEPARACION_LIBRE_MIN_MM), 4.0 / 3.0 * tamano_agregado_mm)
+    n_max = int(np.floor((ancho_libre + s_min.min()) / (diametros.min() + s_min.min())))
+    if n_max < 2:
+        raise ValueError("El ancho libre de la sección no admite dos barras.")
+
+    # Pares (d1 mayor, d2 menor o igual) y conteos, en una sola malla
+    i1, i2, n1, n2 = (v.ravel() for v in np.meshgrid(
+        np.arange(len(diametros)), np.arange(len(diametros)), np.arange(2, n_max + 1), np.arange(0, n_max - 1), indexing="ij"))
+    validas = (i2 < i1) & (i1 - i2 <= max_diferencia_diametros) & (n2 >= 1) # Dos diámetros
+    validas |= (i2 == i1) & (n2 == 0) # Un solo diámetro
+    i1, i2, n1, n2 = i1[validas], i2[validas], n1[validas], n2[validas]
+    d1, d2 = diametros[i1], diametros[i2]
+    n_total = n1 + n2
+    separacion = (ancho_libre - n1 * d1 - n2 * d2) / (n_total - 1)
+    construible = separacion >= s_min[i1]
+    i1, i2, n1, n2, d1, d2, n_total = (v[construible] for v in (i1, i2, n1, n2, d1, d2, n_total))
+
+    area_mm2 = n1 * _area_barra(d1) + n2 * _area_barra(d2)
+    orden = np.lexsort((i1 != i2, n_total, area_mm2)) # Área, luego menos barras, luego un diámetro
+    area_mm2, n1, d1, n2, d2, n_total = (v[orden] for v in (area_mm2, n1, d1, n2, d2, n_total))
+    descripcion = np.array([f"{a}{NOMBRE_BARRA.get(x, f'Ø{x:g}')}" + (f" + {b}{NOMBRE_BARRA.get(y, f'Ø{y:g}')}" if b else "")
+                            for a, x, b, y in zip(n1.tolist(), d1.tolist(), n2.tolist(), d2.tolist())], dtype=object)
+    return _congelar({
+        "area_mm2": area_mm2,
+        "peso_kg_m": area_mm2 * 1e-6 * DENSIDAD_ACERO_KG_M3,
+        "n1": n1, "d1_mm": d1, "n2": n2, "d2_mm": d2,
+        "num_barras": n_total,
+        "descripcion": descripcion,
+    })
+
+@lru_cache(maxsize=64)
+def indice_barras_por_metro(diametros_mm=DIAMETROS_BARRA_MM, s_min_cm=7.5, s_max_cm=45.0, paso_cm=2.5):
+    """
+    Combinaciones (diámetro, separación) para losas y zapatas, con separaciones múltiplos
+    de paso_cm entre s_min_cm y s_max_cm (el límite de la norma, p. ej. min(3h, 45 cm) en
+    losas, lo fija quien llama). Área por metro en mm²/m. Mismo formato y orden que
+    indice_capa_viga (con igual área, mayor separación primero).
+    """
+    validate_positive(s_min_cm=s_min_cm, s_max_cm=s_max_cm, paso_cm=paso_cm)
+    diametros = np.asarray(diametros_mm, dtype=float)
+    separaciones_cm = np.arange(np.ceil(s_min_cm / paso_cm) * paso_cm, s_max_cm + 1e-9, paso_cm)
+    d, s = (v.ravel() for v in np.meshgrid(diametros, separaciones_cm, indexing="ij"))
+    area_mm2 = _area_barra(d) * 1000.0 / cm_to_mm(s)
+    orden = np.lexsort((-s, area_mm2))
+    area_mm2, d, s = area_mm2[orden], d[orden], s[orden]
+    descripcion = np.array([f"{NOMBRE_BARRA.get(x, f'Ø{x:g}')} c/{y:g} cm" for x, y in zip(d.tolist(), s.tolist())], dtype=object)
+    return _congelar({
+        "area_mm2": area_mm2,
+        "peso_kg_m": area_mm2 * 1e-6 * DENSIDAD_ACERO_KG_M3, # Por metro de ancho y metro de longitud
+        "d_mm": d, "separacion_cm": s,
+        "descripcion": descripcion,
+    })
+
+def seleccionar_barras_lote(As_req_cm2, indice):
+    """
+    Para cada As requerido (arreglo), la combinación más liviana del índice con área >= As_req
+    (búsqueda binaria sobre el área ordenada). Retorna las posiciones en el índice
+    (-1 si ninguna alcanza) y un diccionario con los campos del índice para cada elemento.
+    """
+    As_req_mm2 = cm2_to_mm2(np.asarray(As_req_cm2, dtype=float))
+    pos = np.searchsorted(indice["area_mm2"], As_req_mm2 - 1e-9, side="left")
+    alcanza = pos < len(indice["area_mm2"])
+    pos = np.where(alcanza, pos, -1)
+    seguro = np.where(alcanza, pos, 0)
+    campos = {clave: np.where(alcanza, valor[seguro], None if valor.dtype == object else np.nan)
+              for clave, valor in indice.items()}
+    campos["As_prov_cm2"] = mm2_to_cm2(campos.pop("area_mm2"))
+    return pos, campos
+
+def seleccionar_barras(As_req_cm2, indice):
+    """Versión escalar de seleccionar_barras_lote. Retorna un diccionario con status y la combinación."""
+    areas = indice["area_mm2"]
+    pos = int(np.searchsorted(areas, cm2_to_mm2(As_req_cm2) - 1e-9, side="left"))
+    if pos >= len(areas):
+        return {"status": "Error",
+                "mensaje": f"As requerido ({As_req_cm2:.2f} cm²) excede la mayor combinación construible ({mm2_to_cm2(areas[-1]):.2f} cm²)."}
+    resultado = {clave: (valor[pos].item() if hasattr(valor[pos], "item") else valor[pos])
+                 for clave, valor in indice.items() if clave != "area_mm2"}
+    return {"status": "OK", "As_prov_cm2": float(mm2_to_cm2(areas[pos])), **resultado,
+            "mensaje": f"Usar {resultado['descripcion']}."}
@@ -0,0 +1,398 @@
+# ==============================================================================
+# VERIFICACIÓN DE COLUMNAS - RELACIÓN DEMANDA/CAPACIDAD (DCR) BIAXIAL
+# ==============================================================================
+from collections import OrderedDict
+
+import numpy as np
+from unidades import *
+from .diseno_columna import calcular_diagrama_interaccion_columna, calcular_diagrama_uniaxial_columna
+from .cache_diagramas import firma_seccion
+
+ELEMENTOS_POR_BLOQUE = 4_000_000 # Tamaño máximo de los arreglos temporales (demandas x c x θ)
+MAX_CONTORNOS_MEMORIA = 4096 # Contornos Mx-My guardados (por sección y nivel de P redondeado)
+MAX_SECCIONES_MEMORIA = 64 # Mallas con meridianos ordenados guardadas
+TOLERANCIA_SEGMENTO = 1e-9 # Holgura del parámetro rayo-segmento en _radio_contorno
+
+_contornos = OrderedDict() # (firma, nivel) -> (Mx_Nmm, My_Nmm) de solo lectura
+_meridianos = OrderedDict() # firma -> (P_ord, Mx_ord, My_ord)
+
+def demandas_por_combinacion(combinaciones, solicitaciones_por_caso, sismo_reversible=True):
+    """
+    Construye la matriz de demandas (N x 3) de (Pu_kN, Mux_kNm, Muy_kNm) a partir de las
+    combinaciones de generar_combinaciones_carga()['ultimas'] y de las solicitaciones por caso
+    de carga, p. ej. {"D": (P, Mx, My), "L": (...), "E": (...)}.
+    Si sismo_reversible es True, cada combinación con E se evalúa con +E y con -E.
+    Retorna (nombres, demandas).
+    """
+    casos = sorted(solicitaciones_por_caso)
+    S = np.array([solicitaciones_por_caso[caso] for caso in casos], dtype=float).reshape(len(casos), 3)
+
+    nombres, filas = [], []
+    for nombre, factores in combinaciones:
+        faltantes = set(factores) - set(casos)
+        if faltantes - {"Lr"}: # Lr es opcional (cubiertas); los demás casos deben existir
+            raise ValueError(f"La combinación '{nombre}' usa casos sin solicitaciones: {sorted(faltantes)}")
+        fila = np.array([factores.get(caso, 0.0) for caso in casos])
+        nombres.append(nombre); filas.append(fila)
+        if sismo_reversible and "E" in factores:
+            fila_neg = fila.copy()
+            fila_neg[casos.index("E")] *= -1
+            nombres.append(nombre.replace("+ E", "- E") if "+ E" in nombre else f"{nombre} (-E)")
+            filas.append(fila_neg)
+
+    return nombres, np.array(filas) @ S
+
+def _meridianos_ordenados(diagrama):
+    """Ordena cada meridiano θ de la malla por P creciente (ejes (c, θ))."""
+    P = diagrama["P_malla_N"]
+    orden = np.argsort(P, axis=0, kind="stable")
+    return (np.take_along_axis(P, orden, axis=0),
+            np.take_along_axis(diagrama["Mx_malla_Nmm"], orden, axis=0),
+            np.take_along_axis(diagrama["My_malla_Nmm"], orden, axis=0))
+
+def _interpolar_meridianos(P_ord, Mx_ord, My_ord, P_niveles):
+    """
+    Interpola (Mx, My) en cada meridiano para cada nivel de carga axial (forma (niveles, θ)).
+    Los niveles fuera del rango del meridiano se recortan a su extremo.
+    """
+    n_c = P_ord.shape[0]
+    P_niveles = np.asarray(P_niveles, dtype=float)
+    # Índice del tramo [k, k+1] que contiene a cada nivel, para todos los meridianos a la vez
+    k = np.clip(np.sum(P_ord[None, :, :] <= P_niveles[:, None, None], axis=1) - 1, 0, n_c - 2) # (niveles, θ)
+    j = np.arange(P_ord.shape[1])
+    P0, P1 = P_ord[k, j], P_ord[k + 1, j]
+    w = np.clip((P_niveles[:, None] - P0) / np.where(P1 > P0, P1 - P0, 1.0), 0.0, 1.0)
+    Mx = Mx_ord[k, j] + w * (Mx_ord[k + 1, j] - Mx_ord[k, j])
+    My = My_ord[k, j] + w * (My_ord[k + 1, j] - My_ord[k, j])
+    return Mx, My
+
+def _firma_diagrama(diagrama):
+    """Firma de la sección y resolución de un diagrama (a partir de sus parámetros)."""
+    params = diagrama["params"]
+    huella_malla = (diagrama["P_malla_N"].shape, float(diagrama["P_malla_N"].sum()), float(diagrama["Mx_malla_Nmm"].sum()))
+    return firma_seccion(**{k: v for k, v in params.items() if k != "num_evaluaciones"}, huella_malla=huella_malla)
+
+def _meridianos_memo(firma, diagrama):
+    """_meridianos_ordenados con memoria LRU por firma."""
+    if firma in _meridianos:
+        _meridianos.move_to_end(firma)
+        return _meridianos[firma]
+    ordenados = _meridianos_ordenados(diagrama)
+    _meridianos[firma] = ordenados
+    while len(_meridianos) > MAX_SECCIONES_MEMORIA:
+        _meridianos.popitem(last=False)
+    return ordenados
+
+def contornos_P(diagrama, P_kN, tolerancia_kN=1.0):
+    """
+    Contornos Mx-My de la superficie de diseño en varios niveles de carga axial a la vez,
+    interpolando cada meridiano θ de la malla estructurada.
+    Los niveles se redondean a múltiplos de tolerancia_kN y se guardan en memoria por
+    (sección, nivel): las llamadas siguientes con niveles ya vistos no recalculan.
+    Retorna Mx_kNm y My_kNm con forma (niveles, θ), en el orden de P_kN.
+    """
+    if diagrama.get("status") != "OK" or "P_malla_N" not in diagrama:
+        return {"status": "Error", "mensaje": "Diagrama de interacción no válido o sin malla estructurada."}
+    if tolerancia_kN <= 0:
+        raise ValueError(f"'tolerancia_kN' debe ser positivo, no {tolerancia_kN}")
+
+    firma = _firma_diagrama(diagrama)
+    niveles = np.rint(np.atleast_1d(np.asarray(P_kN, dtype=float)) / tolerancia_kN).astype(np.int64)
+    unicos, inversa = np.unique(niveles, return_inverse=True)
+    claves = [(firma, tolerancia_kN, n) for n in unicos.tolist()]
+    faltantes = [i for i, clave in enumerate(claves) if clave not in _contornos]
+    Mx_unicos = np.empty((len(unicos), diagrama["P_malla_N"].shape[1]))
+    My_unicos = np.empty_like(Mx_unicos)
+    for i, clave in enumerate(claves):
+        if clave in _contornos:
+            Mx_unicos[i], My_unicos[i] = _contornos[clave]
+            _contornos.move_to_end(clave)
+    if faltantes:
+        P_ord, Mx_ord, My_ord = _meridianos_memo(firma, diagrama)
+        bloque = max(1, ELEMENTOS_POR_BLOQUE // P_ord.size)
+        for k in range(0, len(faltantes), bloque):
+            lote = faltantes[k:k + bloque]
+            Mx_unicos[lote], My_unicos[lote] = _interpolar_meridianos(P_ord, Mx_ord, My_ord, kn_to_n(unicos[lote] * tolerancia_kN))
+        for i in faltantes:
+            contorno = (Mx_unicos[i].copy(), My_unicos[i].copy())
+            for arreglo in contorno:
+                arreglo.setflags(write=False)
+            _contornos[claves[i]] = contorno
+        while len(_contornos) > MAX_CONTORNOS_MEMORIA:
+            _contornos.popitem(last=False)
+
+    P_niveles_kN = niveles * tolerancia_kN
+    return {
+        "status": "OK",
+        "P_kN": P_niveles_kN,
+        "theta_rad": diagrama["theta_rad"],
+        "Mx_kNm": nmm_to_knm(Mx_unicos[inversa]),
+        "My_kNm": nmm_to_knm(My_unicos[inversa]),
+        "sobre_tope": kn_to_n(P_niveles_kN) > diagrama["params"]["phiPn_max_N"],
+        "num_calculados": len(faltantes),
+    }
+
+def limpiar_contornos():
+    """Vacía la memoria de contornos y meridianos ordenados."""
+    _contornos.clear()
+    _meridianos.clear()
+
+def _radio_contorno(Mx_contorno, My_contorno, angulo):
+    """
+    Distancia desde el origen hasta el contorno Mx-My (polígono cerrado por fila) en la
+    dirección 'angulo' (rad). Intersección rayo-segmento vectorizada; 0 si no hay intersección.
+    El parámetro del segmento admite TOLERANCIA_SEGMENTO en sus extremos: un rayo que pasa
+    justo por un vértice del contorno no debe caer entre los dos segmentos que lo comparten.
+    """
+    dx = np.cos(angulo)[:, None]
+    dy = np.sin(angulo)[:, None]
+    Ax, Ay = Mx_contorno, My_contorno
+    Ex = np.roll(Mx_contorno, -1, axis=1) - Ax
+    Ey = np.roll(My_contorno, -1, axis=1) - Ay
+    denom = dx * Ey - dy * Ex
+    s = -(dx * Ay - dy * Ax) / np.where(np.abs(denom) > 1e-12, denom, np.inf)
+    t = (Ax + s * Ex) * dx + (Ay + s * Ey) * dy
+    valido = (s >= -TOLERANCIA_SEGMENTO) & (s <= 1.0 + TOLERANCIA_SEGMENTO) & (t > 0.0) & (np.abs(denom) > 1e-12)
+    return np.max(np.where(valido, t, 0.0), axis=1)
+
+def calcular_dcr_columna(diagrama, demandas, nombres_combinaciones=None, tolerancia_P_kN=None):
+    """
+    Relación demanda/capacidad de una columna para N combinaciones a la vez.
+    demandas: arreglo (N x 3) con (Pu_kN, Mux_kNm, Muy_kNm) por combinación.
+    Para cada fila se corta la superficie en P = Pu (interpolando cada meridiano θ) y se mide
+    la capacidad radial del contorno Mx-My en la dirección del momento demandado.
+    DCR = max(|Mu| / φMn(Pu, dirección), Pu / (0.80·φ·Po), Pu / φPnt), el último solo en tracción
+    (φPnt: la menor tracción que alcanzan todos los meridianos de la malla).
+    'fuera_de_rango' marca las demandas con Pu fuera de [φPnt, 0.80·φ·Po]: su contorno se toma en
+    el extremo del meridiano y no cumplen (DCR axial > 1).
+    tolerancia_P_kN: si se indica, los contornos se toman de contornos_P (Pu redondeado a esa
+    tolerancia y guardado en memoria), útil al repetir verificaciones de la misma sección.
+    """
+    if diagrama.get("status") != "OK" or "P_malla_N" not in diagrama:
+        return {"status": "Error", "mensaje": "Diagrama de interacción no válido o sin malla estructurada."}
+
+    demandas = np.atleast_2d(np.asarray(demandas, dtype=float))
+    if demandas.shape[1] != 3:
+        raise ValueError(f"'demandas' debe tener forma (N, 3) con (Pu, Mux, Muy), se recibió {demandas.shape}")
+
+    Pu_N = kn_to_n(demandas[:, 0])
+    Mux_Nmm = knm_to_nmm(demandas[:, 1])
+    Muy_Nmm = knm_to_nmm(demandas[:, 2])
+    Mu_Nmm = np.hypot(Mux_Nmm, Muy_Nmm)
+    angulo = np.arctan2(Muy_Nmm, Mux_Nmm)
+
+    if tolerancia_P_kN is not None:
+        P_ord, Mx_ord, My_ord = _meridianos_memo(_firma_diagrama(diagrama), diagrama)
+    else:
+        P_ord, Mx_ord, My_ord = _meridianos_ordenados(diagrama)
+    P_max_N = min(diagrama["params"]["phiPn_max_N"], P_ord[-1].min())
+    P_min_N = P_ord[0].max()
+
+    M_cap_Nmm = np.empty(len(demandas))
+    if tolerancia_P_kN is not None:
+        # Contornos memorizados por nivel de P redondeado
+        contornos = contornos_P(diagrama, demandas[:, 0], tolerancia_P_kN)
+        M_cap_Nmm[:] = _radio_contorno(knm_to_nmm(contornos["Mx_kNm"]), knm_to_nmm(contornos["My_kNm"]), angulo)
+    else:
+        # Procesar por bloques para acotar la memoria de los arreglos (demandas, c, θ)
+        bloque = max(1, ELEMENTOS_POR_BLOQUE // P_ord.size)
+        for i in range(0, len(demandas), bloque):
+            Mx_c, My_c = _interpolar_meridianos(P_ord, Mx_ord, My_ord, Pu_N[i:i + bloque])
+            M_cap_Nmm[i:i + bloque] = _radio_contorno(Mx_c, My_c, angulo[i:i + bloque])
+
+    dcr_flexion = np.where(Mu_Nmm > 0, Mu_Nmm / np.where(M_cap_Nmm > 0, M_cap_Nmm, np.nan), 0.0)
+    dcr_flexion = np.where(np.isnan(dcr_flexion), np.inf, dcr_flexion) # Sin capacidad a esa carga axial
+    dcr_axial = np.maximum(Pu_N, 0.0) / P_max_N
+    if P_min_N < 0:
+        dcr_traccion = np.maximum(-Pu_N, 0.0) / -P_min_N
+    else: # Malla sin rama de tracción: ninguna tracción es admisible
+        dcr_traccion = np.where(Pu_N < 0, np.inf, 0.0)
+    fuera_de_rango = (Pu_N > P_max_N) | (Pu_N < P_min_N)
+    dcr = np.maximum(np.maximum(dcr_flexion, dcr_axial), dcr_traccion)
+
+    i_gob = int(np.argmax(dcr))
+    return {
+        "status": "OK",
+        "dcr": dcr,
+        "dcr_flexion": dcr_flexion,
+        "dcr_axial": dcr_axial,
+        "dcr_traccion": dcr_traccion,
+        "fuera_de_rango": fuera_de_rango,
+        "phi_Mn_kNm": nmm_to_knm(M_cap_Nmm),
+        "dcr_max": float(dcr[i_gob]),
+        "indice_gobernante": i_gob,
+        "combinacion_gobernante": nombres_combinaciones[i_gob] if nombres_combinaciones is not None else i_gob,
+        "cumple": bool(dcr[i_gob] <= 1.0),
+        "phiPn_max_kN": n_to_kn(P_max_N),
+        "phiPn_min_kN": n_to_kn(P_min_N)
+    }
+
+def puntos_dentro_superficie(diagrama, demandas, tolerancia=1e-6):
+    """
+    Clasifica N demandas (Pu_kN, Mux_kNm, Muy_kNm) como dentro o fuera de la superficie de
+    diseño, usando la envolvente convexa (diagrama con incluir_envolvente=True) y el tope
+    0.80·φ·Po. Cada demanda se ubica en su franja de P por búsqueda binaria y solo se prueba
+    contra las caras que cruzan esa franja, en bloques vectorizados.
+    Donde φ vuelve la superficie levemente no convexa, la envolvente puede sobrestimar la
+    capacidad; calcular_dcr_columna da el valor sobre la malla.
+    """
+    if diagrama.get("status") != "OK" or "envolvente_ecuaciones" not in diagrama:
+        return {"status": "Error", "mensaje": "El diagrama no incluye la envolvente convexa (incluir_envolvente=True)."}
+
+    demandas = np.atleast_2d(np.asarray(demandas, dtype=float))
+    if demandas.shape[1] != 3:
+        raise ValueError(f"'demandas' debe tener forma (N, 3) con (Pu, Mux, Muy), se recibió {demandas.shape}")
+
+    ecuaciones = diagrama["envolvente_ecuaciones"]
+    caras = diagrama["envolvente_caras_franja"]
+    punteros = diagrama["envolvente_punteros_franja"]
+    cortes_P = diagrama["envolvente_cortes_P_kN"]
+    num_franjas = len(cortes_P) - 1
+
+    P = demandas[:, 0]
+    franja = np.searchsorted(cortes_P, P, side="right") - 1
+    franja[P == cortes_P[-1]] = num_franjas - 1 # El borde superior pertenece a la última franja
+    dentro = (franja >= 0) & (franja < num_franjas) & (P <= n_to_kn(diagrama["params"]["phiPn_max_N"]) + tolerancia)
+
+    # Agrupar las demandas por franja y probar cada grupo contra sus caras
+    candidatas = np.nonzero(dentro)[0]
+    candidatas = candidatas[np.argsort(franja[candidatas], kind="stable")]
+    inicio = np.searchsorted(franja[candidatas], np.arange(num_franjas + 1))
+    for k in range(num_franjas):
+        grupo = candidatas[inicio[k]:inicio[k + 1]]
+        if len(grupo) == 0:
+            continue
+        eq = ecuaciones[caras[punteros[k]:punteros[k + 1]]]
+        bloque = max(1, ELEMENTOS_POR_BLOQUE // max(len(eq), 1))
+        for i in range(0, len(grupo), bloque):
+            sel = grupo[i:i + bloque]
+            dentro[sel] = np.all(demandas[sel] @ eq[:, :3].T + eq[:, 3] <= tolerancia, axis=1)
+
+    num_fuera = int(np.count_nonzero(~dentro))
+    return {
+        "status": "OK",
+        "dentro": dentro,
+        "num_fuera": num_fuera,
+        "cumple": num_fuera == 0
+    }
+
+# --- Verificación rápida (Bresler) ---
+def _curva_uniaxial_diseno(diagrama_uniaxial):
+    """
+    Curva de diseño (φPn, |φMn|) de tracción pura a compresión pura, con φPn forzado a ser
+    creciente para poder interpolar por carga axial o por ángulo de excentricidad.
+    """
+    clave = diagrama_uniaxial["puntos_clave"]
+    phiPn = np.concatenate([[clave["traccion_pura"]["phiPn_N"]], diagrama_uniaxial["phiPn_N"], [clave["compresion_pura"]["phiPn_N"]]])
+    phiMn = np.abs(np.concatenate([[0.0], diagrama_uniaxial["phiMn_Nmm"], [0.0]]))
+    return np.maximum.accumulate(phiPn), phiMn
+
+def _capacidades_uniaxiales(diagrama_uniaxial, Pu_N, Mu_Nmm):
+    """
+    Para cada demanda retorna (φPn a la excentricidad Mu/Pu, φMn a la carga axial Pu) sobre
+    la curva uniaxial. La excentricidad se interpola con el ángulo atan2(φPn, φMn), que
+    crece de -90° (tracción pura) a 90° (compresión pura).
+    """
+    phiPn, phiMn = _curva_uniaxial_diseno(diagrama_uniaxial)
+    angulo = np.maximum.accumulate(np.arctan2(phiPn, phiMn))
+    phiPn_e = np.interp(np.arctan2(Pu_N, np.abs(Mu_Nmm)), angulo, phiPn)
+    phiMn_P = np.interp(Pu_N, phiPn, phiMn, left=0.0, right=0.0)
+    return phiPn_e, phiMn_P
+
+def _relacion_momento(Mu_Nmm, phiMn_Nmm):
+    """|Mu| / φMn por demanda: 0 sin momento (también con φMn = 0) e infinito si hay momento sin capacidad."""
+    relacion = np.divide(np.abs(Mu_Nmm), phiMn_Nmm, out=np.full(len(Mu_Nmm), np.inf), where=phiMn_Nmm > 0)
+    return np.where(Mu_Nmm == 0, 0.0, relacion)
+
+def verificacion_rapida_bresler(diagrama_x, diagrama_y, demandas, nombres_combinaciones=None,
+                                exponente_contorno=1.0, rango_revision=(0.85, 1.15)):
+    """
+    Verificación rápida biaxial con los diagramas uniaxiales (calcular_diagrama_uniaxial_columna
+    con eje "X" y eje "Y") para N combinaciones a la vez.
+    - Pu >= 0.1 f'c Ag: carga recíproca de Bresler, 1/φPn = 1/φPnx + 1/φPny - 1/φPo, y
+      DCR = Pu / min(φPn, 0.80·φ·Po).
+    - Pu < 0.1 f'c Ag: contorno de carga, DCR = (Mux/φMnx)^α + (Muy/φMny)^α con α = exponente_contorno
+      (α = 1.0 es el valor conservador).
+    - Pu < 0: además DCR >= Pu / φPnt (tracción pura del diagrama uniaxial menos resistente), porque
+      las curvas uniaxiales no tienen capacidad por debajo de φPnt.
+    'requiere_superficie' marca las columnas con DCR máximo dentro de rango_revision, que deben
+    verificarse con la superficie completa (calcular_dcr_columna).
+    """
+    if diagrama_x.get("status") != "OK" or diagrama_y.get("status") != "OK":
+        return {"status": "Error", "mensaje": "Diagramas uniaxiales no válidos."}
+
+    demandas = np.atleast_2d(np.asarray(demandas, dtype=float))
+    if demandas.shape[1] != 3:
+        raise ValueError(f"'demandas' debe tener forma (N, 3) con (Pu, Mux, Muy), se recibió {demandas.shape}")
+
+    params = diagrama_x["params"]
+    Ag_mm2 = cm_to_mm(params["b_cm"]) * cm_to_mm(params["h_cm"])
+    phiPo_N = diagrama_x["puntos_clave"]["compresion_pura"]["phiPn_N"]
+    phiPn_max_N = params["phiPn_max_N"]
+    phiPnt_N = max(diagrama_x["puntos_clave"]["traccion_pura"]["phiPn_N"],
+                   diagrama_y["puntos_clave"]["traccion_pura"]["phiPn_N"])
+
+    Pu_N = kn_to_n(demandas[:, 0])
+    Mux_Nmm = knm_to_nmm(demandas[:, 1])
+    Muy_Nmm = knm_to_nmm(demandas[:, 2])
+    phiPnx_N, phiMnx_Nmm = _capacidades_uniaxiales(diagrama_x, Pu_N, Mux_Nmm)
+    phiPny_N, phiMny_Nmm = _capacidades_uniaxiales(diagrama_y, Pu_N, Muy_Nmm)
+
+    # Método de la carga recíproca (Bresler)
+    # (φPnx o φPny nulos en tracción dan 1/0; esas filas usan el contorno de carga)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        inv_phiPn = 1.0 / phiPnx_N + 1.0 / phiPny_N - 1.0 / phiPo_N
+        phiPn_N = np.minimum(np.where(inv_phiPn > 0, 1.0 / inv_phiPn, 0.0), phiPn_max_N)
+        dcr_reciproco = np.where(phiPn_N > 0, Pu_N / phiPn_N, np.inf)
+
+    # Método del contorno de carga
+    dcr_contorno = (_relacion_momento(Mux_Nmm, phiMnx_Nmm) ** exponente_contorno +
+                    _relacion_momento(Muy_Nmm, phiMny_Nmm) ** exponente_contorno)
+
+    # Tracción axial contra el extremo φPnt de las curvas
+    dcr_traccion = np.maximum(-Pu_N, 0.0) / -phiPnt_N
+
+    usa_reciproco = Pu_N >= 0.1 * params["fc_MPa"] * Ag_mm2
+    dcr = np.maximum(np.where(usa_reciproco, dcr_reciproco, dcr_contorno), dcr_traccion)
+
+    i_gob = int(np.argmax(dcr))
+    dcr_max = float(dcr[i_gob])
+    return {
+        "status": "OK",
+        "dcr": dcr,
+        "metodo": np.where(usa_reciproco, "reciproco", "contorno"),
+        "phiPn_kN": n_to_kn(phiPn_N),
+        "dcr_traccion": dcr_traccion,
+        "dcr_max": dcr_max,
+        "indice_gobernante": i_gob,
+        "combinacion_gobernante": nombres_combinaciones[i_gob] if nombres_combinaciones is not None else i_gob,
+        "cumple": dcr_max <= 1.0,
+        "requiere_superficie": rango_revision[0] <= dcr_max <= rango_revision[1]
+    }
+
+def verificar_columna(
+    b_cm, h_cm, rec_libre_cm,
+    diam_estribo_mm, diam_barra_long_mm,
+    nx_barras, ny_barras,
+    fc_MPa, fy_MPa,
+    demandas, nombres_combinaciones=None,
+    num_puntos_c=60, num_puntos_theta=72):
+    """
+    Verificación en dos etapas: primero la verificación rápida de Bresler con los diagramas
+    uniaxiales; la superficie completa (calcular_dcr_columna) solo se calcula si el DCR rápido
+    queda cerca del límite. El resultado incluye 'modo' ("bresler" o "superficie").
+    """
+    seccion = dict(b_cm=b_cm, h_cm=h_cm, rec_libre_cm=rec_libre_cm, diam_estribo_mm=diam_estribo_mm,
+                   diam_barra_long_mm=diam_barra_long_mm, nx_barras=nx_barras, ny_barras=ny_barras,
+                   fc_MPa=fc_MPa, fy_MPa=fy_MPa)
+    diagrama_x = calcular_diagrama_uniaxial_columna(**seccion, eje="X")
+    if diagrama_x.get("status") != "OK":
+        return diagrama_x
+    diagrama_y = calcular_diagrama_uniaxial_columna(**seccion, eje="Y")
+
+    rapida = verificacion_rapida_bresler(diagrama_x, diagrama_y, demandas, nombres_combinaciones)
+    if rapida.get("status") != "OK" or not rapida["requiere_superficie"]:
+        return dict(rapida, modo="bresler")
+
+    diagrama = calcular_diagrama_interaccion_columna(**seccion, num_puntos_c=num_puntos_c, num_puntos_theta=num_puntos_theta)
+    return dict(calcular_dcr_columna(diagrama, demandas, nombres_combinaciones), modo="superficie")
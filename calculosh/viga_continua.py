@@ -0,0 +1,221 @@
+# ==============================================================================
+# ANÁLISIS DE VIGAS CONTINUAS - MATRIZ DE RIGIDEZ EN BANDA Y ENVOLVENTES M(x), V(x)
+# ==============================================================================
+import numpy as np
+
+try:
+    from scipy.linalg import cholesky_banded, cho_solve_banded
+except ImportError: # scipy es opcional: sin él se resuelve la matriz completa con numpy
+    cholesky_banded = cho_solve_banded = None
+
+PUNTOS_POR_TRAMO = 21 # Muestras de M(x) y V(x) por tramo (incluye los dos apoyos)
+
+def _matriz_banda(luces_m, EI):
+    """
+    Rigidez a rotación de los nudos (apoyos sin desplazamiento vertical): tridiagonal con
+    4EI/L de cada tramo en la diagonal y 2EI/L fuera de ella. Forma de banda superior de
+    scipy.linalg.cholesky_banded: fila 0 = superdiagonal, fila 1 = diagonal.
+    """
+    k = EI / luces_m
+    banda = np.zeros((2, len(luces_m) + 1))
+    banda[1, :-1] += 4.0 * k
+    banda[1, 1:] += 4.0 * k
+    banda[0, 1:] = 2.0 * k
+    return banda
+
+def _resolver_banda(banda, cargas):
+    """Resuelve K·θ = cargas (una columna por caso) con Cholesky en banda, o denso sin scipy."""
+    if cholesky_banded is not None:
+        return cho_solve_banded((cholesky_banded(banda), False), cargas)
+    K = np.diag(banda[1]) + np.diag(banda[0, 1:], 1) + np.diag(banda[0, 1:], -1)
+    return np.linalg.solve(K, cargas)
+
+def _maximo_tramo(M_izq, M_der, w, luces_m):
+    """Máximo positivo exacto de cada tramo (donde V = 0), que puede caer entre muestras."""
+    V_0 = (M_der - M_izq) / luces_m + w * luces_m / 2.0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        x_max = np.where(w > 0, V_0 / w, 0.0)
+    interior = (w > 0) & (x_max > 0) & (x_max < luces_m)
+    return np.where(interior, M_izq + V_0 * x_max - w * x_max**2 / 2.0, np.maximum(M_izq, M_der))
+
+def analizar_viga_continua(
+    luces_m, w_kN_m, EI_relativo=1.0,
+    empotrado_inicio=False, empotrado_fin=False, puntos_por_tramo=PUNTOS_POR_TRAMO):
+    """
+    Viga continua de n tramos sobre apoyos sin asentamiento, con carga uniforme por tramo.
+    - luces_m: luces entre ejes de apoyo (n).
+    - w_kN_m: carga uniforme (n) o varios casos de carga a la vez (casos x n); se resuelven
+      todos con una sola factorización.
+    - EI_relativo: rigidez de cada tramo (escalar o n); los momentos solo dependen de las relaciones.
+    - empotrado_inicio / empotrado_fin: restringe el giro del primer / último apoyo.
+    Convención: M > 0 tracciona la fibra inferior; V = dM/dx.
+    Retorna M y V muestreados (casos x puntos), momentos en los apoyos, el máximo de cada
+    tramo (M_tramo_max_kNm, exacto), reacciones y la envolvente (máximo y mínimo de todos
+    los casos en cada punto).
+    """
+    luces_m = np.atleast_1d(np.asarray(luces_m, dtype=float))
+    w = np.asarray(w_kN_m, dtype=float)
+    un_caso = w.ndim <= 1
+    w = np.atleast_2d(np.broadcast_to(w, luces_m.shape) if un_caso else w)
+    EI = np.broadcast_to(np.asarray(EI_relativo, dtype=float), luces_m.shape)
+    if luces_m.ndim != 1 or np.any(luces_m <= 0):
+        return {"status": "Error", "mensaje": "Las luces deben ser un vector de valores positivos."}
+    if w.shape[1] != len(luces_m):
+        return {"status": "Error", "mensaje": f"Se esperaban {len(luces_m)} cargas por caso, se recibieron {w.shape[1]}."}
+    if np.any(EI <= 0):
+        return {"status": "Error", "mensaje": "EI_relativo debe ser positivo en todos los tramos."}
+    if puntos_por_tramo < 2:
+        return {"status": "Error", "mensaje": "Se requieren al menos 2 puntos por tramo."}
+    num_tramos, num_nudos = len(luces_m), len(luces_m) + 1
+
+    # 1) Momentos de empotramiento (antihorario positivo en el extremo del tramo): ±wL²/12
+    M_emp = w * luces_m**2 / 12.0 # (casos x tramos)
+    cargas_nudos = np.zeros((num_nudos, len(w)))
+    cargas_nudos[:-1] -= M_emp.T # Extremo izquierdo del tramo: +wL²/12
+    cargas_nudos[1:] += M_emp.T # Extremo derecho: -wL²/12
+
+    # 2) Giros de los nudos libres (se eliminan los empotrados de la banda)
+    libres = np.ones(num_nudos, dtype=bool)
+    libres[0], libres[-1] = not empotrado_inicio, not empotrado_fin
+    theta = np.zeros_like(cargas_nudos)
+    if np.any(libres):
+        banda = _matriz_banda(luces_m, EI)
+        inicio, fin = int(empotrado_inicio), num_nudos - int(empotrado_fin)
+        banda_libre = banda[:, inicio:fin].copy()
+        banda_libre[0, 0] = 0.0
+        theta[inicio:fin] = _resolver_banda(banda_libre, cargas_nudos[inicio:fin])
+
+    # 3) Momentos de extremo (pendiente-deflexión) en convención de viga
+    k = (EI / luces_m)[:, None]
+    M_ij = M_emp.T + 2.0 * k * (2.0 * theta[:-1] + theta[1:])
+    M_ji = -M_emp.T + 2.0 * k * (theta[:-1] + 2.0 * theta[1:])
+    M_izq, M_der = -M_ij.T, M_ji.T # (casos x tramos)
+    if not empotrado_inicio:
+        M_izq[:, 0] = 0.0 # Apoyo simple: elimina el residuo numérico
+    if not empotrado_fin:
+        M_der[:, -1] = 0.0
+
+    # 4) M(x) y V(x) en cada tramo: recta entre apoyos + parábola isostática
+    t = np.linspace(0.0, 1.0, puntos_por_tramo)
+    x_local = luces_m[:, None] * t # (tramos x puntos)
+    wc = w[:, :, None]
+    M = M_izq[:, :, None] * (1.0 - t) + M_der[:, :, None] * t + wc * x_local * (luces_m[:, None] - x_local) / 2.0
+    V = ((M_der - M_izq) / luces_m)[:, :, None] + wc * (luces_m[:, None] / 2.0 - x_local)
+    M_tramo = _maximo_tramo(M_izq, M_der, w, luces_m)
+    x_m = (np.concatenate([[0.0], np.cumsum(luces_m)[:-1]])[:, None] + x_local).ravel()
+
+    # Reacciones: salto del cortante en cada apoyo
+    V_ini, V_fin = V[:, :, 0], V[:, :, -1]
+    reacciones = np.zeros((len(w), num_nudos))
+    reacciones[:, :-1] += V_ini
+    reacciones[:, 1:] -= V_fin
+
+    M, V = M.reshape(len(w), -1), V.reshape(len(w), -1)
+    M_apoyos = np.concatenate([M_izq[:, :1], M_der], axis=1)
+    resultado = {
+        "status": "OK",
+        "mensaje": f"Viga continua de {num_tramos} tramos resuelta ({len(w)} casos de carga).",
+        "luces_m": luces_m,
+        "x_m": x_m,
+        "tramo": np.repeat(np.arange(num_tramos), puntos_por_tramo),
+        "M_kNm": M, "V_kN": V,
+        "M_apoyos_kNm": M_apoyos,
+        "M_tramo_max_kNm": M_tramo,
+        "reacciones_kN": reacciones,
+        "M_max_kNm": M.max(axis=0), "M_min_kNm": M.min(axis=0),
+        "V_max_kN": V.max(axis=0), "V_min_kN": V.min(axis=0),
+    }
+    if un_caso: # Sin dimensión de casos si se dio una sola carga
+        for clave in ("M_kNm", "V_kN", "M_apoyos_kNm", "M_tramo_max_kNm", "reacciones_kN"):
+            resultado[clave] = resultado[clave][0]
+    return resultado
+
+def demandas_por_tramo(analisis):
+    """
+    Momentos y cortantes de diseño de cada tramo a partir de la envolvente de
+    analizar_viga_continua, con los nombres de diseno_viga_dmo (y Mu_kNm para
+    diseno_nervio_flexion): Mu_neg_ext_kNm y Mu_neg_int_kNm son las magnitudes del momento
+    negativo en los apoyos izquierdo y derecho, Mu_pos_kNm el máximo positivo del tramo
+    (M_tramo_max_kNm) y Vu_grav_ext_kN, Vu_grav_int_kN el cortante máximo en cada apoyo.
+    Momentos y ln_m en el eje de los apoyos (sin reducción a la cara).
+    """
+    M_max, M_min = analisis["M_max_kNm"], analisis["M_min_kNm"]
+    V_abs = np.maximum(np.abs(analisis["V_max_kN"]), np.abs(analisis["V_min_kN"]))
+    num_tramos = len(analisis["luces_m"])
+    M_max, M_min, V_abs = (a.reshape(num_tramos, -1) for a in (M_max, M_min, V_abs))
+    M_tramo = np.atleast_2d(analisis["M_tramo_max_kNm"]).max(axis=0)
+    demandas = []
+    for i, L in enumerate(analisis["luces_m"]):
+        demandas.append({
+            "tramo": i,
+            "ln_m": float(L),
+            "Mu_neg_ext_kNm": float(max(0.0, -M_min[i, 0])),
+            "Mu_pos_kNm": float(max(0.0, M_tramo[i], M_max[i].max())),
+            "Mu_neg_int_kNm": float(max(0.0, -M_min[i, -1])),
+            "Vu_grav_ext_kN": float(V_abs[i, 0]),
+            "Vu_grav_int_kN": float(V_abs[i, -1]),
+        })
+    return demandas
+
+def respuestas_unitarias(luces_m, EI_relativo=1.0, empotrado_inicio=False, empotrado_fin=False,
+                         puntos_por_tramo=PUNTOS_POR_TRAMO):
+    """
+    Respuesta a 1 kN/m en cada tramo por separado (un caso por tramo, una sola factorización).
+    Cualquier combinación de cargas por tramo es w @ M_kNm (superposición).
+    """
+    num_tramos = len(np.atleast_1d(luces_m))
+    return analizar_viga_continua(luces_m, np.eye(num_tramos), EI_relativo, empotrado_inicio, empotrado_fin, puntos_por_tramo)
+
+def envolvente_carga_alternada(
+    luces_m, w_muerta_kN_m, w_viva_kN_m, factor_muerta=1.2, factor_viva=1.6,
+    EI_relativo=1.0, empotrado_inicio=False, empotrado_fin=False,
+    puntos_por_tramo=PUNTOS_POR_TRAMO, unitarias=None):
+    """
+    Envolvente de factor_muerta·D en todos los tramos + factor_viva·L en cualquier
+    subconjunto de tramos (los 2^n patrones de carga viva alternada), sin resolver cada patrón:
+    en cada punto el máximo es la respuesta a D más la suma de las contribuciones positivas
+    de L de cada tramo (y el mínimo, la de las negativas).
+    unitarias: resultado de respuestas_unitarias para reutilizar la factorización entre
+    combinaciones o cargas de la misma viga.
+    Retorna las mismas claves de envolvente que analizar_viga_continua (sirve para
+    demandas_por_tramo) y patron_tramo_max: tramos cargados con L que gobiernan el máximo
+    positivo de cada tramo (fila i para el tramo i), el del punto muestreado con mayor momento
+    de la envolvente. M_tramo_max_kNm es el máximo de ese patrón entre muestras (o el de la
+    envolvente muestreada, si es mayor): coincide con el máximo sobre los 2^n patrones salvo
+    por la resolución de puntos_por_tramo.
+    """
+    if unitarias is None:
+        unitarias = respuestas_unitarias(luces_m, EI_relativo, empotrado_inicio, empotrado_fin, puntos_por_tramo)
+    if unitarias.get("status") != "OK":
+        return unitarias
+    luces_m = unitarias["luces_m"]
+    num_tramos = len(luces_m)
+    wD = factor_muerta * np.broadcast_to(np.asarray(w_muerta_kN_m, dtype=float), luces_m.shape)
+    wL = factor_viva * np.broadcast_to(np.asarray(w_viva_kN_m, dtype=float), luces_m.shape)
+    if np.any(wL < 0):
+        return {"status": "Error", "mensaje": "La carga viva debe ser no negativa en todos los tramos."}
+
+    resultado = {"status": "OK", "luces_m": luces_m, "x_m": unitarias["x_m"], "tramo": unitarias["tramo"]}
+    for clave, clave_max, clave_min in (("M_kNm", "M_max_kNm", "M_min_kNm"), ("V_kN", "V_max_kN", "V_min_kN")):
+        unitaria = unitarias[clave] # (tramos x puntos)
+        aporte_viva = wL[:, None] * unitaria
+        base = wD @ unitaria
+        resultado[clave_max] = base + np.maximum(aporte_viva, 0.0).sum(axis=0)
+        resultado[clave_min] = base + np.minimum(aporte_viva, 0.0).sum(axis=0)
+
+    # Máximo positivo de cada tramo: patrón que maximiza el momento en el punto de la envolvente
+    # muestreada con mayor momento del tramo, y máximo (donde V = 0) de ese patrón, que puede
+    # caer entre muestras. El patrón de otro punto del tramo podría dar un poco más entre
+    # muestras: se toma además el máximo muestreado, que la envolvente garantiza.
+    puntos = len(unitarias["x_m"]) // num_tramos
+    M_max_tramos = resultado["M_max_kNm"].reshape(num_tramos, puntos)
+    idx = np.arange(num_tramos)
+    gobernantes = idx * puntos + np.argmax(M_max_tramos, axis=1)
+    patrones = (wL[:, None] * unitarias["M_kNm"][:, gobernantes]).T > 0 # (tramo evaluado x tramo cargado)
+    w_patron = wD + patrones * wL
+    M_apoyos = w_patron @ unitarias["M_apoyos_kNm"]
+    M_patron = _maximo_tramo(M_apoyos[idx, idx], M_apoyos[idx, idx + 1], w_patron[idx, idx], luces_m)
+    resultado["M_tramo_max_kNm"] = np.maximum(M_patron, M_max_tramos.max(axis=1))
+    resultado["patron_tramo_max"] = patrones
+    resultado["mensaje"] = f"Envolvente de {2**num_tramos} patrones de carga viva por superposición de {num_tramos} respuestas unitarias."
+    return resultado